@@ -0,0 +1,61 @@
+"""
+Compares the drawing time of the 'seaborn' and 'native' engines of the simple plot types.
+
+Usage:
+    python benchmarks/engines.py [--rows 100000] [--repeat 5]
+
+"""
+import argparse
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import sciviz as sv
+
+CASES = {
+    'bar': dict(x='group', y='value', color='hue'),
+    'histogram': dict(x='value', color='hue'),
+    'point': dict(x='value', y='other', color='hue'),
+    'line': dict(x='step', y='value', color='hue'),
+}
+
+
+def make_data(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'group': rng.choice(['a', 'b', 'c', 'd', 'e'], rows),
+        'hue': rng.choice(['u', 'v', 'w'], rows),
+        'step': rng.integers(0, 50, rows),
+        'value': rng.normal(size=rows),
+        'other': rng.normal(size=rows)
+    })
+
+
+def time_plot(plot, data, engine, repeat, **kwargs):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ax = getattr(sv, plot)(data, engine=engine, **kwargs)
+        ax.figure.canvas.draw()
+        times.append(time.perf_counter() - start)
+        plt.close(ax.figure)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    data = make_data(args.rows)
+    print(f'{"plot":<10} {"seaborn (s)":>12} {"native (s)":>12} {"speedup":>8}')
+    for plot, kwargs in CASES.items():
+        seaborn_time = time_plot(plot, data, 'seaborn', args.repeat, **kwargs)
+        native_time = time_plot(plot, data, 'native', args.repeat, **kwargs)
+        print(f'{plot:<10} {seaborn_time:>12.3f} {native_time:>12.3f} {seaborn_time / native_time:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
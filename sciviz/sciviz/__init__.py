@@ -1,15 +1,32 @@
+from .src import aio
+
 from .src.bar import (
+    ErrorParameters,
     error_parameters,
     bar
 )
 
 from .src.boxplot import (
+    OutlierParameters,
     outlier_parameters,
+    JitterParameters,
     jitter_parameters,
     boxplot
 )
 
+from .src.export import (
+    render_array,
+    render_arrays,
+    save_png,
+    save_svg
+)
+
+from .src.facet import (
+    facet
+)
+
 from .src.heatmap import (
+    TickParameters,
     tick_parameters,
     heatmap
 )
@@ -19,12 +36,15 @@ from .src.histogram import (
 )
 
 from .src.jitter import (
+    CrossbarParameters,
     crossbar_parameters,
     jitter
 )
 
 from .src.legends import (
-    legend_parameters
+    LegendParameters,
+    legend_parameters,
+    legend_pages
 )
 
 from .src.line import (
@@ -32,7 +52,9 @@ from .src.line import (
 )
 
 from .src.pie import (
+    LabelParameters,
     label_parameters,
+    TextParameters,
     text_parameters,
     pie
 )
@@ -41,6 +63,32 @@ from .src.point import (
     point
 )
 
+from .src.report import (
+    pdf_report,
+    sprite_report
+)
+
+from .src.render import (
+    render,
+    render_bytes
+)
+
+from .src.sciplot import (
+    SciPlot
+)
+
+from .src.shared import (
+    SharedData,
+    share_data
+)
+
+from .src.specs import (
+    plot_spec,
+    dumps_spec,
+    loads_spec,
+    resolve_data
+)
+
 from .src.theme import (
     theme
 )
@@ -50,6 +98,7 @@ from .src.venn import (
 )
 
 from .src.violin import (
+    BoxParameters,
     box_parameters,
     violin
 )
\ No newline at end of file
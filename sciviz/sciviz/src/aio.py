@@ -0,0 +1,231 @@
+import asyncio
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+import matplotlib
+from .render import render_bytes
+
+PYPLOT_LOCK = threading.Lock()  # pyplot's global figure manager is not thread-safe
+
+
+def worker_init():
+    """
+    Configures a rendering worker to use the non-interactive Agg backend.
+
+    """
+    matplotlib.use('Agg')
+
+
+def render_locked(plot, **kwargs):
+    """
+    Renders a plot in a worker thread, one thread at a time, since pyplot keeps its figures in a global, non thread-safe manager.
+
+    Args:
+        plot (str or function): The name of the plot function (e.g. 'bar'), or the function itself.
+        **kwargs: The arguments passed to render_bytes (e.g. format, data, x, y).
+
+    Returns:
+        bytes: The encoded image.
+
+    """
+    with PYPLOT_LOCK:
+        return render_bytes(plot, **kwargs)
+
+
+def wake(waiter):
+    """
+    Resolves the future of a call waiting for a slot, unless the call was cancelled meanwhile.
+
+    Args:
+        waiter (asyncio.Future): The future awaited by the call.
+
+    """
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class Slots:
+    """
+    Bounds the number of plots in flight across threads and event loops, handing the slots over to the waiting calls in order.
+
+    Args:
+        size (int): The maximum number of plots in flight.
+
+    Notes:
+        Unlike asyncio.Semaphore, the slots are not bound to one event loop, and can be released from a worker thread after the loop of the call is closed.
+
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.used = 0
+        self.waiters = deque()
+        self.lock = threading.Lock()
+
+    def locked(self):
+        """
+        Returns whether all the slots are in use.
+
+        """
+        with self.lock:
+            return self.used >= self.size
+
+    async def acquire(self):
+        """
+        Waits for a free slot and takes it.
+
+        """
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            if self.used < self.size and not self.waiters:
+                self.used += 1
+                return
+            waiter = loop.create_future()
+            self.waiters.append((loop, waiter))
+        try:
+            await waiter
+        except BaseException:
+            with self.lock:
+                # a waiter no longer queued has been handed a slot, which must be passed on
+                granted = (loop, waiter) not in self.waiters
+                if not granted:
+                    self.waiters.remove((loop, waiter))
+            if granted:
+                self.release()
+            raise
+
+    def release(self):
+        """
+        Frees a slot, or hands it over to the first waiting call whose event loop is still open. Safe to call from any thread.
+
+        """
+        with self.lock:
+            while self.waiters:
+                loop, waiter = self.waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(wake, waiter)
+                    return
+                except RuntimeError:  # the event loop of the waiting call is closed
+                    continue
+            self.used -= 1
+
+
+class Renderer:
+    """
+    Renders sciviz plots asynchronously in a bounded pool of workers, without blocking the event loop.
+
+    Args:
+        max_workers (int, optional): The number of workers. Defaults to the number of CPUs.
+        max_pending (int, optional): The maximum number of plots queued or being rendered. Further calls wait for a free slot (backpressure). Defaults to twice the number of workers.
+        executor (str, optional): The type of workers, 'process' or 'thread'. Processes are isolated from each other, threads avoid pickling the data but switch the whole process to the Agg backend, and draw one plot at a time since pyplot is not thread-safe. Defaults to 'process'.
+
+    Notes:
+        Use the renderer as an async context manager (async with Renderer() as renderer: ...) or call shutdown() when done.
+
+    """
+
+    def __init__(self, max_workers=None, max_pending=None, executor='process'):
+        if executor not in ['process', 'thread']:
+            raise ValueError("Invalid executor option. Please choose from 'process' or 'thread'.")
+        self.max_workers = max_workers if max_workers else (os.cpu_count() or 1)
+        self.max_pending = max_pending if max_pending else 2 * self.max_workers
+        if executor == 'process':
+            # spawned workers do not inherit the locks of the threads running in the event loop process
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=get_context('spawn'), initializer=worker_init)
+        else:
+            worker_init()
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.job = render_bytes if executor == 'process' else render_locked
+        self.slots = Slots(self.max_pending)
+
+    async def render(self, plot, format='png', dpi=100, timeout=None, **kwargs):
+        """
+        Renders a plot in a worker and returns it encoded as an image.
+
+        Args:
+            plot (str or function): The name of the plot function (e.g. 'bar'), or the function itself.
+            format (str, optional): The image format (e.g. 'png', 'svg' or 'pdf'). Defaults to 'png'.
+            dpi (int, optional): The resolution of the image. Defaults to 100.
+            timeout (float, optional): The maximum number of seconds to wait for the image, including the time spent waiting for a free slot. Defaults to None.
+            **kwargs: The arguments passed to the plot function (e.g. data, x, y).
+
+        Returns:
+            bytes: The encoded image.
+
+        Raises:
+            asyncio.TimeoutError: If the image is not ready within the timeout.
+
+        Notes:
+            When the call is cancelled or times out, a plot that has not started yet is dropped from the queue. A plot already being rendered runs to completion in its worker and its result is discarded.
+            Its slot is only freed once the worker is done, so that max_pending bounds the plots actually in flight.
+
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        await asyncio.wait_for(self.slots.acquire(), timeout)
+        try:
+            future = self.executor.submit(partial(self.job, plot, format=format, dpi=dpi, **kwargs))
+        except BaseException:
+            self.slots.release()
+            raise
+        # called from the worker thread (or on cancellation) when the plot is done or dropped, even if the event loop is closed by then
+        future.add_done_callback(lambda _: self.slots.release())
+        # cancelling the wrapped future also drops the plot from the queue if it has not started yet
+        return await asyncio.wait_for(asyncio.wrap_future(future), None if deadline is None else max(deadline - loop.time(), 0))
+
+    def shutdown(self, wait=True):
+        """
+        Shuts the workers down and cancels the plots that have not started yet.
+
+        Args:
+            wait (bool, optional): Whether to wait for the plots being rendered to finish. Defaults to True.
+
+        """
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.shutdown(wait=False)
+
+
+default_renderer = None
+
+
+async def render(plot, format='png', dpi=100, timeout=None, **kwargs):
+    """
+    Renders a plot asynchronously with the default renderer, created on first use with the default pool size.
+
+    Args:
+        plot (str or function): The name of the plot function (e.g. 'bar'), or the function itself.
+        format (str, optional): The image format (e.g. 'png', 'svg' or 'pdf'). Defaults to 'png'.
+        dpi (int, optional): The resolution of the image. Defaults to 100.
+        timeout (float, optional): The maximum number of seconds to wait for the image. Defaults to None.
+        **kwargs: The arguments passed to the plot function (e.g. data, x, y).
+
+    Returns:
+        bytes: The encoded image.
+
+    """
+    global default_renderer
+    if default_renderer is None:
+        default_renderer = Renderer()
+    return await default_renderer.render(plot, format=format, dpi=dpi, timeout=timeout, **kwargs)
+
+
+def shutdown(wait=True):
+    """
+    Shuts the default renderer down.
+
+    Args:
+        wait (bool, optional): Whether to wait for the plots being rendered to finish. Defaults to True.
+
+    """
+    global default_renderer
+    if default_renderer is not None:
+        default_renderer.shutdown(wait=wait)
+        default_renderer = None
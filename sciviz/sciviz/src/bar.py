@@ -1,13 +1,32 @@
+from dataclasses import dataclass, field
 import matplotlib.pyplot as plt
 import seaborn as sns
-from .misc_utils import alpha_fill, edgecolor_pal
+from .bootstrap import resolve_errorbar
+from .misc_utils import alpha_fill, edgecolor_pal, variable_values
 from .palettes import color_seq_palette
 from .legends import legend_create, legend_parameters
+from .native import check_engine, native_bar
+from .specs import ParameterSpec
 
 
-def error_parameters(errorbar=('ci', 95), color_pal=['black'], linestyle='-', linewidth=1, capsize=0.2):
+@dataclass(frozen=True, slots=True, eq=False)
+class ErrorParameters(ParameterSpec):
     """
-    Returns a dictionary containing error plot parameters.
+    The parameters of the error bars, as returned by error_parameters(). See error_parameters() for their description.
+
+    """
+    errorbar: tuple = ('ci', 95)
+    color_pal: list = field(default_factory=lambda: ['black'])
+    linestyle: str = '-'
+    linewidth: float = 1
+    capsize: float = 0.2
+    n_boot: int = 1000
+    seed: int = 0
+
+
+def error_parameters(errorbar=('ci', 95), color_pal=['black'], linestyle='-', linewidth=1, capsize=0.2, n_boot=1000, seed=0):
+    """
+    Returns the error plot parameters.
 
     Args:
         errorbar (tuple): Type of error bars. Default is ('ci', 95).
@@ -15,30 +34,33 @@ def error_parameters(errorbar=('ci', 95), color_pal=['black'], linestyle='-', li
         linestyle (str): The line style for error bars. Default is '-'.
         linewidth (float): The line width for error bars. Default is 1.
         capsize (float): The length of the error bar caps. Default is 0.2.
+        n_boot (int): The number of bootstrap resamples for 'ci' error bars. Default is 1000.
+        seed (int): The seed of the bootstrap, so that 'ci' error bars are identical across renders. Default is 0.
 
     Returns:
-        dict: A dictionary containing the error plot parameters.
+        ErrorParameters: The parameters of the error bars, which can also be read as a dictionary.
 
     """
-    error_params = {
-        'errorbar': errorbar,
-        'color_pal': color_pal, 
-        'linestyle': linestyle, 
-        'linewidth': linewidth,
-        'capsize': capsize,  
-    }
-    return error_params
+    return ErrorParameters(
+        errorbar=errorbar,
+        color_pal=color_pal,
+        linestyle=linestyle,
+        linewidth=linewidth,
+        capsize=capsize,
+        n_boot=n_boot,
+        seed=seed
+    )
 
 
-def bar(data, x, y, color=None, order=None, stat='mean', color_pal=None, color_order=None, fill=True, orient='v', width=0.4, edgecolor='black', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), errorbar=None):
+def bar(data, x, y, color=None, order=None, stat='mean', color_pal=None, color_order=None, fill=True, orient='v', width=0.4, edgecolor='black', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), errorbar=None, ax=None, engine='seaborn'):
     """
     Create a bar plot.
 
     Args:
-        data (pandas.DataFrame): The input data.
-        x (str): The column name for the x-axis.
-        y (str): The column name for the y-axis. 
-        color (str, optional): The column name for the color encoding. Defaults to None.
+        data (pandas.DataFrame): The input data. Can be None if the variables are given as arrays.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves. 
+        color (str or array-like, optional): The column name for the color encoding, or the values themselves. Defaults to None.
         order (list, optional): The order of the x-axis categories. Defaults to None.
         stat (str, optional): The statistical function to compute for each category. Defaults to 'mean'. Examples of possible values are 'mean', 'median', 'count', 'sum', 'min', 'max', 'std', etc. 
         color_pal (list, optional): The color palette for the color encoding. Defaults to None.
@@ -50,13 +72,16 @@ def bar(data, x, y, color=None, order=None, stat='mean', color_pal=None, color_o
         alpha (float, optional): The transparency of the bars. Defaults to 0.8.
         legend (dict, optional): The legend parameters. Defaults to legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11).
         errorbar (dict, optional): The errorbar parameters. Defaults to None.
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+        engine (str, optional): The drawing engine, 'seaborn' or 'native'. The native engine draws directly with matplotlib from the resolved sciviz palettes; plots with errorbars are always drawn by seaborn. Defaults to 'seaborn'.
 
     Returns:
         AxesSubplot: The matplotlib AxesSubplot object.
 
     """
-    if color:
-        color_pal = color_seq_palette(color_val=data[color], users_palette=color_pal)
+    check_engine(engine)
+    if color is not None:
+        color_pal = color_seq_palette(color_val=variable_values(data, color), users_palette=color_pal, order=color_order)
     
     if errorbar:
         error_type = errorbar['errorbar']
@@ -64,28 +89,34 @@ def bar(data, x, y, color=None, order=None, stat='mean', color_pal=None, color_o
         error_line = errorbar['linestyle']
         error_width = errorbar['linewidth']
         error_cap = errorbar['capsize']
+        value, category = (y, x) if orient == 'v' else (x, y)
+        error_type = resolve_errorbar(error_type, data, value, [category, color], stat, n_boot=errorbar.get('n_boot', 1000), seed=errorbar.get('seed', 0))
     
-    fig, ax = plt.subplots(figsize=(6, 6))
-    sns.barplot(
-        data=data, 
-        x=x, 
-        y=y, 
-        hue=color, 
-        order=order, 
-        hue_order=color_order, 
-        estimator=stat, 
-        errorbar = error_type if errorbar else None,
-        orient=orient, 
-        palette=color_pal, 
-        fill=fill, 
-        width=width, 
-        dodge='auto', 
-        edgecolor=edgecolor, 
-        linewidth=1, 
-        capsize=error_cap if errorbar else 0,
-        err_kws={'color': error_pal[0], 'linestyle': error_line, 'linewidth': error_width, 'alpha': 1} if errorbar else None,
-        ax=ax
-    )  
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
+    if engine == 'native' and not errorbar:
+        ax = native_bar(ax, data, x, y, color, order, color_order, stat, color_pal, orient, width, fill, edgecolor)
+    else:
+        sns.barplot(
+            data=data, 
+            x=x, 
+            y=y, 
+            hue=color, 
+            order=order, 
+            hue_order=color_order, 
+            estimator=stat, 
+            errorbar = error_type if errorbar else None,
+            orient=orient, 
+            palette=color_pal, 
+            fill=fill, 
+            width=width, 
+            dodge='auto', 
+            edgecolor=edgecolor, 
+            linewidth=1, 
+            capsize=error_cap if errorbar else 0,
+            err_kws={'color': error_pal[0], 'linestyle': error_line, 'linewidth': error_width, 'alpha': 1} if errorbar else None,
+            ax=ax
+        )  
 
 
     if legend:
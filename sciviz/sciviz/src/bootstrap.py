@@ -0,0 +1,136 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from pandas import Series
+from .misc_utils import same_variable, variable_values
+
+BOOTSTRAP_CACHE = OrderedDict()
+BOOTSTRAP_CACHE_SIZE = 10000
+BOOTSTRAP_BLOCK_SIZE = 2 ** 24  # maximum number of resampled values held in memory at once
+
+
+def fingerprint(values):
+    """
+    Computes a fingerprint of the values of a group, used to memoize its bootstrap interval.
+
+    Args:
+        values (numpy.ndarray): The values of the group.
+
+    Returns:
+        str: A hex digest identifying the values.
+
+    """
+    values = np.ascontiguousarray(values, dtype=float)
+    return hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+
+def bootstrap_intervals(groups, estimator='mean', level=95, n_boot=1000, seed=0):
+    """
+    Computes the bootstrap confidence intervals of several groups at once, resampling all of them with a single fancy indexing per block of resamples.
+
+    Args:
+        groups (list): A list of numpy arrays, one per group.
+        estimator (str): The name of the numpy function estimating the statistic (e.g. 'mean', 'median', 'sum'). Defaults to 'mean'.
+        level (float): The confidence level in percent. Defaults to 95.
+        n_boot (int): The number of resamples. Defaults to 1000.
+        seed (int): The seed of the random generator. Defaults to 0.
+
+    Returns:
+        list: A list of (min, max) tuples, one per group.
+
+    Notes:
+        Every group is resampled by its own generator, seeded from seed and the fingerprint of the group, so the interval of a group does not depend on the other groups.
+        Intervals are memoized per (fingerprint, estimator, level, n_boot, seed), so re-rendering a plot does not repeat the bootstrap.
+
+    """
+    keys = [(fingerprint(values), estimator, level, n_boot, seed) for values in groups]
+    missing = [i for i, key in enumerate(keys) if key not in BOOTSTRAP_CACHE and len(groups[i]) > 1]
+    if missing:
+        values = [np.asarray(groups[i], dtype=float) for i in missing]
+        sizes = np.array([len(group) for group in values])
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        pooled = np.concatenate(values)
+        generators = [np.random.default_rng([seed, int(keys[i][0], 16)]) for i in missing]
+        func = getattr(np, estimator)
+        boots = np.empty((len(missing), n_boot))
+        block = max(1, BOOTSTRAP_BLOCK_SIZE // len(pooled))
+        for first in range(0, n_boot, block):
+            size = min(block, n_boot - first)
+            index = np.concatenate([rng.integers(0, n, size=(size, n)) + start for rng, n, start in zip(generators, sizes, starts)], axis=1)
+            resamples = pooled[index]
+            if estimator in ['mean', 'sum']:
+                sums = np.add.reduceat(resamples, starts, axis=1)
+                boots[:, first:first + size] = (sums / sizes if estimator == 'mean' else sums).T
+            else:
+                for j, (start, n) in enumerate(zip(starts, sizes)):
+                    boots[j, first:first + size] = func(resamples[:, start:start + n], axis=1)
+        lower, upper = np.percentile(boots, [50 - level / 2, 50 + level / 2], axis=1)
+        for j, i in enumerate(missing):
+            BOOTSTRAP_CACHE[keys[i]] = (lower[j], upper[j])
+        while len(BOOTSTRAP_CACHE) > BOOTSTRAP_CACHE_SIZE:
+            BOOTSTRAP_CACHE.popitem(last=False)
+    return [BOOTSTRAP_CACHE.get(key, (np.nan, np.nan)) for key in keys]
+
+
+def bootstrap_errorbar(data, y, groups, estimator='mean', level=95, n_boot=1000, seed=0):
+    """
+    Precomputes the bootstrap confidence intervals of all groups of a plot and returns an errorbar function that seaborn can use in place of its own bootstrap.
+
+    Args:
+        data (pandas.DataFrame or None): The input data. Can be None if the variables are given as arrays.
+        y (str or array-like): The column name of the values, or the values themselves.
+        groups (list): The column names (or arrays) defining the groups (e.g. [x, color]).
+        estimator (str): The name of the numpy function estimating the statistic. Defaults to 'mean'.
+        level (float): The confidence level in percent. Defaults to 95.
+        n_boot (int): The number of resamples. Defaults to 1000.
+        seed (int): The seed of the random generator. Defaults to 0.
+
+    Returns:
+        function: A function mapping the values of a group to its (min, max) interval.
+
+    """
+    keys = []
+    for group in groups:
+        if group is not None and not same_variable(group, y) and not any(same_variable(group, key) for key in keys):
+            keys.append(group)
+    values = variable_values(data, y)
+    keys = [variable_values(data, key) for key in keys]
+    valid = values.notna().to_numpy()
+    for key in keys:
+        valid = valid & key.notna().to_numpy()
+    values = Series(values.to_numpy(dtype=float)[valid])
+    keys = [key.to_numpy()[valid] for key in keys]
+    subsets = [subset.to_numpy() for _, subset in values.groupby(keys, sort=False, observed=True)] if keys else [values.to_numpy()]
+    bootstrap_intervals(subsets, estimator=estimator, level=level, n_boot=n_boot, seed=seed)
+
+    def errorbar(vals):
+        return bootstrap_intervals([vals.to_numpy(dtype=float)], estimator=estimator, level=level, n_boot=n_boot, seed=seed)[0]
+    return errorbar
+
+
+def resolve_errorbar(errorbar, data, y, groups, estimator, n_boot=1000, seed=0):
+    """
+    Replaces a bootstrap errorbar ('ci' or ('ci', level)) by the shared, memoized bootstrap engine. Other errorbars are returned unchanged.
+
+    Args:
+        errorbar (str, tuple or None): The errorbar passed to seaborn.
+        data (pandas.DataFrame or None): The input data. Can be None if the variables are given as arrays.
+        y (str or array-like): The column name of the values, or the values themselves.
+        groups (list): The column names (or arrays) defining the groups (e.g. [x, color]).
+        estimator (str): The statistic of the plot. Only numpy function names (e.g. 'mean', 'median') use the shared engine.
+        n_boot (int): The number of resamples. Defaults to 1000.
+        seed (int): The seed of the random generator. Defaults to 0.
+
+    Returns:
+        str, tuple, function or None: The errorbar to pass to seaborn.
+
+    """
+    if errorbar == 'ci':
+        level = 95
+    elif type(errorbar) in [tuple, list] and errorbar[0] == 'ci':
+        level = errorbar[1]
+    else:
+        return errorbar
+    if type(estimator) != str or not hasattr(np, estimator):
+        return errorbar
+    return bootstrap_errorbar(data, y, groups, estimator=estimator, level=level, n_boot=n_boot, seed=seed)
\ No newline at end of file
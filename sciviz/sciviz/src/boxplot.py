@@ -1,13 +1,26 @@
+from dataclasses import dataclass
 import matplotlib.pyplot as plt
 import seaborn as sns
-from .misc_utils import alpha_fill
+from .misc_utils import alpha_fill, rasterize_artists, same_variable, variable_values
 from .palettes import color_seq_palette
 from .legends import legend_create, legend_parameters
+from .specs import ParameterSpec
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class OutlierParameters(ParameterSpec):
+    """
+    The parameters of the outliers of a box plot, as returned by outlier_parameters(). See outlier_parameters() for their description.
+
+    """
+    color: str = 'black'
+    shape: str = 'o'
+    size: float = 5
 
 
 def outlier_parameters(color='black', shape='o', size=5):
     """
-    Returns a dictionary of parameters for plotting outliers.
+    Returns the parameters for plotting outliers.
 
     Args:
         color (str, optional): The color of the outliers. Defaults to 'black'.
@@ -15,20 +28,32 @@ def outlier_parameters(color='black', shape='o', size=5):
         size (int, optional): The size of the outliers. Defaults to 5.
 
     Returns:
-        dict: A dictionary containing the outlier parameters.
+        OutlierParameters: The parameters of the outliers, which can also be read as a dictionary.
 
     """
-    outlier_params = {
-        'color': color,
-        'shape': shape,  
-        'size': size
-    }
-    return outlier_params
+    return OutlierParameters(
+        color=color,
+        shape=shape,
+        size=size
+    )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class JitterParameters(ParameterSpec):
+    """
+    The parameters of the points overlaid on a box plot, as returned by jitter_parameters(). See jitter_parameters() for their description.
+
+    """
+    jitter: float = 0.1
+    color_pal: list = None
+    size: float = 50
+    alpha: float = 0.8
+    pos: str = 'front'
 
 
 def jitter_parameters(jitter=0.1, color_pal=None, size=50, alpha=0.8, pos='front'):
     """
-    Returns a dictionary of jitter plot parameters.
+    Returns the jitter plot parameters.
 
     Args:
         jitter (float, optional): The amount of jitter to apply. Defaults to 0.1.
@@ -38,28 +63,27 @@ def jitter_parameters(jitter=0.1, color_pal=None, size=50, alpha=0.8, pos='front
         pos (float, optional): The position of the jitter points. Defaults to 'front'.
 
     Returns:
-        dict: A dictionary containing the jitter plot parameters.
+        JitterParameters: The parameters of the jitter points, which can also be read as a dictionary.
 
     """
-    jitter_params = {
-        'jitter': jitter,
-        'color_pal': color_pal, 
-        'size': size,
-        'alpha': alpha,
-        'pos': pos
-    }
-    return jitter_params
+    return JitterParameters(
+        jitter=jitter,
+        color_pal=color_pal,
+        size=size,
+        alpha=alpha,
+        pos=pos
+    )
 
 
-def boxplot(data, x, y, color=None, order=None, outliers=outlier_parameters(color='black', shape='o', size=4), caps=False, color_pal=None, color_order=None, fill=True, orient='v', width=0.4, edgecolor='black', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), jitter=None):
+def boxplot(data, x, y, color=None, order=None, outliers=outlier_parameters(color='black', shape='o', size=4), caps=False, color_pal=None, color_order=None, fill=True, orient='v', width=0.4, edgecolor='black', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), jitter=None, ax=None, rasterize_layers=False):
     """
     Creates a box plot with optional overlaying data points.
 
     Args:
-        data (DataFrame): The input data.
-        x (str): The column name for the x-axis variable.
-        y (str): The column name for the y-axis variable.
-        color (str, optional): The column name for the color variable. Defaults to None.
+        data (DataFrame): The input data. Can be None if the variables are given as arrays.
+        x (str or array-like): The column name for the x-axis variable, or the values themselves.
+        y (str or array-like): The column name for the y-axis variable, or the values themselves.
+        color (str or array-like, optional): The column name for the color variable, or the values themselves. Defaults to None.
         order (list, optional): The order of the categories on the x-axis. Defaults to None.
         outliers (dict, optional): The parameters for the outliers. Defaults to outlier_parameters(color='black', shape='o', size=5).
         caps (bool, optional): Whether to show caps. Defaults to False.
@@ -72,17 +96,19 @@ def boxplot(data, x, y, color=None, order=None, outliers=outlier_parameters(colo
         alpha (float, optional): The transparency of the boxes. Defaults to 0.8.
         legend (legend_parameters, optional): The legend parameters. Defaults to legend_parameters().
         jitter (jitter_parameters, optional): The jitter parameters. Defaults to None.
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+        rasterize_layers (bool, optional): Whether to rasterize the jittered points and the outliers in vector outputs (PDF, SVG), at the resolution passed to savefig, keeping axes, text and legends as vectors. Defaults to False.
 
     Returns:
         AxesSubplot: The matplotlib AxesSubplot object.
 
     """
-    if color_pal is not None and color == None:
+    if color_pal is not None and color is None:
         single_color = color_pal[0]
     else:
         single_color = None
-    if color:
-        color_pal = color_seq_palette(color_val=data[color], users_palette=color_pal)
+    if color is not None:
+        color_pal = color_seq_palette(color_val=variable_values(data, color), users_palette=color_pal, order=color_order)
 
     if fill == False and edgecolor != None:
         color_pal = [edgecolor]
@@ -92,7 +118,9 @@ def boxplot(data, x, y, color=None, order=None, outliers=outlier_parameters(colo
         outliers_shape = outliers['shape']
         outliers_size = outliers['size']
 
-    fig, ax = plt.subplots(figsize=(6, 6))
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
+    layers = (len(ax.collections), len(ax.lines))
     sns.boxplot(
         data=data, 
         x=x, 
@@ -126,7 +154,7 @@ def boxplot(data, x, y, color=None, order=None, outliers=outlier_parameters(colo
             order=order, 
             hue_order=color_order, 
             jitter=jitter['jitter'], 
-            dodge=False if x == color else (False if y == color else True), 
+            dodge=False if same_variable(x, color) else (False if same_variable(y, color) else True), 
             orient=orient, 
             color=single_color if single_color else '#2271B5', 
             palette=jitter['color_pal'] if jitter['color_pal'] else color_pal, 
@@ -136,6 +164,9 @@ def boxplot(data, x, y, color=None, order=None, outliers=outlier_parameters(colo
             ax=ax
         )
 
+    if rasterize_layers:
+        ax = rasterize_artists(ax, *layers)
+
     if legend:
         ax = legend_create(
             ax=ax,
@@ -0,0 +1,302 @@
+from io import BytesIO
+from types import MethodType
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_hex
+from matplotlib.path import Path
+from PIL import Image
+from .misc_utils import figure_of
+
+
+def svg_number(value, precision):
+    """
+    Formats a coordinate for SVG output, without trailing zeros.
+
+    Args:
+        value (float): The coordinate.
+        precision (int): The number of decimals.
+
+    Returns:
+        str: The formatted coordinate.
+
+    """
+    text = f'{value:.{precision}f}'
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def svg_path_data(path, transform, precision):
+    """
+    Converts a marker path to SVG path data, in SVG coordinates (y pointing down).
+
+    Args:
+        path (matplotlib.path.Path): The marker path.
+        transform (numpy.ndarray): The 3x3 affine matrix scaling the marker to its size in points.
+        precision (int): The number of decimals of the coordinates.
+
+    Returns:
+        str: The path data (the d attribute of an SVG path).
+
+    """
+    commands = {Path.MOVETO: 'M', Path.LINETO: 'L', Path.CURVE3: 'Q', Path.CURVE4: 'C'}
+    matrix = np.diag([1.0, -1.0, 1.0]) @ transform
+    data = []
+    for vertices, code in path.iter_segments(simplify=False, curves=True):
+        if code == Path.CLOSEPOLY:
+            data.append('z')
+            continue
+        points = np.column_stack([vertices.reshape(-1, 2), np.ones(len(vertices) // 2)]) @ matrix.T
+        data.append(commands[code] + ' '.join(f'{svg_number(x, precision)} {svg_number(y, precision)}' for x, y, _ in points))
+    return ' '.join(data)
+
+
+def svg_colors(colors, n, prefix):
+    """
+    Returns the SVG paint attributes (color and opacity) of every marker of a collection.
+
+    Args:
+        colors (numpy.ndarray): The RGBA colors of the collection, cycled over the markers.
+        n (int): The number of markers.
+        prefix (str): The paint, 'fill' or 'stroke'.
+
+    Returns:
+        list: The attributes of every marker, as tuples of (name, value) pairs.
+
+    """
+    if len(colors) == 0:
+        return [((prefix, 'none'),)] * n
+    styles = [((prefix, to_hex(color)),) + (((f'{prefix}-opacity', svg_number(color[3], 3)),) if color[3] < 1 else ()) for color in colors]
+    return [styles[i % len(styles)] for i in range(n)]
+
+
+def draw_symbols(collection, renderer, name, precision, draw):
+    """
+    Draws the markers of a scatter or strip plot into an SVG file, as one symbol per marker shape and size, referenced by a use element per marker.
+
+    Args:
+        collection (matplotlib.collections.PathCollection): The markers.
+        renderer (matplotlib.backend_bases.RendererBase): The renderer of the figure.
+        name (str): The prefix of the ids of the symbols, unique within the file.
+        precision (int): The number of decimals of the coordinates.
+        draw (function): The original draw method of the collection, used for other renderers and for rasterized collections.
+
+    """
+    writer = getattr(renderer, 'writer', None)
+    if writer is None or not collection.get_visible() or collection.get_rasterized() or not collection.get_transform().is_affine or collection.get_transform().get_matrix().tolist() != np.eye(3).tolist():
+        return draw(renderer)
+    collection.set_sizes(collection.get_sizes(), collection.figure.dpi)
+    collection.update_scalarmappable()
+    offsets = collection.get_offset_transform().transform(np.asarray(collection.get_offsets(), dtype=float))
+    keep = np.isfinite(offsets).all(axis=1)
+    paths = collection.get_paths()
+    transforms = collection.get_transforms()
+    if len(transforms) == 0:
+        transforms = np.eye(3)[None]
+    n = len(offsets)
+    fills = svg_colors(collection.get_facecolor(), n, 'fill')
+    strokes = svg_colors(collection.get_edgecolor(), n, 'stroke')
+    linewidths = collection.get_linewidths()
+    markers = [fills[i] + strokes[i] + (('stroke-width', svg_number(linewidths[i % len(linewidths)], precision)),) for i in range(n)]
+
+    writer.start('g', attrib={'id': collection.get_gid() or name})
+    writer.start('defs')
+    symbols = {}  # symbol of every (path, transform) pair
+    ids = {}  # symbol of every path data, so that identical markers share their symbol
+    for i in range(n):
+        key = (i % len(paths), i % len(transforms))
+        if key not in symbols:
+            data = svg_path_data(paths[key[0]], transforms[key[1]], precision)
+            if data not in ids:
+                ids[data] = f'{name}s{len(ids)}'
+                writer.start('symbol', attrib={'id': ids[data], 'style': 'overflow: visible'})
+                writer.element('path', attrib={'d': data})
+                writer.end('symbol')
+            symbols[key] = ids[data]
+    refs = [symbols[(i % len(paths), i % len(transforms))] for i in range(n)]
+    clip = collection.get_clip_box() if collection.get_clip_on() else None
+    if clip is not None:
+        writer.start('clipPath', attrib={'id': f'{name}c'})
+        writer.element('rect', attrib={
+            'x': svg_number(clip.x0, precision),
+            'y': svg_number(renderer.height - clip.y1, precision),
+            'width': svg_number(clip.width, precision),
+            'height': svg_number(clip.height, precision)
+        })
+        writer.end('clipPath')
+    writer.end('defs')
+
+    # attributes shared by all markers go on the group, the others on every marker
+    shared = set.intersection(*[set(marker) for marker in markers]) if markers else set()
+    attrib = dict(sorted(shared))
+    if clip is not None:
+        attrib['clip-path'] = f'url(#{name}c)'
+    writer.start('g', attrib=attrib)
+    for i in np.flatnonzero(keep):
+        x, y = offsets[i]
+        marker = {'xlink:href': f'#{refs[i]}', 'x': svg_number(x, precision), 'y': svg_number(renderer.height - y, precision)}
+        marker.update(item for item in markers[i] if item not in shared)
+        writer.element('use', attrib=marker)
+    writer.end('g')
+    writer.end('g')
+
+
+def save_svg(plot, fname, precision=2, **kwargs):
+    """
+    Saves a plot as SVG, writing every marker shape of scatter and strip plots once, as a symbol referenced by a light use element per point.
+
+    Args:
+        plot (object): The plot, as returned by the sciviz functions (or a matplotlib Figure).
+        fname (str, os.PathLike or file-like object): The SVG file.
+        precision (int, optional): The number of decimals of the marker coordinates. Defaults to 2 (a hundredth of a point).
+        **kwargs: Other arguments passed to matplotlib's savefig (e.g. bbox_inches='tight').
+
+    Returns:
+        matplotlib.figure.Figure: The Figure of the plot.
+
+    Notes:
+        matplotlib writes every marker of a collection as a full path when markers vary (e.g. with a shape encoding), and repeats the whole style of every marker otherwise.
+        Here, colors, opacities and line widths shared by all markers of a collection are written once, on the group of the markers. Other artists are written by matplotlib.
+        Rasterized collections (see rasterize_layers) are left to matplotlib.
+
+    """
+    fig = figure_of(plot)
+    collections = [collection for ax in fig.axes for collection in ax.collections if isinstance(collection, PathCollection)]
+    for i, collection in enumerate(collections):
+        collection.draw = MethodType(lambda self, renderer, name=f'sv{i}', draw=collection.draw: draw_symbols(self, renderer, name, precision, draw), collection)
+    try:
+        fig.savefig(fname, format='svg', **kwargs)
+    finally:
+        for collection in collections:
+            del collection.draw
+    return fig
+
+
+
+def png_image(buffer, size, max_colors=256, quantize='auto'):
+    """
+    Wraps an RGBA buffer (e.g. the buffer of an Agg canvas) as an image to encode as PNG, without copying it, and converts it to an 8-bit indexed (palette) image when requested.
+
+    Args:
+        buffer (memoryview or numpy.ndarray): The RGBA pixels, row by row.
+        size (tuple): The size of the image in pixels (width, height).
+        max_colors (int, optional): The maximum number of colors of the palette, at most 256. Defaults to 256.
+        quantize (str, optional): 'auto' to index the image only if it has at most max_colors distinct colors, without any loss, 'always' to also quantize images with more colors (antialiased edges are then approximated), or 'never'. Defaults to 'auto'.
+
+    Returns:
+        PIL.Image.Image: The indexed image, or the RGBA image if it is not indexed.
+
+    """
+    if quantize not in ['auto', 'always', 'never']:
+        raise ValueError("Invalid quantize option. Please choose from 'auto', 'always' or 'never'.")
+    image = Image.frombuffer('RGBA', size, buffer, 'raw', 'RGBA', 0, 1)
+    if quantize == 'never':
+        return image
+    max_colors = min(max_colors, 256)
+    colors = image.getcolors(max_colors)  # None if the image has more colors
+    if colors is None:
+        return image.quantize(colors=max_colors, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE) if quantize == 'always' else image
+    # exact palette: every pixel is looked up among the colors of the image, read as 32-bit integers
+    palette = np.sort(np.array([color for _, color in colors], dtype=np.uint8).view(np.uint32).ravel())
+    index = np.searchsorted(palette, np.frombuffer(buffer, dtype=np.uint32)).astype(np.uint8)
+    indexed = Image.frombuffer('P', size, index, 'raw', 'P', 0, 1)
+    indexed.putpalette(palette.view(np.uint8).tobytes(), rawmode='RGBA')
+    return indexed
+
+
+def draw_rgba(fig, dpi=100, **kwargs):
+    """
+    Draws a figure on an Agg canvas and returns its RGBA pixels, as a NumPy array viewing the buffer of the canvas, without encoding them.
+
+    Args:
+        fig (matplotlib.figure.Figure): The figure.
+        dpi (int, optional): The resolution of the image. Defaults to 100.
+        **kwargs: Other arguments of matplotlib's savefig (e.g. bbox_inches='tight'). Without them, the whole figure is drawn.
+
+    Returns:
+        numpy.ndarray: The image, of shape (height, width, 4) and dtype uint8.
+
+    """
+    canvas = fig.canvas
+    agg = canvas if isinstance(canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    figure_dpi = fig.dpi
+    try:
+        if kwargs:
+            # savefig applies the bounding box, which may extend past the figure (e.g. legends outside the axes); the raw format leaves the pixels unencoded in the buffer of the canvas
+            agg.print_figure(BytesIO(), format='rgba', dpi=dpi, **kwargs)
+        else:
+            fig.dpi = dpi
+            agg.draw()
+        return np.asarray(agg.buffer_rgba())
+    finally:
+        fig.dpi = figure_dpi
+        fig.set_canvas(canvas)
+
+
+def save_png(plot, fname, dpi=100, max_colors=256, quantize='auto', compress_level=6, **kwargs):
+    """
+    Saves a plot as PNG, encoding the pixels of the Agg canvas directly, as an 8-bit indexed image when they hold few colors.
+
+    Args:
+        plot (object): The plot, as returned by the sciviz functions (or a matplotlib Figure).
+        fname (str, os.PathLike or file-like object): The PNG file.
+        dpi (int, optional): The resolution of the image. Defaults to 100.
+        max_colors (int, optional): The maximum number of colors of an indexed image, at most 256. Defaults to 256.
+        quantize (str, optional): 'auto' to write an indexed image only if the plot has at most max_colors distinct colors, without any loss, 'always' to also quantize plots with more colors (antialiased edges are then approximated), or 'never' for a full RGBA image. Defaults to 'auto'.
+        compress_level (int, optional): The zlib compression level, from 0 (fastest) to 9 (smallest). Defaults to 6.
+        **kwargs: Other arguments passed to matplotlib's savefig (e.g. bbox_inches='tight').
+
+    Returns:
+        matplotlib.figure.Figure: The Figure of the plot.
+
+    Notes:
+        Indexed images take a quarter of the memory of RGBA images before compression. Flat plots (e.g. bar and pie charts) often have few enough colors to be indexed without loss.
+
+    """
+    fig = figure_of(plot)
+    pixels = draw_rgba(fig, dpi=dpi, **kwargs)
+    image = png_image(pixels, (pixels.shape[1], pixels.shape[0]), max_colors=max_colors, quantize=quantize)
+    image.save(fname, format='png', compress_level=compress_level, dpi=(dpi, dpi))
+    return fig
+
+
+def render_array(plot, dpi=100):
+    """
+    Renders a plot to an RGBA image, as a NumPy array viewing the pixels of the matplotlib canvas, without encoding or copying them.
+
+    Args:
+        plot (object): The plot, as returned by the sciviz functions (or a matplotlib Figure).
+        dpi (int, optional): The resolution of the image. Defaults to 100.
+
+    Returns:
+        numpy.ndarray: The image, of shape (height, width, 4) and dtype uint8, covering the whole figure.
+
+    Notes:
+        The array is a view on the buffer of the canvas: it stays valid after the figure is closed, but is overwritten if the figure is drawn again at the same size and resolution. Copy it (array.copy()) to keep it across redraws.
+
+    """
+    return draw_rgba(figure_of(plot), dpi=dpi)
+
+
+def render_arrays(plots, dpi=100, close=True):
+    """
+    Renders plots to RGBA images, as NumPy arrays viewing the pixels of their canvas (see render_array).
+
+    Args:
+        plots (iterable): The plots to render, as returned by the sciviz functions (or matplotlib Figures).
+            Pass a generator to create every plot only when it is rendered.
+        dpi (int, optional): The resolution of the images. Defaults to 100.
+        close (bool, optional): Whether to close every figure once it is rendered. The arrays stay valid. Defaults to True.
+
+    Returns:
+        list: The images, as arrays of shape (height, width, 4) and dtype uint8.
+
+    """
+    images = []
+    for plot in plots:
+        images.append(render_array(plot, dpi=dpi))
+        if close:
+            plt.close(figure_of(plot))
+    return images
\ No newline at end of file
@@ -0,0 +1,122 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from pandas.api.types import is_numeric_dtype
+from .palettes import color_seq_palette, shape_palette, size_palette, set_order
+from .legends import legend_create, legend_parameters
+
+
+def category_order(values):
+    """
+    Returns the unique values of a column in the order used by seaborn: sorted for numeric values, order of appearance otherwise.
+
+    Args:
+        values (pandas.Series): The values of the column.
+
+    Returns:
+        list: The ordered unique values.
+
+    """
+    levels = values.unique()
+    if is_numeric_dtype(values):
+        levels = np.sort(levels)
+    return list(levels)
+
+
+def facet(data, plot, row=None, col=None, row_order=None, col_order=None, sharex=True, sharey=True, height=4, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), **kwargs):
+    """
+    Draws a grid of plots, one panel per value of one or two facet columns, sharing palettes and a single legend.
+
+    Args:
+        data (DataFrame): The input data.
+        plot (function): The sciviz plot function to draw in every panel (bar, boxplot, histogram, jitter, line, point or violin).
+        row (str, optional): The column name used to split the data across the rows of the grid. Defaults to None.
+        col (str, optional): The column name used to split the data across the columns of the grid. Defaults to None.
+        row_order (list, optional): The order of the rows. Defaults to None.
+        col_order (list, optional): The order of the columns. Defaults to None.
+        sharex (bool, optional): Whether the panels share the x-axis. Defaults to True.
+        sharey (bool, optional): Whether the panels share the y-axis. Defaults to True.
+        height (float, optional): The height (and width) of every panel in inches. Defaults to 4.
+        legend (dict, optional): The parameters for the legend, drawn once for the whole grid. Defaults to legend_parameters().
+        **kwargs: The arguments passed to the plot function (e.g. x, y, color, color_pal).
+
+    Returns:
+        numpy.ndarray: A 2D array with the matplotlib Axes objects of the grid.
+
+    Notes:
+        The palettes and the order of the categories are resolved once on the whole data, so that every category keeps the same color, shape and position in all panels.
+
+    """
+    if plot.__name__ not in ['bar', 'boxplot', 'histogram', 'jitter', 'line', 'point', 'violin']:
+        raise ValueError("Faceting is only supported for bar, boxplot, histogram, jitter, line, point and violin plots.")
+    if row is None and col is None:
+        raise ValueError("Please provide at least one of 'row' or 'col'.")
+
+    facets = [facet_col for facet_col in [row, col] if facet_col is not None]
+    panels = {key: subset for key, subset in data.groupby(facets, sort=False, observed=True)}
+    if row is not None:
+        row_levels = row_order if row_order else list(dict.fromkeys(key[0] for key in panels))
+    else:
+        row_levels = [None]
+    if col is not None:
+        col_levels = col_order if col_order else list(dict.fromkeys(key[-1] for key in panels))
+    else:
+        col_levels = [None]
+
+    # Resolve orders and palettes once for the whole grid
+    color = kwargs.get('color')
+    shape = kwargs.get('shape')
+    size = kwargs.get('size')
+    size = size if type(size) == str else None
+    color_order, shape_order, size_order = set_order(color=color, color_order=kwargs.get('color_order'), shape=shape, shape_order=kwargs.get('shape_order'), size=size, size_order=kwargs.get('size_order'))
+    color_pal = shape_pal = size_pal = None
+    if color:
+        color_order = color_order if color_order else category_order(data[color])
+        color_pal = color_seq_palette(color_val=data[color], users_palette=kwargs.get('color_pal'), order=color_order)
+        kwargs['color_order'] = color_order
+        kwargs['color_pal'] = list(color_pal)
+    if shape:
+        shape_order = shape_order if shape_order else category_order(data[shape])
+        shape_pal = shape_palette(shape_val=data[shape], users_palette=kwargs.get('shape_pal'), order=shape_order)
+        kwargs['shape_order'] = shape_order
+        kwargs['shape_pal'] = shape_pal
+    if size:
+        size_order = size_order if size_order else category_order(data[size])
+        size_limits = kwargs.get('size_pal', [50, 150])
+        size_pal = size_palette(size_val=data[size], min_size=size_limits[0], max_size=size_limits[1], order=size_order)
+        kwargs['size_order'] = size_order
+    if plot.__name__ in ['bar', 'boxplot', 'jitter', 'violin'] and not kwargs.get('order'):
+        categorical = kwargs['x'] if kwargs.get('orient', 'v') == 'v' else kwargs['y']
+        kwargs['order'] = category_order(data[categorical])
+
+    nrows, ncols = len(row_levels), len(col_levels)
+    fig, axes = plt.subplots(nrows, ncols, figsize=(height * ncols, height * nrows), sharex=sharex, sharey=sharey, squeeze=False)
+    for i, row_level in enumerate(row_levels):
+        for j, col_level in enumerate(col_levels):
+            ax = axes[i, j]
+            key = tuple(level for level, facet_col in [(row_level, row), (col_level, col)] if facet_col is not None)
+            if key not in panels:
+                ax.set_axis_off()
+                continue
+            plot(panels[key], ax=ax, legend=None, **kwargs)
+            ax.set_title(' | '.join(f'{facet_col} = {level}' for level, facet_col in zip(key, facets)))
+            if i < nrows - 1:
+                ax.set_xlabel('')
+            if j > 0:
+                ax.set_ylabel('')
+
+    if legend:
+        legend_create(
+            ax=axes[0, -1],
+            data=data,
+            color_val=color,
+            color_pal=color_pal,
+            color_order=color_order,
+            shape_val=shape,
+            shape_pal=shape_pal,
+            shape_order=shape_order,
+            size_val=size,
+            size_pal=size_pal,
+            size_order=size_order,
+            legend=legend
+        )
+    return axes
\ No newline at end of file
@@ -1,8 +1,30 @@
+from dataclasses import dataclass
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from pandas import DataFrame, Series
+from matplotlib.colors import to_rgba_array
+from matplotlib.collections import LineCollection
+from pandas import DataFrame, Series, concat, factorize
+from seaborn.matrix import ClusterGrid
+from .misc_utils import rasterize_artists
 from .palettes import color_seq_palette, color_cont_palette
 from .legends import legend_parameters, legend_title, legend_color, legend_spacer
+from .matrix import APPROX_BLOCKS, approx_row_order, is_sparse, matrix_frame, open_matrix, sparse_linkages
+from .native import cycle_palette
+from .specs import ParameterSpec
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TickParameters(ParameterSpec):
+    """
+    The parameters of the ticks of a heatmap, as returned by tick_parameters(). See tick_parameters() for their description.
+
+    """
+    xticks: bool = True
+    yticks: bool = True
+    xticks_angle: float = 0
+    yticks_angle: float = 0
+    ticklabel_size: float = 11
+
 
 def tick_parameters(xticks=True, yticks=True, xticks_angle=0, yticks_angle=0, ticklabel_size=11):
     """
@@ -16,27 +38,122 @@ def tick_parameters(xticks=True, yticks=True, xticks_angle=0, yticks_angle=0, ti
         ticklabel_size (int, optional): The font size of tick labels. Defaults to 11.
 
     Returns:
-        dict: A dictionary containing the tick parameters.
+        TickParameters: The parameters of the ticks, which can also be read as a dictionary.
         
     """
-    tick_params = {
-        'xticks': xticks,
-        'yticks': yticks,  
-        'xticks_angle': xticks_angle,
-        'yticks_angle': yticks_angle,
-        'ticklabel_size': ticklabel_size
-    }
-    return tick_params
+    return TickParameters(
+        xticks=xticks,
+        yticks=yticks,
+        xticks_angle=xticks_angle,
+        yticks_angle=yticks_angle,
+        ticklabel_size=ticklabel_size
+    )
+
+
+def track_colors(values, users_palette=None):
+    """
+    Maps the values of an annotation track to colors, with a single factorize and lookup.
+
+    Args:
+        values (pandas.Series): The values of the track.
+        users_palette (list, optional): The palette of the track. Defaults to None.
+
+    Returns:
+        tuple: The RGBA colors of the values, as an array of shape (n, 4) (transparent for missing values), the palette of the categories and the categories themselves, both in order of appearance and without missing values.
+
+    """
+    codes, categories = factorize(values)
+    color_pal = cycle_palette(color_seq_palette(color_val=values, users_palette=users_palette), len(categories))
+    table = np.vstack([to_rgba_array(color_pal).reshape(-1, 4), np.zeros((1, 4))])  # code -1 (missing values) takes the last, transparent, color
+    return table.take(codes, axis=0), color_pal, list(categories)
 
 
-def heatmap(data, gradient_pal='Spectral', row_cluster=True, col_cluster=True, dendrogram=0.1, row1_annot=None, row2_annot=None, col1_annot=None, col2_annot=None, row1_pal=None, row2_pal=None, col1_pal=None, col2_pal=None, cbar=True, ticks=tick_parameters(xticks=True, yticks=True, xticks_angle=0, yticks_angle=0, ticklabel_size=11), legend=legend_parameters(orient='v', posx=1.1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11)):
+def track_list(annots, pals):
+    """
+    Pairs annotation tracks with their palettes.
+
+    Args:
+        annots (list or None): The tracks.
+        pals (list or None): The palettes of the tracks. Missing palettes are None.
+
+    Returns:
+        list: The (track, palette) pairs.
+
+    """
+    annots = list(annots or [])
+    pals = list(pals or [])
+    return [(annot, pals[i] if i < len(pals) else None) for i, annot in enumerate(annots)]
+
+
+class TrackGrid(ClusterGrid):
+    """
+    A seaborn ClusterGrid drawing all annotation tracks of a side as a single image, rather than as one mesh cell per annotated row or column.
+
+    Args:
+        data (DataFrame): The matrix to plot.
+        row_colors (tuple, optional): The labels of the row tracks and their RGBA colors, as an array of shape (tracks, rows, 4). Defaults to None.
+        col_colors (tuple, optional): The labels of the column tracks and their RGBA colors, as an array of shape (tracks, columns, 4). Defaults to None.
+        **kwargs: The other arguments of ClusterGrid (e.g. figsize, dendrogram_ratio).
+
+    """
+
+    def _preprocess_colors(self, data, colors, axis):
+        if colors is None:
+            return None, None
+        labels, colors = colors
+        return colors, labels
+
+    def plot_colors(self, xind, yind, **kws):
+        if self.row_colors is not None:
+            n_tracks, n_rows = self.row_colors.shape[:2]
+            self.ax_row_colors.imshow(self.row_colors[:, yind].transpose(1, 0, 2), aspect='auto', interpolation='nearest', extent=(0, n_tracks, n_rows, 0))
+            self.ax_row_colors.set_xticks(np.arange(n_tracks) + 0.5, self.row_color_labels, rotation=90)
+            self.ax_row_colors.set_yticks([])
+        sns.despine(ax=self.ax_row_colors, left=True, bottom=True)
+        if self.col_colors is not None:
+            n_tracks, n_cols = self.col_colors.shape[:2]
+            self.ax_col_colors.imshow(self.col_colors[:, xind], aspect='auto', interpolation='nearest', extent=(0, n_cols, n_tracks, 0))
+            self.ax_col_colors.yaxis.tick_right()
+            self.ax_col_colors.set_yticks(np.arange(n_tracks) + 0.5, self.col_color_labels, rotation=0)
+            self.ax_col_colors.set_xticks([])
+        sns.despine(ax=self.ax_col_colors, left=True, bottom=True)
+
+
+def block_dendrogram(ax, linkage, sizes, n_rows):
+    """
+    Draws the row dendrogram of an approximate clustering at block resolution, each leaf (k-means block) facing the rows it holds.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes of the row dendrogram.
+        linkage (numpy.ndarray): The linkage matrix of the blocks, as returned by approx_row_order. Empty if there is a single block, which leaves the dendrogram blank.
+        sizes (numpy.ndarray): The number of rows of every block, in the order of the leaves.
+        n_rows (int): The number of rows drawn in the heatmap.
+
+    """
+    from scipy.cluster.hierarchy import dendrogram
+    if len(linkage) == 0:
+        return
+    tree = dendrogram(linkage, no_plot=True)
+    edges = np.concatenate([[0], np.cumsum(sizes)]) * n_rows / np.sum(sizes)
+    centers = (edges[:-1] + edges[1:]) / 2
+    # scipy places the leaves at 5, 15, 25, ...: map them (and the nodes in between) to the centers of their rows
+    positions = np.interp((np.asarray(tree['icoord']) - 5) / 10, np.arange(len(centers)), centers)
+    heights = np.asarray(tree['dcoord'])
+    ax.add_collection(LineCollection([list(zip(height, position)) for height, position in zip(heights, positions)], linewidths=.5, colors=(.2, .2, .2)))
+    ax.set_xlim(0, heights.max() * 1.05)
+    ax.set_ylim(0, n_rows)
+    ax.invert_xaxis()
+    ax.invert_yaxis()
+
+
+def heatmap(data, gradient_pal='Spectral', row_cluster=True, col_cluster=True, dendrogram=0.1, row1_annot=None, row2_annot=None, col1_annot=None, col2_annot=None, row1_pal=None, row2_pal=None, col1_pal=None, col2_pal=None, cbar=True, ticks=tick_parameters(xticks=True, yticks=True, xticks_angle=0, yticks_angle=0, ticklabel_size=11), legend=legend_parameters(orient='v', posx=1.1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), row_labels=None, col_labels=None, max_rows=1000, max_cols=1000, rasterize_layers=False, row_annots=None, col_annots=None, row_pals=None, col_pals=None):
     """
     Generates a heatmap plot based on the provided data.
 
     Args:
-        data (DataFrame): The input data to be plotted.
+        data (DataFrame, numpy.memmap, str or array-like): The input data to be plotted. Large matrices can also be given as a numpy.memmap, the path of a .npy file (memory-mapped), a chunked array (e.g. Zarr) or a scipy.sparse matrix.
         gradient_pal (str, optional): The color palette for the heatmap. Defaults to 'Spectral'.
-        row_cluster (bool, optional): Whether to cluster the rows. Defaults to True.
+        row_cluster (bool or str, optional): Whether to cluster the rows. 'approx' clusters the rows approximately, for hundreds of thousands of rows (see Notes). Defaults to True.
         col_cluster (bool, optional): Whether to cluster the columns. Defaults to True.
         dendrogram (float, optional): The ratio of the dendrogram size. Defaults to 0.1.
         row1_annot (str, optional): The name of the first row annotation. Defaults to None.
@@ -50,89 +167,105 @@ def heatmap(data, gradient_pal='Spectral', row_cluster=True, col_cluster=True, d
         cbar (bool, optional): Whether to show the colorbar. Defaults to True.
         ticks (dict, optional): The tick parameters for the heatmap. Defaults to tick_parameters(xticks=True, yticks=True, xticks_angle=0, yticks_angle=0, ticklabel_size=11).
         legend (dict, optional): The legend parameters for the heatmap. Defaults to legend_parameters().
+        row_labels (array-like, optional): The labels of the rows of a matrix input. Defaults to None.
+        col_labels (array-like, optional): The labels of the columns of a matrix input. Defaults to None.
+        max_rows (int, optional): The maximum number of rows drawn for a matrix input. Defaults to 1000.
+        max_cols (int, optional): The maximum number of columns drawn for a matrix input. Defaults to 1000.
+        rasterize_layers (bool, optional): Whether to rasterize the cells of the heatmap and of the annotations in vector outputs (PDF, SVG), at the resolution passed to savefig, keeping axes, text and legends as vectors. Matrix inputs are always rasterized. Defaults to False.
+        row_annots (list, optional): Any number of row annotations, as column names of the data, drawn after row1_annot and row2_annot. Defaults to None.
+        col_annots (list, optional): Any number of column annotations, as (data, name) tuples, drawn after col1_annot and col2_annot. Defaults to None.
+        row_pals (list, optional): The color palettes of the row_annots, in the same order. Defaults to None.
+        col_pals (list, optional): The color palettes of the col_annots, in the same order. Defaults to None.
 
     Returns:
         ax: The matplotlib Axes object containing the heatmap plot.
 
+    Notes:
+        A matrix input is read chunk by chunk and averaged over blocks of rows and columns, down to at most max_rows by max_cols values, so that it is never loaded in memory as a whole.
+        Clustering is done on the reduced matrix, and column annotations take the value of the first column of each block.
+        Sparse matrices are reduced with sparse products, and their row (column) blocks are clustered on Euclidean distances over all columns (rows), computed from the sparse Gram matrix.
+        Row annotations are only supported for DataFrame input.
+        The annotations of each side are drawn as a single image, so that many tracks over many rows stay cheap to draw.
+        Exact row clustering takes time and memory quadratic in the number of rows. With row_cluster='approx', inputs of more than APPROX_BLOCKS (2000) rows are pre-clustered into 2000 blocks with mini-batch k-means, the block centroids are clustered hierarchically, and the rows of every block are ordered along the direction from the previous to the next block.
+        The ordered rows are then averaged down to max_rows blocks, also for DataFrame input (row annotations take the value of the first row of each block), and the row dendrogram is drawn at k-means block resolution. Smaller inputs are clustered exactly. Not supported for sparse matrices. Chunked arrays other than Zarr must support integer array indexing of sorted rows, used by the random batches of k-means.
+
     """
+    if isinstance(row_cluster, str) and row_cluster != 'approx':
+        raise ValueError("Invalid row_cluster option. Please choose from True, False or 'approx'.")
+    row_linkage = col_linkage = row_order = None
+    row_tracks = [(annot, pal) for annot, pal in [(row1_annot, row1_pal), (row2_annot, row2_pal)] if annot is not None] + track_list(row_annots, row_pals)
+    col_tracks = [(annot, pal) for annot, pal in [(col1_annot, col1_pal), (col2_annot, col2_pal)] if annot is not None] + track_list(col_annots, col_pals)
+    matrix_input = not isinstance(data, DataFrame)
+    if matrix_input:
+        if row_tracks:
+            raise ValueError("Row annotations are only supported for DataFrame input.")
+        matrix = open_matrix(data)
+        if row_cluster == 'approx' and matrix.shape[0] > APPROX_BLOCKS:
+            if is_sparse(matrix):
+                raise ValueError("Approximate row clustering is not supported for sparse matrices.")
+            row_order, block_linkage, block_sizes = approx_row_order(matrix)
+        data, row_edges, col_edges = matrix_frame(matrix, row_labels=row_labels, col_labels=col_labels, max_rows=max_rows, max_cols=max_cols, row_order=row_order)
+        if is_sparse(matrix):
+            row_linkage, col_linkage = sparse_linkages(matrix, row_edges, col_edges, row_cluster=row_cluster, col_cluster=col_cluster)
+        col_tracks = [((np.asarray(values)[col_edges[:-1]], name), pal) for (values, name), pal in col_tracks]
+    elif row_cluster == 'approx' and len(data) > APPROX_BLOCKS:
+        numeric = data.select_dtypes(include='number')
+        values = numeric.to_numpy(dtype=float)
+        row_order, block_linkage, block_sizes = approx_row_order(values)
+        frame, row_edges, _ = matrix_frame(values, row_labels=numeric.index, col_labels=numeric.columns, max_rows=max_rows, max_cols=values.shape[1], row_order=row_order)
+        data = concat([frame, data.drop(columns=numeric.columns).iloc[row_order[row_edges[:-1]]].set_axis(frame.index)], axis=1)
+    if row_cluster == 'approx':
+        row_cluster = row_order is None  # small inputs are clustered exactly
+
     gradient_pal = color_cont_palette(users_palette=gradient_pal)  # "Spectral" for 0 to 1, "coolwarm" for -1 to 1
 
-    # Create annotations
-    data_rows = data.copy()
-    row_colors = DataFrame()
-    col_colors = DataFrame()
+    # Create annotations, one RGBA track per annotation
+    row_colors = []
+    col_colors = []
     handles = []
     labels = []
     titles = []
-    
-    if row1_annot != None:
-        row1_pal = color_seq_palette(color_val=data[row1_annot], users_palette=row1_pal)
-        row_data1 = data_rows.pop(row1_annot)
-        legend_labels = data[row1_annot].unique()
-        main_palette1 = row1_pal[:len(list(legend_labels))]
-        row_color1 = dict(zip(row_data1.unique(), main_palette1))
-        row_colors[row1_annot] = row_data1.map(row_color1)
-        handles, labels, title = legend_title(handles, labels, data[row1_annot])
+    for values, pal in [(data[annot], pal) for annot, pal in row_tracks] + [(Series(values, name=name), pal) for (values, name), pal in col_tracks]:
+        colors, pal, categories = track_colors(values, pal)
+        (row_colors if len(row_colors) < len(row_tracks) else col_colors).append(colors)
+        handles, labels, title = legend_title(handles, labels, values)
         titles.append(title)
-        handles, labels = legend_color(data[row1_annot], row1_pal, None, handles, labels)
-        legend_spacer(handles, labels)
-    
-    if row2_annot != None:
-        row2_pal = color_seq_palette(color_val=data[row2_annot], users_palette=row2_pal)
-        row_data2 = data_rows.pop(row2_annot)
-        legend_labels = data[row2_annot].unique()
-        second_palette1 = row2_pal[:len(list(legend_labels))]
-        row_color2 = dict(zip(row_data2.unique(), second_palette1))
-        row_colors[row2_annot] = row_data2.map(row_color2)
-        handles, labels, title = legend_title(handles, labels, data[row2_annot])
-        titles.append(title)
-        handles, labels = legend_color(data[row2_annot], row2_pal, None, handles, labels)
-        legend_spacer(handles, labels)
-        
-    if col1_annot != None:
-        col_data1 = Series(col1_annot[0], name=col1_annot[1])
-        col1_pal = color_seq_palette(color_val=col_data1, users_palette=col1_pal)
-        legend_labels = col_data1.unique()
-        main_palette2 = col1_pal[:len(list(legend_labels))]
-        col_color1 = dict(zip(legend_labels, main_palette2))
-        col_colors[col1_annot[1]] = col_data1.map(col_color1)
-        handles, labels, title = legend_title(handles, labels, col_data1)
-        titles.append(title)
-        handles, labels = legend_color(col_data1, col1_pal, None, handles, labels)
-        legend_spacer(handles, labels)
-          
-    if col2_annot != None:
-        col_data2 = Series(col2_annot[0], name=col2_annot[1])
-        col2_pal = color_seq_palette(color_val=col_data2, users_palette=col2_pal)
-        legend_labels = col_data2.unique()
-        second_palette2 = col2_pal[:len(list(legend_labels))]
-        col_color2 = dict(zip(legend_labels, second_palette2))
-        col_colors[col2_annot[1]] = col_data2.map(col_color2)
-        handles, labels, title = legend_title(handles, labels, col_data2)
-        titles.append(title)
-        handles, labels = legend_color(col_data2, col2_pal, None, handles, labels)
+        if categories:  # missing values are drawn transparent and left out of the legend
+            handles, labels = legend_color(values, pal, categories, handles, labels)
         legend_spacer(handles, labels)
-
-    if row1_annot == None and row2_annot == None:
-        row_colors = None
-    if col1_annot == None and col2_annot  == None:
-        col_colors = None
+    row_colors = ([annot for annot, _ in row_tracks], np.stack(row_colors)) if row_tracks else None
+    col_colors = ([annot[1] for annot, _ in col_tracks], np.stack(col_colors)) if col_tracks else None
 
     data_plot = data.select_dtypes(include='number')  # Select only numeric columns to be plotted
     
-    if row_cluster or col_cluster:
-        ax = sns.clustermap(
+    if row_cluster or col_cluster or row_order is not None:
+        ax = TrackGrid(
             data_plot,
-            row_cluster=row_cluster, 
-            col_cluster=col_cluster,
-            row_colors=row_colors, 
-            col_colors=col_colors,  
-            cmap=gradient_pal, 
-            dendrogram_ratio=dendrogram if dendrogram else 0.1, 
-            colors_ratio=0.02, 
+            row_colors=row_colors,
+            col_colors=col_colors,
+            dendrogram_ratio=dendrogram if dendrogram else 0.1,
+            colors_ratio=0.02,
             cbar_pos=(1.05, 0.25, 0.01, 0.5) if cbar else None,
             figsize=(8, 8)
+        ).plot(
+            metric='euclidean',
+            method='average',
+            colorbar_kws=None,
+            row_cluster=row_cluster,
+            col_cluster=col_cluster,
+            row_linkage=row_linkage,
+            col_linkage=col_linkage,
+            tree_kws=None,
+            cmap=gradient_pal
         )
+        if row_order is not None:
+            block_dendrogram(ax.ax_row_dendrogram, block_linkage, block_sizes, len(data_plot))
+        if matrix_input:  # draw the reduced matrix as an image, also in vector outputs
+            ax.ax_heatmap.collections[0].set_rasterized(True)
+        if rasterize_layers:
+            for cells in [ax.ax_heatmap, ax.ax_row_colors, ax.ax_col_colors]:
+                if cells is not None:
+                    rasterize_artists(cells)
         if dendrogram == None:  # Suppress dendrograms
             ax.ax_row_dendrogram.set_visible(False)
             ax.ax_col_dendrogram.set_visible(False)
@@ -157,6 +290,10 @@ def heatmap(data, gradient_pal='Spectral', row_cluster=True, col_cluster=True, d
             cbar_kws={'shrink': 0.6, 'aspect': 50},
             ax=ax
         )
+        if matrix_input:
+            ax.collections[0].set_rasterized(True)
+        if rasterize_layers:
+            ax = rasterize_artists(ax)
 
     
     if legend and handles:
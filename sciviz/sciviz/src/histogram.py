@@ -1,55 +1,277 @@
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.colors import to_rgb
+from pandas import DataFrame, Series, factorize
+from .misc_utils import iter_chunks, variable_name, variable_values
 from .palettes import color_seq_palette
 from .legends import legend_create, legend_parameters
+from .native import check_engine, native_histogram
 
 
-def histogram(data, x, y=None, color=None, stat='count', bins='auto', binwidth=None, color_pal=None, color_order=None, edgecolor='black', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11)):
+def bin_edges(values, bins, binwidth, binrange):
+    """
+    Computes the bin edges of one axis of a bivariate histogram.
+
+    Args:
+        values (numpy.ndarray or None): The values of the axis. None when the data are streamed and cannot be read twice.
+        bins (int or str): The number of bins or the method to determine the number of bins.
+        binwidth (float or None): The width of each bin.
+        binrange (tuple or None): The lowest and highest bin edge (e.g., (min, max)).
+
+    Returns:
+        numpy.ndarray: The bin edges.
+
+    """
+    if binrange is None:
+        if values is None:
+            raise ValueError("Streamed bivariate histograms require 'binrange' to be set, e.g. binrange=((xmin, xmax), (ymin, ymax)).")
+        values = values[np.isfinite(values)]
+        binrange = (values.min(), values.max())
+    if binwidth:
+        return np.arange(binrange[0], binrange[1] + binwidth, binwidth)
+    if type(bins) == str:
+        if values is None:
+            bins = 100  # 'auto' needs all values at once, use a fixed number of bins when streaming
+        else:
+            return np.histogram_bin_edges(values, bins=bins, range=binrange)
+    return np.linspace(binrange[0], binrange[1], bins + 1)
+
+
+def histogram2d_accumulate(data, x, y, color, x_edges, y_edges):
+    """
+    Accumulates the 2D bin counts of every color group chunk by chunk.
+
+    Args:
+        data (pandas.DataFrame, iterable or None): A DataFrame, or an iterable of DataFrame chunks. None if the variables are given as arrays.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves.
+        color (str, array-like or None): The column name for the color encoding, or the values themselves.
+        x_edges (numpy.ndarray): The bin edges of the x-axis.
+        y_edges (numpy.ndarray): The bin edges of the y-axis.
+
+    Returns:
+        dict: A dictionary mapping every color group (None if there is no color encoding) to its 2D counts, in order of appearance.
+
+    """
+    counts = {}
+    for chunk in iter_chunks(data):
+        x_values = variable_values(chunk, x).to_numpy(dtype=float)
+        y_values = variable_values(chunk, y).to_numpy(dtype=float)
+        if color is None:
+            groups = [(None, slice(None))]
+        else:
+            codes, levels = factorize(variable_values(chunk, color))
+            groups = [(group, codes == i) for i, group in enumerate(levels)]
+        for group, index in groups:
+            layer, _, _ = np.histogram2d(x_values[index], y_values[index], bins=[x_edges, y_edges])
+            if group in counts:
+                counts[group] += layer
+            else:
+                counts[group] = layer
+    return counts
+
+
+def histogram2d_stat(counts, x_edges, y_edges, stat):
+    """
+    Normalizes the 2D bin counts according to the requested statistic. Normalization is common to all color groups.
+
+    Args:
+        counts (list): A list of 2D count arrays, one per color group.
+        x_edges (numpy.ndarray): The bin edges of the x-axis.
+        y_edges (numpy.ndarray): The bin edges of the y-axis.
+        stat (str): The type of statistic to compute ('count', 'frequency', 'probability', 'proportion', 'percent' or 'density').
+
+    Returns:
+        list: A list of the normalized 2D arrays.
+
+    """
+    total = sum(layer.sum() for layer in counts)
+    area = np.outer(np.diff(x_edges), np.diff(y_edges))
+    if stat == 'count':
+        return counts
+    elif stat == 'frequency':
+        return [layer / area for layer in counts]
+    elif stat in ['probability', 'proportion']:
+        return [layer / total for layer in counts]
+    elif stat == 'percent':
+        return [100 * layer / total for layer in counts]
+    elif stat == 'density':
+        return [layer / (total * area) for layer in counts]
+    raise ValueError("Invalid stat option. Please choose from 'count', 'frequency', 'probability', 'proportion', 'percent' or 'density'.")
+
+
+def histogram2d_image(layers, colors, alpha, log_counts):
+    """
+    Composites the 2D histograms of all color groups into a single RGBA image.
+
+    Args:
+        layers (list): A list of 2D arrays (x bins by y bins), one per color group.
+        colors (list): The color of every layer.
+        alpha (float): The opacity of the most populated bin.
+        log_counts (bool): Whether to scale the opacity of the bins logarithmically.
+
+    Returns:
+        numpy.ndarray: An RGBA image of shape (y bins, x bins, 4), with the first row corresponding to the lowest y bin.
+
+    """
+    vmax = max(layer.max() for layer in layers)
+    image = np.zeros(layers[0].T.shape + (4,))
+    if vmax <= 0:
+        return image
+    for layer, color in zip(layers, colors):
+        if log_counts:
+            weight = np.log1p(layer.T) / np.log1p(vmax)
+        else:
+            weight = layer.T / vmax
+        a = alpha * weight[..., None]
+        # "over" compositing with premultiplied colors, so that the layers drawn last stay on top
+        image[..., :3] = np.asarray(to_rgb(color)) * a + image[..., :3] * (1 - a)
+        image[..., 3:] = a + image[..., 3:] * (1 - a)
+    filled = image[..., 3] > 0
+    image[filled, :3] /= image[filled, 3:]
+    return image
+
+
+def histogram2d(data, x, y, color=None, stat='count', bins='auto', binwidth=None, binrange=None, log_counts=False, color_pal=None, color_order=None, alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), ax=None):
+    """
+    Plots a bivariate histogram as a single image, accumulating the counts chunk by chunk.
+
+    Args:
+        data (DataFrame or iterable): The input data, or an iterable of DataFrame chunks. Can be None if the variables are given as arrays.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves.
+        color (str or array-like, optional): The column name for the color encoding, or the values themselves. Defaults to None.
+        stat (str, optional): The type of statistic to compute. Defaults to 'count'.
+        bins (int or str, optional): The number of bins or the method to determine the number of bins. Defaults to 'auto'.
+        binwidth (float or tuple, optional): The width of each bin, or a tuple of widths for the x and y axes. Defaults to None.
+        binrange (tuple, optional): The range of the bins as ((xmin, xmax), (ymin, ymax)). Required for streamed data. Defaults to None.
+        log_counts (bool, optional): Whether to scale the bins logarithmically. Defaults to False.
+        color_pal (list, optional): The color palette for the color encoding. Defaults to None.
+        color_order (list, optional): The order of colors for the color encoding. Defaults to None.
+        alpha (float, optional): The opacity of the most populated bin. Defaults to 0.7.
+        legend (dict, optional): The parameters for the legend. Defaults to legend_parameters().
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+
+    Returns:
+        AxesSubplot: The matplotlib AxesSubplot object.
+
+    """
+    if color_pal is not None and color is None:
+        single_color = color_pal[0]
+    else:
+        single_color = None
+
+    binwidths = binwidth if type(binwidth) in [tuple, list] else (binwidth, binwidth)
+    binranges = binrange if binrange is not None else (None, None)
+    in_memory = data is None or isinstance(data, DataFrame)
+    x_edges = bin_edges(variable_values(data, x).to_numpy(dtype=float) if in_memory else None, bins, binwidths[0], binranges[0])
+    y_edges = bin_edges(variable_values(data, y).to_numpy(dtype=float) if in_memory else None, bins, binwidths[1], binranges[1])
+
+    counts = histogram2d_accumulate(data, x, y, color, x_edges, y_edges)
+    if color is not None:
+        levels = list(color_order) if color_order else list(counts.keys())
+        color_levels = Series(levels, name=variable_name(color, 'color'))
+        color_pal = color_seq_palette(color_val=color_levels, users_palette=color_pal, order=color_order)
+        colors = [color_pal[i] for i, group in enumerate(levels) if group in counts]
+        counts = {group: counts[group] for group in levels if group in counts}
+    else:
+        color_levels = None
+        colors = [single_color if single_color else '#2271B5']
+
+    layers = histogram2d_stat(list(counts.values()), x_edges, y_edges, stat)
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
+    if layers:
+        ax.imshow(
+            histogram2d_image(layers, colors, alpha, log_counts),
+            origin='lower',
+            extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+            aspect='auto',
+            interpolation='nearest'
+        )
+    ax.set_xlabel(variable_name(x, ''))
+    ax.set_ylabel(variable_name(y, ''))
+
+    if legend and color is not None:
+        ax = legend_create(
+            ax=ax,
+            data=None,
+            color_val=color_levels,
+            color_pal=color_pal,
+            color_order=color_order,
+            shape_val=None,
+            shape_pal=None,
+            shape_order=None,
+            size_val=None,
+            size_pal=None,
+            size_order=None,
+            legend=legend
+        )
+    return ax
+
+
+def histogram(data, x, y=None, color=None, stat='count', bins='auto', binwidth=None, color_pal=None, color_order=None, edgecolor='black', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), binrange=None, log_counts=False, ax=None, engine='seaborn'):
     """
     Plots a histogram using the given data and parameters.
 
     Args:
-        data (DataFrame): The input data.
-        x (str): The column name for the x-axis.
-        y (str, optional): The column name for the y-axis. Defaults to None.
-        color (str, optional): The column name for the color encoding. Defaults to None.
+        data (DataFrame or iterable): The input data. Bivariate histograms also accept an iterable of DataFrame chunks. Can be None if the variables are given as arrays.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like, optional): The column name for the y-axis, or the values themselves. If given, a bivariate histogram is drawn as a single image. Defaults to None.
+        color (str or array-like, optional): The column name for the color encoding, or the values themselves. Defaults to None.
         stat (str, optional): The type of statistic to compute. Defaults to 'count'. Other possible values are 'density', 'percent', 'probability' and 'frequency'.
         bins (int or str, optional): The number of bins or the method to determine the number of bins. Defaults to 'auto'.
         binwidth (float, optional): The width of each bin. Defaults to None.
         color_pal (list, optional): The color palette for the color encoding. Defaults to None.
         color_order (list, optional): The order of colors for the color encoding. Defaults to None.
-        edgecolor (str, optional): The color of the edges of the bars. Defaults to 'black'.
+        edgecolor (str, optional): The color of the edges of the bars. Not used by bivariate histograms. Defaults to 'black'.
         alpha (float, optional): The transparency of the bars. Defaults to 0.8.
         legend (dict, optional): The parameters for the legend. Defaults to legend_parameters().
+        binrange (tuple, optional): The range of the bins of a bivariate histogram as ((xmin, xmax), (ymin, ymax)). Required for streamed data. Defaults to None.
+        log_counts (bool, optional): Whether to scale the bins of a bivariate histogram logarithmically. Defaults to False.
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+        engine (str, optional): The drawing engine, 'seaborn' or 'native'. The native engine draws directly with matplotlib from the resolved sciviz palettes; bivariate histograms are always drawn as a single image. Defaults to 'seaborn'.
 
     Returns:
         AxesSubplot: The matplotlib AxesSubplot object.
 
     """
-    if color_pal is not None and color == None:
+    check_engine(engine)
+    if y is not None:
+        return histogram2d(data, x, y, color=color, stat=stat, bins=bins, binwidth=binwidth, binrange=binrange, log_counts=log_counts, color_pal=color_pal, color_order=color_order, alpha=alpha, legend=legend, ax=ax)
+    if data is not None and not isinstance(data, DataFrame):
+        raise ValueError("Streamed data are only supported by bivariate histograms. Please provide both 'x' and 'y'.")
+
+    if color_pal is not None and color is None:
         single_color = color_pal[0]
     else:
         single_color = None
-    if color:
-        color_pal = color_seq_palette(color_val=data[color], users_palette=color_pal)
-
-    fig, ax = plt.subplots(figsize=(6, 6))
-    sns.histplot(
-        data=data, 
-        x=x, 
-        y=y, 
-        hue=color, 
-        alpha=alpha, 
-        stat=stat, 
-        bins=bins, 
-        binwidth=binwidth, 
-        palette=color_pal, 
-        hue_order=color_order, 
-        color=single_color if single_color else '#2271B5',
-        edgecolor=edgecolor, 
-        linewidth=1, 
-        ax=ax
-    )
+    if color is not None:
+        color_pal = color_seq_palette(color_val=variable_values(data, color), users_palette=color_pal, order=color_order)
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
+    if engine == 'native':
+        edges = bin_edges(variable_values(data, x).to_numpy(dtype=float), bins, binwidth, binrange)
+        ax = native_histogram(ax, data, x, color, color_order, stat, edges, color_pal, single_color, edgecolor, alpha)
+    else:
+        sns.histplot(
+            data=data, 
+            x=x, 
+            y=y, 
+            hue=color, 
+            alpha=alpha, 
+            stat=stat, 
+            bins=bins, 
+            binwidth=binwidth, 
+            palette=color_pal, 
+            hue_order=color_order, 
+            color=single_color if single_color else '#2271B5',
+            edgecolor=edgecolor, 
+            linewidth=1, 
+            ax=ax
+        )
     
     if legend:
         ax = legend_create(
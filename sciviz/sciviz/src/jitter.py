@@ -1,43 +1,58 @@
+from dataclasses import dataclass, field
 import matplotlib.pyplot as plt
 import seaborn as sns
+from .misc_utils import rasterize_artists, variable_values
 from .palettes import color_seq_palette
 from .legends import legend_create, legend_parameters
+from .specs import ParameterSpec
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CrossbarParameters(ParameterSpec):
+    """
+    The parameters of the crossbars of a jitter plot, as returned by crossbar_parameters(). See crossbar_parameters() for their description.
+
+    """
+    color_val: str = None
+    color_pal: list = field(default_factory=lambda: ['black'])
+    barstyle: str = '_'
+    barsize: float = 20
+    barwidth: float = 3
 
 
 def crossbar_parameters(color_val=None, color_pal=['black'], barstyle='_', barsize=20, barwidth=3):
     """
-    Returns a dictionary containing the parameters for a crossbar plot.
+    Returns the parameters for a crossbar plot.
 
     Args:
-        color_val (str, optional): The color value for the crossbar plot. Defaults to None.
+        color_val (str or array-like, optional): The color value for the crossbar plot. Defaults to None.
         color_pal (str, optional): The color palette for the crossbar plot. Defaults to ['black'].
         barstyle (str, optional): The style of the crossbar. Defaults to '_'.
         barsize (float, optional): The size of the crossbar. Defaults to 20.
         barwidth (float, optional): The width of the crossbar. Defaults to 3.
 
     Returns:
-        dict: A dictionary containing the crossbar parameters.
+        CrossbarParameters: The parameters of the crossbars, which can also be read as a dictionary.
 
     """
-    crossbar_params = {
-        'color_val': color_val,
-        'color_pal': color_pal, 
-        'barstyle': barstyle, 
-        'barsize': barsize,
-        'barwidth': barwidth,
-    }
-    return crossbar_params
+    return CrossbarParameters(
+        color_val=color_val,
+        color_pal=color_pal,
+        barstyle=barstyle,
+        barsize=barsize,
+        barwidth=barwidth
+    )
 
 
-def jitter(data, x, y, color=None, order=None, jitter=True, dodge=False, size=50, color_pal=None, color_order=None, orient='v', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), crossbar=None):
+def jitter(data, x, y, color=None, order=None, jitter=True, dodge=False, size=50, color_pal=None, color_order=None, orient='v', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), crossbar=None, ax=None, rasterize_layers=False):
     """
     Plots a jitter plot with optional crossbars.
 
     Args:
-        data (DataFrame): The input data.
-        x (str): The column name for the x-axis.
-        y (str): The column name for the y-axis.
-        color (str, optional): The column name for the color grouping. Defaults to None.
+        data (DataFrame): The input data. Can be None if the variables are given as arrays.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves.
+        color (str or array-like, optional): The column name for the color grouping, or the values themselves. Defaults to None.
         order (list, optional): The order of the x-axis categories. Defaults to None.
         jitter (bool, optional): Whether to apply jitter to the data points. Defaults to True.
         dodge (bool, optional): Whether to dodge the data points. Defaults to False.
@@ -48,25 +63,29 @@ def jitter(data, x, y, color=None, order=None, jitter=True, dodge=False, size=50
         alpha (float, optional): The transparency of the data points. Defaults to 0.8.
         legend (dict, optional): The parameters for the legend. Defaults to legend_parameters().
         crossbar (dict, optional): The parameters for the crossbars. Defaults to None.
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+        rasterize_layers (bool, optional): Whether to rasterize the points (crossbars stay vectors) in vector outputs (PDF, SVG), at the resolution passed to savefig, keeping axes, text and legends as vectors. Defaults to False.
 
     Returns:
         Axes: The matplotlib Axes object containing the plot.
 
     """
-    if color_pal is not None and color == None:
+    if color_pal is not None and color is None:
         single_color = color_pal[0]
     else:
         single_color = None
-    if color:
-        color_pal = color_seq_palette(color_val=data[color], users_palette=color_pal)
+    if color is not None:
+        color_pal = color_seq_palette(color_val=variable_values(data, color), users_palette=color_pal, order=color_order)
 
-    fig, ax = plt.subplots(figsize=(6, 6))
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
+    layers = (len(ax.collections), len(ax.lines))
 
     sns.stripplot(
         data=data, 
         x=x, 
         y=y, 
-        hue=color if color else (x if color_pal else None), 
+        hue=color if color is not None else (x if color_pal else None), 
         order=order, 
         hue_order=color_order, 
         jitter=jitter, 
@@ -80,12 +99,15 @@ def jitter(data, x, y, color=None, order=None, jitter=True, dodge=False, size=50
         ax=ax
     )
     
+    if rasterize_layers:
+        ax = rasterize_artists(ax, *layers)
+
     if crossbar:
         sns.pointplot(
             data=data, 
             x=x, 
             y=y, 
-            hue=crossbar['color_val'] if crossbar['color_val'] else (color if color else x),
+            hue=crossbar['color_val'] if crossbar['color_val'] is not None else (color if color is not None else x),
             palette=crossbar['color_pal'] if crossbar['color_pal'] else color_pal,
             dodge=0.4 if dodge else False, 
             linestyle="none", 
@@ -1,4 +1,65 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+import numpy as np
 import matplotlib.pyplot as plt
+from pandas import factorize
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import to_hex, to_rgba
+from .misc_utils import same_variable, variable_values
+from .palettes import color_seq_palette
+from .specs import ParameterSpec, freeze
+
+
+@lru_cache(maxsize=256)
+def legend_handles(colors=None, shapes=None, sizes=None):
+    """
+    Builds the proxy artists of a block of legend entries. Blocks are cached per palette, so that facet grids and batch jobs drawing the same legend reuse them.
+
+    Args:
+        colors (tuple, optional): The RGBA colors of the entries. Defaults to None (black markers).
+        shapes (tuple, optional): The markers of the entries. Defaults to None (circles).
+        sizes (tuple, optional): The marker sizes of the entries. Defaults to None (10).
+
+    Returns:
+        tuple: The handles of the entries.
+
+    Notes:
+        The handles are never drawn: matplotlib copies their properties into the artists of every legend, so the same handles can be shared by legends of different figures.
+
+    """
+    n = min(len(pal) for pal in (colors, shapes, sizes) if pal is not None)
+    handles = []
+    for i in range(n):
+        props = {'marker': shapes[i] if shapes else 'o', 'color': 'w' if colors else 'k', 'markersize': sizes[i] if sizes else 10}
+        if colors:
+            props['markerfacecolor'] = colors[i]
+        if shapes or sizes:
+            props['linestyle'] = ''
+        handles.append(plt.Line2D([0], [0], **props))
+    return tuple(handles)
+
+
+def palette_handles(color_pal=None, shape_pal=None, size_pal=None):
+    """
+    Returns the legend handles of the given palettes, from the cache of legend_handles when the palettes are hashable.
+
+    Args:
+        color_pal (list, optional): The color palette. Defaults to None.
+        shape_pal (list, optional): The shape palette. Defaults to None.
+        size_pal (dict, optional): The size palette, mapping the categories to marker areas. Defaults to None.
+
+    Returns:
+        tuple: The handles of the entries.
+
+    """
+    colors = tuple(to_rgba(color) for color in color_pal) if color_pal is not None else None
+    shapes = freeze(list(shape_pal)) if shape_pal is not None else None
+    sizes = tuple(int(size) / 12 for size in size_pal.values()) if size_pal is not None else None
+    try:
+        return legend_handles(colors, shapes, sizes)
+    except TypeError:  # unhashable markers (e.g. matplotlib.path.Path)
+        return legend_handles.__wrapped__(colors, shapes, sizes)
 
 def legend_color(color_val, color_pal, order, handles, labels):
     """
@@ -18,8 +79,7 @@ def legend_color(color_val, color_pal, order, handles, labels):
         color_labels = order
     else:
         color_labels = color_val.unique()
-    color_handles = [plt.Line2D([0], [0], marker='o', color='w', markerfacecolor=color, markersize=10) 
-                     for color in color_pal]
+    color_handles = palette_handles(color_pal=color_pal)
     handles.extend(color_handles)
     labels.extend(color_labels)
     return handles, labels
@@ -43,8 +103,7 @@ def legend_shape(shape_val, shape_pal, order, handles, labels):
         shape_labels = order
     else:
         shape_labels = shape_val.unique()
-    shape_handles = [plt.Line2D([0], [0], marker=shape, color='k', linestyle='', markersize=10) 
-                     for shape in shape_pal]
+    shape_handles = palette_handles(shape_pal=shape_pal)
     handles.extend(shape_handles)
     labels.extend(shape_labels)
     return handles, labels
@@ -68,8 +127,7 @@ def legend_size(size_val, size_pal, order, handles, labels):
         size_labels = order
     else:
         size_labels = size_val.unique()
-    size_handles = [plt.Line2D([0], [0], marker='o', color='k', linestyle='', markersize=int(size)/12) 
-                    for size in size_pal.values()]
+    size_handles = palette_handles(size_pal=size_pal)
     handles.extend(size_handles)
     labels.extend(size_labels)
     return handles, labels
@@ -94,8 +152,7 @@ def legend_colorshape(colorshape_val, color_pal, shape_pal, order, handles, labe
         colorshape_labels = order
     else:
         colorshape_labels = colorshape_val.unique()
-    colorshape_handles = [plt.Line2D([0], [0], marker=shape, color='w', linestyle='', markerfacecolor=color, markersize=10) 
-                          for color, shape in zip(color_pal, shape_pal)]
+    colorshape_handles = palette_handles(color_pal=color_pal, shape_pal=shape_pal)
     handles.extend(colorshape_handles)
     labels.extend(colorshape_labels)
     return handles, labels
@@ -120,8 +177,7 @@ def legend_colorsize(colorsize_val, color_pal, size_pal, order, handles, labels)
         colorsize_labels = order
     else:
         colorsize_labels = colorsize_val.unique()
-    colorsize_handles = [plt.Line2D([0], [0], marker='o', color='w', linestyle='', markerfacecolor=color, markersize=int(size)/12)
-                         for color, size in zip(color_pal, size_pal.values())]
+    colorsize_handles = palette_handles(color_pal=color_pal, size_pal=size_pal)
     handles.extend(colorsize_handles)
     labels.extend(colorsize_labels)
     return handles, labels
@@ -147,8 +203,7 @@ def legend_shapesize(shapesize_val, shape_pal, size_pal, order, handles, labels)
         shapesize_labels = order
     else:
         shapesize_labels = shapesize_val.unique()
-    shapesize_handles = [plt.Line2D([0], [0], marker=shape, color='k', linestyle='', markersize=int(size)/12)
-                         for shape, size in zip(shape_pal, size_pal.values())]
+    shapesize_handles = palette_handles(shape_pal=shape_pal, size_pal=size_pal)
     handles.extend(shapesize_handles)
     labels.extend(shapesize_labels)
     return handles, labels
@@ -174,8 +229,7 @@ def legend_colorshapesize(colorshapesize_val, color_pal, shape_pal, size_pal, or
         colorshapesize_labels = order
     else:
         colorshapesize_labels = colorshapesize_val.unique()
-    colorshapesize_handles = [plt.Line2D([0], [0], marker=shape, color='w', linestyle='', markerfacecolor=color, markersize=int(size)/12) 
-                     for color, shape, size in zip(color_pal, shape_pal, size_pal.values())]
+    colorshapesize_handles = palette_handles(color_pal=color_pal, shape_pal=shape_pal, size_pal=size_pal)
     handles.extend(colorshapesize_handles)
     labels.extend(colorshapesize_labels)
     return handles, labels
@@ -199,6 +253,59 @@ def legend_title(handles, labels, val):
     return handles, labels, val.name
 
 
+def legend_top(legend_type, val, pal, order, max_entries):
+    """
+    Keeps the most frequent categories of a legend when it has more than max_entries of them.
+    List palettes shorter than the categories are repeated (as when drawing), so that every kept category gets a handle.
+
+    Args:
+        legend_type (str): The type of the legend (e.g. 'color' or 'color_shape').
+        val (pandas.Series): The values of the legend variable.
+        pal (list, dict or None): The palette of the legend, or the list of palettes of a combined legend (e.g. [color_pal, shape_pal]).
+        order (list or None): The order of the categories.
+        max_entries (int or None): The maximum number of entries, including the entry grouping the other categories. If None, all categories are kept.
+
+    Returns:
+        tuple: The palette and the order restricted to the kept categories, and the number of categories grouped as other (0 if all are kept).
+
+    """
+    labels = list(order) if order else list(val.unique())
+    if max_entries and len(labels) > max_entries:
+        codes, uniques = factorize(val)
+        counts = dict(zip(uniques, np.bincount(codes[codes >= 0], minlength=len(uniques))))
+        keep = sorted(sorted(range(len(labels)), key=lambda i: -counts.get(labels[i], 0))[:max(max_entries - 1, 1)])
+    else:
+        keep = list(range(len(labels)))
+    n_other = len(labels) - len(keep)
+
+    def subset(palette):
+        if isinstance(palette, dict):
+            items = list(palette.items())
+            return dict(items[i] for i in keep) if n_other else palette
+        return [palette[i % len(palette)] for i in keep]  # palettes shorter than the categories cycle
+
+    pal = [subset(palette) for palette in pal] if '_' in legend_type else subset(pal)
+    return pal, [labels[i] for i in keep] if n_other else order, n_other
+
+
+def legend_other(handles, labels, other_label, n):
+    """
+    Adds the entry grouping the categories left out of a legend.
+
+    Args:
+        handles (list): A list of handles for the legend.
+        labels (list): A list of labels for the legend.
+        other_label (str): The label of the entry.
+        n (int): The number of categories grouped in the entry.
+
+    Returns:
+        tuple: A tuple containing the updated handles and labels lists.
+    """
+    handles.append(plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='lightgrey', markersize=10))
+    labels.append(f'{other_label} ({n})')
+    return handles, labels
+
+
 def legend_spacer(handles, labels):
     """
     Adds a spacer to the legend by appending an empty handle and label.
@@ -215,17 +322,47 @@ def legend_spacer(handles, labels):
     return handles, labels
 
 
+def legend_colorbar(ax, cmap, norm, title, legend):
+    """
+    Draws a colorbar in place of the color legend of a continuous color encoding.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object containing the plot.
+        cmap (matplotlib.colors.Colormap): The colormap of the color values.
+        norm (matplotlib.colors.Normalize): The normalization of the color values.
+        title (str or None): The name of the color variable.
+        legend (dict): The parameters of the legend.
+
+    Returns:
+        matplotlib.colorbar.Colorbar: The colorbar.
+
+    """
+    posx = legend['posx']
+    posy = legend['posy']
+    if legend['orient'] == 'v':
+        cax = ax.inset_axes([posx + 0.02, posy - 0.25, 0.03, 0.5])
+    else:
+        cax = ax.inset_axes([posx - 0.25, posy - 0.2, 0.5, 0.03])
+    cbar = ax.get_figure().colorbar(ScalarMappable(norm=norm, cmap=cmap), cax=cax, orientation='vertical' if legend['orient'] == 'v' else 'horizontal')
+    cbar.outline.set_visible(False)
+    cax.tick_params(labelsize=legend['label_size'])
+    leg_title = legend['title']
+    if leg_title:
+        cax.set_title(leg_title[0] if type(leg_title) in [list, tuple] else title, fontsize=legend['title_size'], fontweight='bold' if legend['title_bold'] else 'normal', loc='left')
+    return cbar
+
+
 def legend_order(data, color_val, color_pal, shape_val, shape_pal, size_val, size_pal):
     """
     Determines the order of legends to show based on the provided parameters.
 
     Args:
-        data (pandas.Series): The data used to create the plot.
-        color_val (str): The color value.
+        data (pandas.Series): The data used to create the plot. Can be None if the values are given as arrays.
+        color_val (str or array-like): The color value, or the color values themselves.
         color_pal (list): A list of color palettes.
-        shape_val (str): The shape value.
+        shape_val (str or array-like): The shape value, or the shape values themselves.
         shape_pal (list): A list of shape palettes.
-        size_val (str): The size value.
+        size_val (str or array-like): The size value, or the size values themselves.
         size_pal (list): A list of size palettes.
 
     Returns:
@@ -235,25 +372,25 @@ def legend_order(data, color_val, color_pal, shape_val, shape_pal, size_val, siz
     """
     legends_to_show = []
     if color_val is not None:
-        if shape_val is not None and color_val == shape_val:
-            if size_val is not None and color_val == size_val:
-                legends_to_show.append(('color_shape_size', data[color_val], [color_pal, shape_pal, size_pal]))
+        if same_variable(color_val, shape_val):
+            if same_variable(color_val, size_val):
+                legends_to_show.append(('color_shape_size', variable_values(data, color_val, 'color'), [color_pal, shape_pal, size_pal]))
             else:
-                legends_to_show.append(('color_shape', data[color_val], [color_pal, shape_pal]))
+                legends_to_show.append(('color_shape', variable_values(data, color_val, 'color'), [color_pal, shape_pal]))
                 
-        elif size_val is not None and color_val == size_val:
-            legends_to_show.append(('color_size', data[color_val], [color_pal, size_pal]))
+        elif same_variable(color_val, size_val):
+            legends_to_show.append(('color_size', variable_values(data, color_val, 'color'), [color_pal, size_pal]))
         else:
-            legends_to_show.append(('color', data[color_val], color_pal))
+            legends_to_show.append(('color', variable_values(data, color_val, 'color'), color_pal))
     
-    if shape_val is not None and shape_val != color_val:
-        if size_val is not None and shape_val == size_val:
-            legends_to_show.append(('shape_size', data[shape_val], [shape_pal, size_pal]))
+    if shape_val is not None and not same_variable(shape_val, color_val):
+        if same_variable(shape_val, size_val):
+            legends_to_show.append(('shape_size', variable_values(data, shape_val, 'shape'), [shape_pal, size_pal]))
         else:
-            legends_to_show.append(('shape', data[shape_val], shape_pal))
+            legends_to_show.append(('shape', variable_values(data, shape_val, 'shape'), shape_pal))
     
-    if type(size_val) not in [int, float, None] and size_val is not None and size_val != color_val and size_val != shape_val:
-        legends_to_show.append(('size', data[size_val], size_pal))
+    if size_val is not None and type(size_val) not in [int, float] and not same_variable(size_val, color_val) and not same_variable(size_val, shape_val):
+        legends_to_show.append(('size', variable_values(data, size_val, 'size'), size_pal))
     return legends_to_show
 
 
@@ -302,14 +439,14 @@ def legend_create(ax, data, color_val, color_pal, color_order, shape_val, shape_
 
     Args:
         ax (matplotlib.axes.Axes): The Axes object to add the legend to.
-        data (pandas.Series): The data used for creating the legend.
-        color_val (str): The color value for the legend.
+        data (pandas.Series): The data used for creating the legend. Can be None if the values are given as arrays.
+        color_val (str or array-like): The color value for the legend, or the color values themselves.
         color_pal (list): The color palette for the legend.
         color_order (list): The order of colors in the legend.
-        shape_val (str): The shape value for the legend.
+        shape_val (str or array-like): The shape value for the legend, or the shape values themselves.
         shape_pal (list): The shape palette for the legend.
         shape_order (list): The order of shapes in the legend.
-        size_val (str): The size value for the legend.
+        size_val (str or array-like): The size value for the legend, or the size values themselves.
         size_pal (list): The size palette for the legend.
         size_order (list): The order of sizes in the legend.
         legend (dict): A dictionary containing legend properties.
@@ -337,6 +474,16 @@ def legend_create(ax, data, color_val, color_pal, color_order, shape_val, shape_
     for (legend_type, val, pal) in legends_to_show:
         if cnt > 0:
             legend_spacer(handles, labels)
+        block_order = {
+            'color_shape_size': color_order if color_order else (shape_order if shape_order else size_order),
+            'color_shape': color_order if color_order else shape_order,
+            'color_size': color_order if color_order else size_order,
+            'shape_size': shape_order if shape_order else size_order,
+            'color': color_order,
+            'shape': shape_order,
+            'size': size_order
+        }[legend_type]
+        pal, block_order, n_other = legend_top(legend_type, val, pal, block_order, legend.get('max_entries'))
         if legend_type == 'color_shape_size':
             handles, labels, title = legend_title(handles, labels, val)
             titles.append(title)
@@ -345,7 +492,7 @@ def legend_create(ax, data, color_val, color_pal, color_order, shape_val, shape_
                 pal[0], 
                 pal[1], 
                 pal[2], 
-                color_order if color_order else (shape_order if shape_order else size_order), 
+                block_order, 
                 handles, 
                 labels
             )
@@ -356,7 +503,7 @@ def legend_create(ax, data, color_val, color_pal, color_order, shape_val, shape_
                 val, 
                 pal[0], 
                 pal[1], 
-                color_order if color_order else shape_order, 
+                block_order, 
                 handles, 
                 labels
             )
@@ -367,7 +514,7 @@ def legend_create(ax, data, color_val, color_pal, color_order, shape_val, shape_
                 val, 
                 pal[0], 
                 pal[1], 
-                color_order if color_order else size_order, 
+                block_order, 
                 handles, 
                 labels
             )
@@ -378,22 +525,24 @@ def legend_create(ax, data, color_val, color_pal, color_order, shape_val, shape_
                 val, 
                 pal[0], 
                 pal[1], 
-                shape_order if shape_order else size_order, 
+                block_order, 
                 handles, 
                 labels
             )
         elif legend_type == 'color':
             handles, labels, title = legend_title(handles, labels, val)
             titles.append(title)
-            handles, labels = legend_color(val, pal, color_order, handles, labels)
+            handles, labels = legend_color(val, pal, block_order, handles, labels)
         elif legend_type == 'shape':
             handles, labels, title = legend_title(handles, labels, val)
             titles.append(title)
-            handles, labels = legend_shape(val, pal, shape_order, handles, labels)
+            handles, labels = legend_shape(val, pal, block_order, handles, labels)
         elif legend_type == 'size':
             handles, labels, title = legend_title(handles, labels, val)
             titles.append(title)
-            handles, labels = legend_size(val, pal, size_order, handles, labels)
+            handles, labels = legend_size(val, pal, block_order, handles, labels)
+        if n_other:
+            handles, labels = legend_other(handles, labels, legend.get('other_label', 'Other'), n_other)
         cnt += 1
 
     legend = ax.legend(
@@ -411,9 +560,26 @@ def legend_create(ax, data, color_val, color_pal, color_order, shape_val, shape_
     return ax
 
 
-def legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11):
+@dataclass(frozen=True, slots=True, eq=False)
+class LegendParameters(ParameterSpec):
     """
-    Creates a dictionary of legend parameters.
+    The parameters of the legend, as returned by legend_parameters(). See legend_parameters() for their description.
+
+    """
+    orient: str = 'v'
+    posx: float = 1
+    posy: float = 0.5
+    title: bool = True
+    title_size: float = 12
+    title_bold: bool = False
+    label_size: float = 11
+    max_entries: int = None
+    other_label: str = 'Other'
+
+
+def legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11, max_entries=None, other_label='Other'):
+    """
+    Creates the legend parameters.
 
     Args:
         orient (str): The orientation of the legend ('horizontal' or 'vertical').
@@ -423,18 +589,83 @@ def legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, t
         title_size (int): The font size of the legend title.
         title_bold (bool): Whether the legend title should be bold or not.
         label_size (int): The font size of the legend labels.
+        max_entries (int, optional): The maximum number of entries per legend variable. Only the most frequent categories are shown, the others are grouped in a single entry. Defaults to None (all categories).
+        other_label (str, optional): The label of the entry grouping the other categories. Defaults to 'Other'.
+
+    Returns:
+        LegendParameters: The parameters of the legend, which can also be read as a dictionary.
+
+    """
+    return LegendParameters(
+        orient=orient,
+        posx=posx,
+        posy=posy,
+        title=title,
+        title_size=title_size,
+        title_bold=title_bold,
+        label_size=label_size,
+        max_entries=max_entries,
+        other_label=other_label
+    )
+
+
+@lru_cache(maxsize=128)
+def legend_page(labels, colors, title, ncol, label_size, dpi):
+    """
+    Renders one page of a color legend as a PNG image. Pages are cached, so that the same legend is only laid out once.
+
+    Args:
+        labels (tuple): The labels of the entries.
+        colors (tuple): The hex colors of the entries.
+        title (str or None): The title of the page.
+        ncol (int): The number of columns of the legend.
+        label_size (int): The font size of the labels.
+        dpi (int): The resolution of the image.
+
+    Returns:
+        bytes: The PNG image of the page.
+
+    """
+    handles = [plt.Line2D([0], [0], marker='o', color='w', markerfacecolor=color, markersize=10) for color in colors]
+    fig = plt.figure(figsize=(1, 1))
+    fig.legend(handles, labels, loc='center', ncol=ncol, frameon=False, title=title, fontsize=label_size, labelspacing=1, columnspacing=1)
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def legend_pages(data, color, color_pal=None, color_order=None, per_page=100, ncol=4, label_size=11, dpi=100):
+    """
+    Renders the full color legend of a plot as separate images, for color encodings with too many categories to fit next to the plot (see max_entries in legend_parameters).
+
+    Args:
+        data (pandas.DataFrame or None): The input data. Can be None if color is given as an array.
+        color (str or array-like): The column name of the color encoding, or the values themselves.
+        color_pal (list or str, optional): The color palette, as passed to the plot. Defaults to None.
+        color_order (list, optional): The order of the categories, as passed to the plot. Defaults to None.
+        per_page (int, optional): The number of entries per page. Defaults to 100.
+        ncol (int, optional): The number of columns of every page. Defaults to 4.
+        label_size (int, optional): The font size of the labels. Defaults to 11.
+        dpi (int, optional): The resolution of the images. Defaults to 100.
 
     Returns:
-        dict: A dictionary containing the legend parameters.
-
-    """
-    legend_params = {
-        'orient': orient, 
-        'posx': posx, 
-        'posy': posy, 
-        'title': title, 
-        'title_size': title_size, 
-        'title_bold': title_bold, 
-        'label_size': label_size
-    }
-    return legend_params
\ No newline at end of file
+        list: The PNG images of the pages, as bytes.
+
+    """
+    values = variable_values(data, color, 'color')
+    labels = list(color_order) if color_order is not None else list(values.unique())
+    colors = [to_hex(c) for c in color_seq_palette(color_val=values, users_palette=color_pal, order=color_order)]
+    colors = [colors[i % len(colors)] for i in range(len(labels))]  # palettes shorter than the categories cycle, as in the plot
+    n_pages = -(-len(labels) // per_page)
+    return [
+        legend_page(
+            tuple(str(label) for label in labels[start:start + per_page]),
+            tuple(colors[start:start + per_page]),
+            f'{values.name} ({page + 1}/{n_pages})' if n_pages > 1 else values.name,
+            ncol,
+            label_size,
+            dpi
+        )
+        for page, start in enumerate(range(0, len(labels), per_page))
+    ]
\ No newline at end of file
@@ -1,19 +1,147 @@
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from pandas import DataFrame
+from .bootstrap import resolve_errorbar
+from .misc_utils import iter_chunks
 from .palettes import set_order, set_palettes
 from .legends import legend_create, legend_parameters
+from .native import check_engine, cycle_palette, native_line
 
 
-def line(data, x, y, color=None, shape=None, stat='mean', errorbar=None, errorbar_style='bars', alpha=0.7, color_pal=None, shape_pal=None, color_order=None, shape_order=None, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11)):
+def merge_moments(table, part):
     """
-    Plots a line chart using the provided data.
+    Merges the sufficient statistics of two sets of groups, with the parallel formulas of Chan et al. for the mean and the sum of squared deviations.
 
     Args:
-        data (DataFrame): The input data.
-        x (str): The column name for the x-axis.
+        table (pandas.DataFrame): The statistics accumulated so far, as returned by line_accumulate().
+        part (pandas.DataFrame): The statistics of a new chunk.
+
+    Returns:
+        pandas.DataFrame: The merged statistics, with the groups in order of appearance.
+
+    """
+    index = table.index.append(part.index.difference(table.index, sort=False))
+    table, part = table.reindex(index), part.reindex(index)
+    count_a, count_b = table['count'].fillna(0).to_numpy(dtype=float), part['count'].fillna(0).to_numpy(dtype=float)
+    mean_a, mean_b = table['mean'].fillna(0).to_numpy(), part['mean'].fillna(0).to_numpy()
+    count = count_a + count_b
+    delta = mean_b - mean_a
+    merged = DataFrame(index=index)
+    merged['count'] = count.astype(np.int64)
+    merged['sum'] = table['sum'].fillna(0) + part['sum'].fillna(0)
+    merged['mean'] = mean_a + delta * count_b / count
+    merged['m2'] = table['m2'].fillna(0).to_numpy() + part['m2'].fillna(0).to_numpy() + delta ** 2 * count_a * count_b / count
+    merged['min'] = np.fmin(table['min'], part['min'])
+    merged['max'] = np.fmax(table['max'], part['max'])
+    return merged
+
+
+def line_accumulate(data, y, groups):
+    """
+    Accumulates the sufficient statistics of y (count, sum, mean, sum of squared deviations from the mean, min and max) per group, chunk by chunk.
+
+    Args:
+        data (pandas.DataFrame or iterable): A DataFrame, or an iterable of DataFrame chunks.
+        y (str): The column name for the y-axis.
+        groups (list): The column names defining the groups (e.g. [x, color, shape]).
+
+    Returns:
+        pandas.DataFrame: A DataFrame indexed by the groups, with the columns 'count', 'sum', 'mean', 'm2', 'min' and 'max'.
+
+    Notes:
+        The mean and the squared deviations of every chunk are merged with the previous ones rather than accumulating sums of squares, which would lose all precision for data with a large mean compared to their spread.
+
+    """
+    table = None
+    for chunk in iter_chunks(data):
+        chunk = chunk[groups + [y]].dropna(subset=[y])
+        grouped = chunk.groupby(groups, sort=False, observed=True)[y]
+        part = grouped.agg(['count', 'sum', 'mean', 'min', 'max'])
+        part['m2'] = grouped.var(ddof=0) * part['count']
+        table = part if table is None else merge_moments(table, part)
+    if table is None or table.empty:
+        raise ValueError("The streamed data hold no values of y to plot.")
+    return table
+
+
+def line_aggregate(table, y, stat, errorbar):
+    """
+    Computes the statistic and the error range of y per group from the accumulated sufficient statistics.
+
+    Args:
+        table (pandas.DataFrame): The sufficient statistics, as returned by line_accumulate().
         y (str): The column name for the y-axis.
-        color (str, optional): The column name for coloring the lines. Defaults to None.
-        shape (str, optional): The column name for shaping the lines. Defaults to None.
+        stat (str): The statistic to compute ('mean', 'sum', 'count', 'min' or 'max').
+        errorbar (str or tuple or None): 'sd' or 'se', or a tuple with one of them and a scaling factor (e.g. ('se', 2)).
+
+    Returns:
+        pandas.DataFrame: A DataFrame with one row per group, holding the group columns, y and, if errorbar is given, the lower and upper error limits ('ymin' and 'ymax').
+
+    """
+    if stat not in ['mean', 'sum', 'count', 'min', 'max']:
+        raise ValueError("Invalid stat option for streamed data. Please choose from 'mean', 'sum', 'count', 'min' or 'max'.")
+    count = table['count'].to_numpy(dtype=float)
+    result = DataFrame(index=table.index)
+    result[y] = table[stat]
+
+    if errorbar:
+        method, scale = (errorbar, 1) if type(errorbar) == str else errorbar
+        if method not in ['sd', 'se']:
+            raise ValueError("Invalid errorbar option for streamed data. Please choose from 'sd' or 'se'.")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spread = np.sqrt(table['m2'].to_numpy() / (count - 1))
+            if method == 'se':
+                spread = spread / np.sqrt(count)
+        result['ymin'] = result[y] - scale * spread
+        result['ymax'] = result[y] + scale * spread
+    return result.reset_index()
+
+
+def line_errorbars(ax, data, x, color, color_pal, color_order, errorbar_style, default_color):
+    """
+    Draws precomputed error ranges as bands or bars, with the color of their line.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object containing the line chart.
+        data (pandas.DataFrame): The aggregated data, as returned by line_aggregate().
+        x (str): The column name for the x-axis.
+        color (str or None): The column name for coloring the lines.
+        color_pal (list or None): The color palette of the lines, repeated if shorter than the order.
+        color_order (list or None): The order of colors. Groups left out of the order are not drawn.
+        errorbar_style (str): The style of error bars ('bars' or 'band').
+        default_color (str): The color of the error bars if there is no color encoding.
+
+    Returns:
+        matplotlib.axes.Axes: The modified Axes object.
+
+    """
+    if color is None:
+        groups = [(default_color, data)]
+    else:
+        # seaborn cycles the palette past its length and does not draw the levels left out of the order
+        colors = dict(zip(color_order, cycle_palette(color_pal, len(color_order))))
+        groups = [(colors[group], values) for group, values in data.groupby(color, sort=False, observed=True) if group in colors]
+    for group_color, values in groups:
+        values = values.sort_values(x)
+        if errorbar_style == 'band':
+            ax.fill_between(values[x], values['ymin'], values['ymax'], color=group_color, alpha=0.2, linewidth=0)
+        else:
+            ax.vlines(values[x], values['ymin'], values['ymax'], color=group_color)
+    return ax
+
+
+def line(data, x, y, color=None, shape=None, stat='mean', errorbar=None, errorbar_style='bars', alpha=0.7, color_pal=None, shape_pal=None, color_order=None, shape_order=None, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), ax=None, n_boot=1000, seed=0, engine='seaborn'):
+    """
+    Plots a line chart using the provided data.
+
+    Args:
+        data (DataFrame or iterable): The input data, or an iterable of DataFrame chunks. Chunks are aggregated per group with sufficient statistics, which supports the 'mean', 'sum', 'count', 'min' and 'max' stats and the 'sd' and 'se' errorbars.
+            Can be None if the variables are given as arrays.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves.
+        color (str or array-like, optional): The column name for coloring the lines, or the values themselves. Defaults to None.
+        shape (str or array-like, optional): The column name for shaping the lines, or the values themselves. Defaults to None.
         stat (str, optional): The statistical function to apply. Defaults to None.
         errorbar (str or tuple, optional): Name of errorbar method (either 'ci', 'pi', 'se', or 'sd'), 
             or a tuple with a method name and a level parameter. Defaults to None.
@@ -24,31 +152,56 @@ def line(data, x, y, color=None, shape=None, stat='mean', errorbar=None, errorba
         color_order (list, optional): The order of colors. Defaults to None.
         shape_order (list, optional): The order of shapes. Defaults to None.
         legend (dict, optional): The parameters for the legend. Defaults to legend_parameters().
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+        n_boot (int, optional): The number of bootstrap resamples for the 'ci' errorbar. Defaults to 1000.
+        seed (int, optional): The seed of the bootstrap, so that the 'ci' errorbar is identical across renders. Defaults to 0.
+        engine (str, optional): The drawing engine, 'seaborn' or 'native'. The native engine draws directly with matplotlib from the resolved sciviz palettes; plots with a shape encoding or errorbars are always drawn by seaborn. Defaults to 'seaborn'.
 
     Returns:
         Axes: The matplotlib Axes object containing the line chart.
 
     """
+    check_engine(engine)
+    streamed = data is not None and not isinstance(data, DataFrame)
+    if streamed:
+        groups = list(dict.fromkeys(group for group in [x, color, shape] if group is not None))
+        data = line_aggregate(line_accumulate(data, y, groups), y, stat, errorbar)
+        if color and color_order is None:
+            color_order = list(data[color].unique())
+        if shape and shape_order is None:
+            shape_order = list(data[shape].unique())
+        streamed_errorbar, stat, errorbar = errorbar, None, None
+    else:
+        errorbar = resolve_errorbar(errorbar, data, y, [x, color, shape], stat, n_boot=n_boot, seed=seed)
+
     color_order, shape_order, size_order = set_order(color=color, color_order=color_order, shape=shape, shape_order=shape_order, size=None, size_order=None)
-    color_pal, shape_pal, size_pal, size_num = set_palettes(data, color=color, shape=shape, size=None, color_pal=color_pal, shape_pal=shape_pal, size_pal=None)
-
-    fig, ax = plt.subplots(figsize=(6, 6))
-    sns.lineplot(
-        data=data, 
-        x=x, 
-        y=y, 
-        hue=color, 
-        style=shape,
-        palette=color_pal, 
-        hue_order=color_order,        
-        markers=shape_pal, 
-        style_order=shape_order, 
-        estimator=stat, 
-        errorbar=errorbar,
-        err_style=errorbar_style,
-        alpha=alpha, 
-        ax=ax
-    )
+    color_pal, shape_pal, size_pal, size_num = set_palettes(data, color=color, shape=shape, size=None, color_pal=color_pal, shape_pal=shape_pal, size_pal=None, color_order=color_order, shape_order=shape_order, size_order=size_order)
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
+    first_line = len(ax.lines)
+    if engine == 'native' and shape is None and errorbar is None:
+        ax = native_line(ax, data, x, y, color, color_order, color_pal, stat, alpha)
+    else:
+        sns.lineplot(
+            data=data, 
+            x=x, 
+            y=y, 
+            hue=color, 
+            style=shape,
+            palette=color_pal, 
+            hue_order=color_order,        
+            markers=shape_pal, 
+            style_order=shape_order, 
+            estimator=stat, 
+            errorbar=errorbar,
+            err_style=errorbar_style,
+            alpha=alpha, 
+            ax=ax
+        )
+
+    if streamed and streamed_errorbar:
+        ax = line_errorbars(ax, data, x, color, color_pal, color_order, errorbar_style, ax.lines[first_line].get_color())
 
     if legend:
         ax = legend_create(
@@ -0,0 +1,345 @@
+import os
+import numpy as np
+from pandas import DataFrame
+
+MATRIX_CHUNK_SIZE = 2 ** 22  # maximum number of matrix values loaded in memory at once
+APPROX_BLOCKS = 2000  # number of k-means blocks of the approximate row clustering
+
+
+def open_matrix(data):
+    """
+    Opens a matrix without loading it in memory.
+
+    Args:
+        data (str, os.PathLike or array-like): The path of a .npy file, or a matrix (e.g. numpy.memmap or a Zarr array).
+
+    Returns:
+        array-like: The matrix. .npy files are memory-mapped read-only.
+
+    """
+    if isinstance(data, (str, os.PathLike)):
+        return np.load(data, mmap_mode='r')
+    return data
+
+
+def block_edges(n, max_blocks):
+    """
+    Splits n consecutive rows (or columns) into at most max_blocks blocks of nearly equal size.
+
+    Args:
+        n (int): The number of rows.
+        max_blocks (int): The maximum number of blocks.
+
+    Returns:
+        numpy.ndarray: The edges of the blocks, from 0 to n.
+
+    """
+    return np.linspace(0, n, min(n, max_blocks) + 1).astype(int)
+
+
+def block_labels(labels, edges):
+    """
+    Returns the labels of blocks of rows (or columns). Blocks spanning several rows are labelled by their first and last row.
+
+    Args:
+        labels (array-like or None): The labels of the rows. If None, the rows are labelled by their index.
+        edges (numpy.ndarray): The edges of the blocks.
+
+    Returns:
+        list: The label of every block.
+
+    """
+    labels = np.arange(edges[-1]) if labels is None else np.asarray(labels)
+    return [labels[start] if stop - start == 1 else f'{labels[start]}..{labels[stop - 1]}' for start, stop in zip(edges[:-1], edges[1:])]
+
+
+def is_sparse(data):
+    """
+    Checks whether a matrix is a scipy.sparse matrix or array, without importing scipy.
+
+    Args:
+        data (object): The matrix.
+
+    Returns:
+        bool: True if the matrix is sparse.
+
+    """
+    return type(data).__module__.startswith('scipy.sparse')
+
+
+def block_indicator(edges):
+    """
+    Builds the sparse matrix averaging consecutive rows over blocks, i.e. with 1 / (block size) at (block, row) for every row of a block.
+
+    Args:
+        edges (numpy.ndarray): The edges of the blocks.
+
+    Returns:
+        scipy.sparse.csr_matrix: A matrix of shape (blocks, rows).
+
+    """
+    from scipy.sparse import csr_matrix
+    sizes = np.diff(edges)
+    blocks = np.repeat(np.arange(len(sizes)), sizes)
+    return csr_matrix((1 / sizes[blocks], (blocks, np.arange(edges[-1]))), shape=(len(sizes), edges[-1]))
+
+
+def reduce_sparse(matrix, row_edges, col_edges):
+    """
+    Averages a sparse matrix over blocks of rows and columns with two sparse products, without densifying it.
+
+    Args:
+        matrix (scipy.sparse matrix): The matrix.
+        row_edges (numpy.ndarray): The edges of the row blocks.
+        col_edges (numpy.ndarray): The edges of the column blocks.
+
+    Returns:
+        numpy.ndarray: The mean of every block, counting the implicit zeros.
+
+    """
+    return (block_indicator(row_edges) @ matrix.tocsr() @ block_indicator(col_edges).T).toarray()
+
+
+def sparse_linkage(matrix, method='average'):
+    """
+    Clusters the rows of a sparse matrix hierarchically on their Euclidean distances, computed from the sparse Gram matrix.
+
+    Args:
+        matrix (scipy.sparse matrix): The matrix whose rows are clustered.
+        method (str, optional): The linkage method. Defaults to 'average', as in seaborn's clustermap.
+
+    Returns:
+        numpy.ndarray: The linkage matrix.
+
+    """
+    from scipy.cluster.hierarchy import linkage
+    from scipy.spatial.distance import squareform
+    matrix = matrix.tocsr()
+    gram = (matrix @ matrix.T).toarray()
+    norms = np.diag(gram)
+    distances = np.sqrt(np.maximum(norms[:, None] + norms[None, :] - 2 * gram, 0))
+    np.fill_diagonal(distances, 0)
+    return linkage(squareform(distances, checks=False), method=method)
+
+
+def sparse_linkages(matrix, row_edges, col_edges, row_cluster=True, col_cluster=True):
+    """
+    Clusters the row and column blocks of a sparse matrix. Row blocks are compared over all columns and column blocks over all rows.
+
+    Args:
+        matrix (scipy.sparse matrix): The matrix.
+        row_edges (numpy.ndarray): The edges of the row blocks.
+        col_edges (numpy.ndarray): The edges of the column blocks.
+        row_cluster (bool, optional): Whether to cluster the row blocks. Defaults to True.
+        col_cluster (bool, optional): Whether to cluster the column blocks. Defaults to True.
+
+    Returns:
+        tuple: The linkage matrices of the row and column blocks (None if not clustered).
+
+    """
+    matrix = matrix.tocsr()
+    row_linkage = sparse_linkage(block_indicator(row_edges) @ matrix) if row_cluster and len(row_edges) > 2 else None
+    col_linkage = sparse_linkage(block_indicator(col_edges) @ matrix.T) if col_cluster and len(col_edges) > 2 else None
+    return row_linkage, col_linkage
+
+
+def chunk_rows(matrix):
+    """
+    Returns the number of rows read at once when reducing a matrix, aligned to the chunks of chunked arrays (e.g. Zarr).
+
+    Args:
+        matrix (array-like): The matrix.
+
+    Returns:
+        int: The number of rows per read.
+
+    """
+    step = max(1, MATRIX_CHUNK_SIZE // max(1, matrix.shape[1]))
+    chunks = getattr(matrix, 'chunks', None)
+    if isinstance(chunks, tuple) and len(chunks) == 2 and isinstance(chunks[0], (int, np.integer)):
+        step = max(chunks[0], step // chunks[0] * chunks[0])
+    return step
+
+
+def reduce_matrix(matrix, row_edges, col_edges, row_order=None):
+    """
+    Averages a matrix over blocks of rows and columns, reading it chunk by chunk so that it is never loaded in memory as a whole.
+
+    Args:
+        matrix (array-like): The matrix (e.g. numpy.memmap or a Zarr array). Non-finite values are ignored.
+        row_edges (numpy.ndarray): The edges of the row blocks.
+        col_edges (numpy.ndarray): The edges of the column blocks.
+        row_order (numpy.ndarray, optional): The order of the rows, e.g. from approx_row_order. Blocks are then taken over the reordered rows, still reading the matrix sequentially. Defaults to None.
+
+    Returns:
+        numpy.ndarray: The mean of every block, NaN for blocks without finite values.
+
+    """
+    sums = np.zeros((len(row_edges) - 1, len(col_edges) - 1))
+    counts = np.zeros_like(sums)
+    row_blocks = np.repeat(np.arange(len(row_edges) - 1), np.diff(row_edges))
+    if row_order is not None:
+        # block of every row at its position in the matrix
+        row_blocks[row_order] = row_blocks.copy()
+    step = chunk_rows(matrix)
+    for start in range(0, matrix.shape[0], step):
+        chunk = np.asarray(matrix[start:start + step], dtype=float)
+        finite = np.isfinite(chunk)
+        chunk_sums = np.add.reduceat(np.where(finite, chunk, 0), col_edges[:-1], axis=1)
+        chunk_counts = np.add.reduceat(finite.astype(float), col_edges[:-1], axis=1)
+        blocks = row_blocks[start:start + len(chunk)]
+        if row_order is not None:
+            by_block = np.argsort(blocks, kind='stable')
+            blocks, chunk_sums, chunk_counts = blocks[by_block], chunk_sums[by_block], chunk_counts[by_block]
+        # rows of a chunk are sorted by block, so each block is a contiguous run of rows
+        firsts = np.flatnonzero(np.diff(blocks, prepend=-1))
+        sums[blocks[firsts]] += np.add.reduceat(chunk_sums, firsts, axis=0)
+        counts[blocks[firsts]] += np.add.reduceat(chunk_counts, firsts, axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+
+def matrix_frame(data, row_labels=None, col_labels=None, max_rows=1000, max_cols=1000, row_order=None):
+    """
+    Reduces a large matrix to at most max_rows by max_cols blocks, i.e. to the resolution at which it is drawn.
+
+    Args:
+        data (str, os.PathLike or array-like): The path of a .npy file, or a matrix (e.g. numpy.memmap, a Zarr array or a scipy.sparse matrix).
+        row_labels (array-like, optional): The labels of the rows. Defaults to None.
+        col_labels (array-like, optional): The labels of the columns. Defaults to None.
+        max_rows (int, optional): The maximum number of rows of the reduced matrix. Defaults to 1000.
+        max_cols (int, optional): The maximum number of columns of the reduced matrix. Defaults to 1000.
+        row_order (numpy.ndarray, optional): The order of the rows, e.g. from approx_row_order. Not supported for sparse matrices. Defaults to None.
+
+    Returns:
+        tuple: The reduced matrix as a DataFrame, and the edges of its row and column blocks (over the reordered rows).
+
+    """
+    matrix = open_matrix(data)
+    if len(matrix.shape) != 2:
+        raise ValueError("Matrix input must be two-dimensional.")
+    row_edges = block_edges(matrix.shape[0], max_rows)
+    col_edges = block_edges(matrix.shape[1], max_cols)
+    if row_order is not None:
+        if is_sparse(matrix):
+            raise ValueError("Row orders are not supported for sparse matrices.")
+        row_labels = (np.arange(matrix.shape[0]) if row_labels is None else np.asarray(row_labels))[row_order]
+    frame = DataFrame(
+        reduce_sparse(matrix, row_edges, col_edges) if is_sparse(matrix) else reduce_matrix(matrix, row_edges, col_edges, row_order=row_order),
+        index=block_labels(row_labels, row_edges),
+        columns=block_labels(col_labels, col_edges)
+    )
+    return frame, row_edges, col_edges
+
+
+def finite_rows(matrix, rows):
+    """
+    Reads rows of a matrix as single-precision floats, with non-finite values replaced by 0.
+
+    Args:
+        matrix (array-like): The matrix.
+        rows (slice or numpy.ndarray): The rows to read. Integer arrays must be sorted, and are read through orthogonal indexing (oindex) for Zarr arrays.
+
+    Returns:
+        numpy.ndarray: The rows.
+
+    """
+    if isinstance(rows, slice) or isinstance(matrix, np.ndarray):
+        values = matrix[rows]
+    elif hasattr(matrix, 'oindex'):
+        values = matrix.oindex[rows]
+    else:
+        try:
+            values = matrix[rows]
+        except (TypeError, IndexError, ValueError) as error:
+            raise ValueError("Approximate row clustering requires a matrix supporting integer array indexing (e.g. numpy.memmap, a .npy file or a Zarr array).") from error
+    return np.nan_to_num(np.asarray(values, dtype=np.float32), nan=0, posinf=0, neginf=0)
+
+
+def nearest_centroids(chunk, centroids):
+    """
+    Assigns rows to their nearest centroid (Euclidean distance).
+
+    Args:
+        chunk (numpy.ndarray): The rows.
+        centroids (numpy.ndarray): The centroids.
+
+    Returns:
+        numpy.ndarray: The index of the nearest centroid of every row.
+
+    """
+    return np.argmin((centroids ** 2).sum(axis=1) - 2 * chunk @ centroids.T, axis=1)
+
+
+def minibatch_kmeans(matrix, n_clusters, batch_size=4096, n_iter=100, seed=0):
+    """
+    Clusters the rows of a matrix with mini-batch k-means, reading only a batch of rows at a time.
+
+    Args:
+        matrix (array-like): The matrix (e.g. numpy.ndarray, numpy.memmap or a Zarr array). Non-finite values are read as 0.
+        n_clusters (int): The number of clusters.
+        batch_size (int, optional): The number of rows of every batch. Defaults to 4096.
+        n_iter (int, optional): The number of batches. Defaults to 100.
+        seed (int, optional): The seed of the random sampling of the rows. Defaults to 0.
+
+    Returns:
+        numpy.ndarray: The centroids, of shape (n_clusters, columns).
+
+    """
+    rng = np.random.default_rng(seed)
+    n = matrix.shape[0]
+    centroids = finite_rows(matrix, np.sort(rng.choice(n, n_clusters, replace=False)))
+    counts = np.zeros(n_clusters)
+    for _ in range(n_iter):
+        batch = finite_rows(matrix, np.sort(rng.choice(n, min(batch_size, n), replace=False)))
+        labels = nearest_centroids(batch, centroids)
+        batch_counts = np.bincount(labels, minlength=n_clusters)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, batch)
+        counts += batch_counts
+        updated = batch_counts > 0
+        # every centroid moves towards the mean of its batch rows, with a learning rate decreasing with its count
+        rate = batch_counts[updated] / counts[updated]
+        centroids[updated] += rate[:, None] * (sums[updated] / batch_counts[updated, None] - centroids[updated])
+    return centroids
+
+
+def approx_row_order(matrix, n_blocks=APPROX_BLOCKS, method='average'):
+    """
+    Orders the rows of a large matrix approximately as hierarchical clustering would, in O(rows) time and memory.
+    The rows are pre-clustered into blocks with mini-batch k-means, the block centroids are clustered hierarchically, and the rows of every block are ordered along the direction from the previous to the next block.
+
+    Args:
+        matrix (array-like): The matrix (e.g. numpy.ndarray, numpy.memmap or a Zarr array), read chunk by chunk, except for the random batches of k-means. Non-finite values are read as 0.
+        n_blocks (int, optional): The number of k-means blocks. Defaults to APPROX_BLOCKS (2000).
+        method (str, optional): The linkage method of the centroids. Defaults to 'average', as in seaborn's clustermap.
+
+    Returns:
+        tuple: The order of the rows, the linkage matrix of the blocks, and the number of rows of every block, in the order of the leaves of the linkage.
+            If all the rows fall in a single block (e.g. identical rows), the rows keep their order and the linkage matrix is empty.
+
+    """
+    from scipy.cluster.hierarchy import leaves_list, linkage
+    n = matrix.shape[0]
+    centroids = minibatch_kmeans(matrix, min(n_blocks, n))
+    step = chunk_rows(matrix)
+    labels = np.concatenate([nearest_centroids(finite_rows(matrix, slice(start, start + step)), centroids) for start in range(0, n, step)])
+    used = np.flatnonzero(np.bincount(labels, minlength=len(centroids)))
+    if len(used) < 2:
+        return np.arange(n), np.empty((0, 4)), np.array([n])
+    centroids = centroids[used]
+    labels = np.searchsorted(used, labels)
+    block_linkage = linkage(centroids, method=method)
+    leaves = leaves_list(block_linkage)
+    rank = np.empty(len(leaves), dtype=int)
+    rank[leaves] = np.arange(len(leaves))
+    # direction of every block, from the previous to the next block along the leaves
+    previous = centroids[leaves[np.maximum(rank - 1, 0)]]
+    following = centroids[leaves[np.minimum(rank + 1, len(leaves) - 1)]]
+    directions = following - previous
+    scores = np.concatenate([
+        np.einsum('ij,ij->i', finite_rows(matrix, slice(start, start + step)) - centroids[labels[start:start + step]], directions[labels[start:start + step]])
+        for start in range(0, n, step)
+    ])
+    order = np.lexsort((scores, rank[labels]))
+    return order, block_linkage, np.bincount(labels)[leaves]
\ No newline at end of file
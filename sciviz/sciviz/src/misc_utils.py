@@ -1,3 +1,9 @@
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection, QuadMesh
+from matplotlib.figure import Figure
+from pandas import DataFrame, Index, Series
+
 def alpha_fill(ax, alpha):
     """
     Set the transparency of objects without chaninging their edge color.
@@ -42,15 +48,156 @@ def count_values_ordered(data, color, order):
     Counts the occurrences of each unique value in the specified column of a DataFrame and returns the counts in the specified order.
 
     Args:
-        data (pandas.DataFrame): The DataFrame containing the data.
-        color (str): The name of the column to count the values from.
+        data (pandas.DataFrame or None): The DataFrame containing the data, or None if color is an array.
+        color (str or array-like): The name of the column to count the values from, or the values themselves.
         order (list or None): The desired order of the values. If None, the values will be returned in the default order.
 
     Returns:
         tuple: A tuple containing two lists. The first list contains the unique values in the specified order, and the second list contains the corresponding counts.
 
     """
-    counts = data[color].value_counts()
+    counts = variable_values(data, color, 'color').value_counts()
     if order is not None:
         counts = counts.reindex(order)
-    return counts.index.tolist(), counts.values.tolist()
\ No newline at end of file
+    return counts.index.tolist(), counts.values.tolist()
+
+
+def iter_chunks(data):
+    """
+    Iterates over the data in chunks, so that plots can be built from inputs that do not fit in memory.
+
+    Args:
+        data (pandas.DataFrame, iterable or None): A DataFrame, or an iterable of DataFrame chunks (e.g. the reader returned by pandas.read_csv(..., chunksize=n)). None when the variables are given as arrays.
+
+    Yields:
+        pandas.DataFrame or None: The next chunk of the data. A DataFrame (or None) is yielded as a single chunk.
+
+    """
+    if data is None or isinstance(data, DataFrame):
+        yield data
+    else:
+        for chunk in data:
+            yield chunk
+
+
+def figure_of(plot):
+    """
+    Returns the matplotlib Figure on which a plot is drawn.
+
+    Args:
+        plot (object): A Figure, an Axes object (or an array of Axes objects, as returned by facet), a seaborn ClusterGrid (as returned by heatmap) or a Venn diagram.
+
+    Returns:
+        matplotlib.figure.Figure: The Figure of the plot.
+
+    """
+    if isinstance(plot, Figure):
+        return plot
+    if isinstance(plot, Axes):
+        return plot.get_figure()
+    if isinstance(plot, np.ndarray):
+        return figure_of(plot.flat[0])
+    if isinstance(getattr(plot, 'figure', None), Figure):
+        return plot.figure
+    for patch in getattr(plot, 'patches', []):  # Venn diagrams only keep references to their patches
+        if patch is not None:
+            return patch.get_figure()
+    raise ValueError("Could not find the figure of the plot.")
+
+
+def is_vector(var):
+    """
+    Checks whether a plot variable (e.g. x, color) is given as values rather than as a column name.
+
+    Args:
+        var (object): The plot variable.
+
+    Returns:
+        bool: True if the variable is a numpy array, a pandas Series or Index, or a list.
+
+    """
+    return isinstance(var, (np.ndarray, Series, Index, list))
+
+
+def variable_values(data, var, name=None):
+    """
+    Returns the values of a plot variable, given either as a column name of data or directly as an array.
+
+    Args:
+        data (pandas.DataFrame or None): The input data. Can be None if var is an array.
+        var (str or array-like or None): The column name, or the values of the variable.
+        name (str, optional): The name given to unnamed arrays, shown as the legend title. Defaults to None.
+
+    Returns:
+        pandas.Series or None: The values of the variable. Arrays are wrapped without copying them.
+
+    """
+    if var is None:
+        return None
+    if not is_vector(var):
+        return data[var]
+    if isinstance(var, Series):
+        return var if var.name is not None or name is None else var.rename(name)
+    return Series(var, name=name, copy=False)
+
+
+def variable_name(var, default=None):
+    """
+    Returns the name of a plot variable, used for axis labels and legend titles.
+
+    Args:
+        var (str or array-like or None): The column name, or the values of the variable.
+        default (str, optional): The name returned for unnamed arrays. Defaults to None.
+
+    Returns:
+        str or None: The column name, the name of a pandas Series, or default.
+
+    """
+    if not is_vector(var):
+        return var
+    name = getattr(var, 'name', None)
+    return name if name is not None else default
+
+
+def same_variable(a, b):
+    """
+    Checks whether two plot variables encode the same values (e.g. color=x). Arrays are compared by identity rather than element-wise.
+
+    Args:
+        a (str or array-like or None): The first plot variable.
+        b (str or array-like or None): The second plot variable.
+
+    Returns:
+        bool: True if both variables are given and refer to the same column or array.
+
+    """
+    if a is None or b is None:
+        return False
+    if is_vector(a) or is_vector(b):
+        return a is b
+    return a == b
+
+
+def rasterize_artists(ax, n_collections=0, n_lines=0):
+    """
+    Rasterizes the data-heavy artists of a plot in vector outputs (PDF, SVG): markers (e.g. the points of scatter and strip plots, or box plot outliers) and heatmap cells. Axes, text, legends and the other artists stay vectors.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object containing the plot.
+        n_collections (int, optional): The number of collections of the Axes drawn before the plot, which are left unchanged. Defaults to 0.
+        n_lines (int, optional): The number of lines of the Axes drawn before the plot, which are left unchanged. Defaults to 0.
+
+    Returns:
+        matplotlib.axes.Axes: The modified axes object.
+
+    Notes:
+        The rasterized layers are drawn at the resolution passed to savefig (dpi).
+
+    """
+    for collection in ax.collections[n_collections:]:
+        if isinstance(collection, (PathCollection, QuadMesh)):
+            collection.set_rasterized(True)
+    for line in ax.lines[n_lines:]:
+        if line.get_linestyle() == 'None' and line.get_marker() not in [None, '', ' ', 'None', 'none']:
+            line.set_rasterized(True)
+    return ax
\ No newline at end of file
@@ -0,0 +1,354 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
+from pandas import Categorical, DataFrame
+from seaborn.utils import desaturate
+from .facet import category_order
+from .misc_utils import same_variable, variable_name, variable_values
+
+
+def check_engine(engine):
+    """
+    Checks the drawing engine of a plot.
+
+    Args:
+        engine (str): The drawing engine, 'seaborn' or 'native'.
+
+    """
+    if engine not in ['seaborn', 'native']:
+        raise ValueError("Invalid engine option. Please choose from 'seaborn' or 'native'.")
+
+
+def default_color(single_color=None):
+    """
+    Returns the color of a plot without color encoding, the same for all native plots.
+
+    Args:
+        single_color (str, optional): The color set by the user. Defaults to None.
+
+    Returns:
+        str: single_color if set, otherwise '#2271B5', the first color of the sciviz palette.
+
+    """
+    return single_color if single_color else '#2271B5'
+
+
+def hue_levels(values, order):
+    """
+    Returns the levels of a color encoding, in the order used by seaborn.
+
+    Args:
+        values (pandas.Series): The color values.
+        order (list or None): The order given by the user.
+
+    Returns:
+        list: The levels.
+
+    """
+    return list(order) if order is not None else category_order(values.dropna())
+
+
+def hue_codes(values, levels):
+    """
+    Maps color values to the index of their level, vectorized.
+
+    Args:
+        values (pandas.Series): The color values.
+        levels (list): The levels.
+
+    Returns:
+        numpy.ndarray: The index of the level of every value, -1 for missing values and values not in the levels.
+
+    """
+    return Categorical(values, categories=levels).codes
+
+
+def cycle_palette(color_pal, n):
+    """
+    Repeats a palette to n colors, as seaborn does when a palette has fewer colors than levels.
+
+    Args:
+        color_pal (list): The palette.
+        n (int): The number of levels.
+
+    Returns:
+        list: The n colors.
+
+    """
+    return [color_pal[i % len(color_pal)] for i in range(n)]
+
+
+def native_bar(ax, data, x, y, color, order, color_order, stat, color_pal, orient, width, fill, edgecolor):
+    """
+    Draws a bar plot directly with matplotlib, one bar container per color level as seaborn does.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object to draw the plot onto.
+        data (pandas.DataFrame or None): The input data.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves.
+        color (str, array-like or None): The column name for the color encoding, or the values themselves.
+        order (list or None): The order of the categories.
+        color_order (list or None): The order of the color levels.
+        stat (str or function): The statistic of every bar.
+        color_pal (list or None): The resolved color palette.
+        orient (str): The orientation of the plot ('v' or 'h').
+        width (float): The width of the bars of a category.
+        fill (bool): Whether to fill the bars with color.
+        edgecolor (str or None): The color of the bar edges. If None, the color of the bar.
+
+    Returns:
+        matplotlib.axes.Axes: The Axes object containing the bar plot.
+
+    """
+    value, category = (y, x) if orient == 'v' else (x, y)
+    frame = DataFrame({'category': variable_values(data, category).to_numpy(), 'value': variable_values(data, value).to_numpy()})
+    if color is not None:
+        frame['hue'] = variable_values(data, color).to_numpy()
+    frame = frame.dropna()
+    levels = list(order) if order is not None else category_order(frame['category'])
+    hues = hue_levels(frame['hue'], color_order) if color is not None else [None]
+    colors = [desaturate(hue_color, 0.75) for hue_color in (cycle_palette(color_pal, len(hues)) if color is not None else [default_color()])]  # seaborn's default saturation of bars
+    dodge = color is not None and not same_variable(color, category)
+    bar_width = width / len(hues) if dodge else width
+
+    if color is None:
+        stats = {None: frame.groupby('category', sort=False)['value'].agg(stat)}
+    else:
+        stats = dict(tuple(frame.groupby('hue', sort=False, observed=True)))
+        stats = {hue: subset.groupby('category', sort=False)['value'].agg(stat) for hue, subset in stats.items()}
+    draw = ax.bar if orient == 'v' else ax.barh
+    for j, (hue, hue_color) in enumerate(zip(hues, colors)):
+        heights = stats.get(hue)
+        if heights is None:
+            heights = frame['value'].iloc[:0]
+        heights = heights[heights.index.isin(levels)]
+        positions = np.array([levels.index(level) for level in heights.index], dtype=float)
+        if dodge:
+            positions += -width / 2 + bar_width * (j + 0.5)
+        draw(
+            positions,
+            heights.to_numpy(dtype=float),
+            bar_width,
+            color=hue_color if fill else 'none',
+            edgecolor=edgecolor if edgecolor is not None else hue_color,
+            linewidth=1,
+            align='center'
+        )
+
+    ticks, labels = range(len(levels)), [str(level) for level in levels]
+    if orient == 'v':
+        ax.set_xticks(ticks, labels)
+        ax.set_xlim(-0.5, len(levels) - 0.5)
+        ax.xaxis.grid(False)
+    else:
+        ax.set_yticks(ticks, labels)
+        ax.set_ylim(len(levels) - 0.5, -0.5)
+        ax.yaxis.grid(False)
+    ax.set_xlabel(variable_name(x, ''))
+    ax.set_ylabel(variable_name(y, ''))
+    return ax
+
+
+def native_histogram(ax, data, x, color, color_order, stat, edges, color_pal, single_color, edgecolor, alpha):
+    """
+    Draws a histogram directly with matplotlib, as a single collection of bars per color level.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object to draw the plot onto.
+        data (pandas.DataFrame or None): The input data.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        color (str, array-like or None): The column name for the color encoding, or the values themselves.
+        color_order (list or None): The order of the color levels.
+        stat (str): The statistic of the bins ('count', 'frequency', 'probability', 'proportion', 'percent' or 'density'), normalized over all levels as seaborn does.
+        edges (numpy.ndarray): The bin edges.
+        color_pal (list or None): The resolved color palette.
+        single_color (str or None): The color of the bars without color encoding.
+        edgecolor (str): The color of the edges of the bars.
+        alpha (float): The transparency of the bars.
+
+    Returns:
+        matplotlib.axes.Axes: The Axes object containing the histogram.
+
+    """
+    values = variable_values(data, x).to_numpy(dtype=float)
+    finite = np.isfinite(values)
+    if color is None:
+        layers = [(values[finite], default_color(single_color))]
+    else:
+        levels = hue_levels(variable_values(data, color), color_order)
+        codes = hue_codes(variable_values(data, color), levels)
+        finite &= codes >= 0
+        layers = [(values[finite & (codes == i)], level_color) for i, level_color in enumerate(cycle_palette(color_pal, len(levels)))]
+    total = finite.sum()
+    widths = np.diff(edges)
+
+    # seaborn draws the first level on top
+    for level_values, level_color in reversed(layers):
+        heights, _ = np.histogram(level_values, bins=edges)
+        heights = heights.astype(float)
+        if stat == 'frequency':
+            heights /= widths
+        elif stat in ['probability', 'proportion']:
+            heights /= total
+        elif stat == 'percent':
+            heights *= 100 / total
+        elif stat == 'density':
+            heights /= total * widths
+        verts = np.empty((len(heights), 4, 2))
+        verts[:, [0, 1], 0] = edges[:-1, None]
+        verts[:, [2, 3], 0] = edges[1:, None]
+        verts[:, [0, 3], 1] = 0
+        verts[:, 1, 1] = verts[:, 2, 1] = heights
+        bars = PolyCollection(verts, facecolors=level_color, edgecolors=edgecolor, linewidths=1, alpha=alpha)
+        bars.sticky_edges.y.append(0)
+        ax.add_collection(bars)
+    ax.autoscale_view()
+    ax.set_xlabel(variable_name(x, ''))
+    ax.set_ylabel(stat.capitalize())
+    return ax
+
+
+def native_point(ax, data, x, y, color, color_order, color_pal, single_color, single_shape, size, alpha):
+    """
+    Draws a scatter plot directly with matplotlib, as a single collection colored by a vectorized palette lookup.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object to draw the plot onto.
+        data (pandas.DataFrame or None): The input data.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves.
+        color (str, array-like or None): The column name for the color encoding, or the values themselves.
+        color_order (list or None): The order of the color levels.
+        color_pal (list or None): The resolved color palette.
+        single_color (str or None): The color of the markers without color encoding.
+        single_shape (str or None): The shape of the markers.
+        size (float): The size of the markers.
+        alpha (float): The transparency of the markers.
+
+    Returns:
+        matplotlib.axes.Axes: The Axes object containing the scatter plot.
+
+    """
+    xs = variable_values(data, x).to_numpy(dtype=float)
+    ys = variable_values(data, y).to_numpy(dtype=float)
+    valid = np.isfinite(xs) & np.isfinite(ys)
+    if color is None:
+        colors = default_color(single_color)
+    else:
+        levels = hue_levels(variable_values(data, color), color_order)
+        codes = hue_codes(variable_values(data, color), levels)
+        valid &= codes >= 0
+        colors = to_rgba_array(cycle_palette(color_pal, len(levels)))[codes[valid]]
+    ax.scatter(
+        xs[valid],
+        ys[valid],
+        s=size,
+        c=colors,
+        marker=single_shape if single_shape else 'o',
+        alpha=alpha,
+        edgecolors='w',
+        linewidths=0.08 * np.sqrt(plt.rcParams['lines.markersize'] ** 2)
+    )
+    ax.set_xlabel(variable_name(x, ''))
+    ax.set_ylabel(variable_name(y, ''))
+    return ax
+
+
+def native_line(ax, data, x, y, color, color_order, color_pal, stat, alpha):
+    """
+    Draws a line plot directly with matplotlib, one line per color level.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object to draw the plot onto.
+        data (pandas.DataFrame or None): The input data.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves.
+        color (str, array-like or None): The column name for the color encoding, or the values themselves.
+        color_order (list or None): The order of the color levels.
+        color_pal (list or None): The resolved color palette.
+        stat (str, function or None): The statistic of y at every x. If None, the values are drawn as they are, sorted by x.
+        alpha (float): The transparency of the lines.
+
+    Returns:
+        matplotlib.axes.Axes: The Axes object containing the line plot.
+
+    """
+    frame = DataFrame({'x': variable_values(data, x).to_numpy(), 'y': variable_values(data, y).to_numpy()})
+    if color is not None:
+        frame['hue'] = variable_values(data, color).to_numpy()
+    frame = frame.dropna()
+    if color is None:
+        layers = [(frame, default_color())]
+    else:
+        subsets = dict(tuple(frame.groupby('hue', sort=False, observed=True)))
+        levels = hue_levels(frame['hue'], color_order)
+        layers = [(subsets[level], level_color) for level, level_color in zip(levels, cycle_palette(color_pal, len(levels))) if level in subsets]
+    for subset, line_color in layers:
+        values = subset.sort_values('x', kind='stable') if stat is None else subset.groupby('x')['y'].agg(stat).reset_index()
+        ax.plot(values['x'].to_numpy(), values['y'].to_numpy(), color=line_color, alpha=alpha)
+    ax.set_xlabel(variable_name(x, ''))
+    ax.set_ylabel(variable_name(y, ''))
+    return ax
+
+
+def continuous_point(ax, data, x, y, color, color_pal, color_order, cmap, norm, shape, shape_pal, shape_order, sizes, alpha):
+    """
+    Draws a scatter plot with continuous color or size encodings, mapping every encoding in a single vectorized step.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object to draw the plot onto.
+        data (pandas.DataFrame or None): The input data.
+        x (str or array-like): The column name for the x-axis, or the values themselves.
+        y (str or array-like): The column name for the y-axis, or the values themselves.
+        color (str, array-like or None): The column name for the color encoding, or the values themselves.
+        color_pal (list, str or None): The resolved color palette of a categorical color encoding, or the single color of the markers.
+        color_order (list or None): The order of the color levels of a categorical color encoding.
+        cmap (matplotlib.colors.Colormap or None): The colormap of a continuous color encoding. None for a categorical color encoding.
+        norm (matplotlib.colors.Normalize or None): The normalization of a continuous color encoding.
+        shape (str, array-like or None): The column name for the shape encoding, or the values themselves.
+        shape_pal (list or None): The resolved shape palette, or the single shape of the markers (e.g. ['s']) if there is no shape encoding.
+        shape_order (list or None): The order of the shape levels.
+        sizes (float or numpy.ndarray): The fixed marker size, or the marker size of every point (NaN to skip a point).
+        alpha (float): The transparency of the markers.
+
+    Returns:
+        matplotlib.axes.Axes: The Axes object containing the scatter plot, with one collection per shape.
+
+    """
+    xs = variable_values(data, x).to_numpy(dtype=float)
+    ys = variable_values(data, y).to_numpy(dtype=float)
+    valid = np.isfinite(xs) & np.isfinite(ys)
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=float), xs.shape)
+    valid &= np.isfinite(sizes)
+    if color is None:
+        colors = np.broadcast_to(to_rgba_array(color_pal if color_pal else default_color()), (len(xs), 4))
+    elif cmap is not None:
+        colors = variable_values(data, color).to_numpy(dtype=float)
+        valid &= np.isfinite(colors)
+    else:
+        levels = hue_levels(variable_values(data, color), color_order)
+        codes = hue_codes(variable_values(data, color), levels)
+        valid &= codes >= 0
+        colors = to_rgba_array(cycle_palette(color_pal, len(levels)))[codes]
+    if shape is None:
+        layers = [(valid, shape_pal[0] if shape_pal and shape_pal[0] else 'o')]
+    else:
+        codes = hue_codes(variable_values(data, shape), hue_levels(variable_values(data, shape), shape_order))
+        layers = [(valid & (codes == i), marker) for i, marker in enumerate(shape_pal)]
+    for mask, marker in layers:
+        ax.scatter(
+            xs[mask],
+            ys[mask],
+            s=sizes[mask],
+            c=colors[mask],
+            marker=marker,
+            alpha=alpha,
+            edgecolors='w',
+            linewidths=0.08 * np.sqrt(plt.rcParams['lines.markersize'] ** 2),
+            **({'cmap': cmap, 'norm': norm} if cmap is not None else {})
+        )
+    ax.set_xlabel(variable_name(x, ''))
+    ax.set_ylabel(variable_name(y, ''))
+    return ax
@@ -1,21 +1,30 @@
+import numpy as np
 import seaborn as sns
+from matplotlib.colors import LinearSegmentedColormap, Normalize
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from .misc_utils import same_variable, variable_values
 
-def color_seq_palette(color_val, users_palette=None):
+CONTINUOUS_LEVELS = 20  # numeric color and size encodings with more unique values are mapped continuously
+SIZE_LEGEND_LEVELS = 4  # number of representative sizes shown in the legend of a continuous size encoding
+
+def color_seq_palette(color_val, users_palette=None, order=None):
     """
     Generates a sequential color palette based on the given color values.
 
     Args:
         color_val (pandas.Series): A series of color values.
         users_palette (list, optional): A custom color palette provided by the user. Defaults to None.
+        order (list, optional): The order of the color values. If given, one color is generated per value in the order, even if it is absent from color_val. Defaults to None.
 
     Returns:
         list: A sequential color palette.
 
     """
+    n = len(order) if order is not None else len(color_val.unique())
     if type(users_palette) == list:
-        if len(color_val.unique()) > len(users_palette):
+        if n > len(users_palette):
             # cycle the user-defined palette if it has fewer colors than the unique values in color_val
-            color_pal = users_palette * (len(color_val.unique()) // len(users_palette)) + users_palette[:len(color_val.unique()) % len(users_palette)]
+            color_pal = users_palette * (n // len(users_palette)) + users_palette[:n % len(users_palette)]
             color_pal = sns.color_palette(color_pal)
         else:
             color_pal = users_palette
@@ -23,7 +32,7 @@ def color_seq_palette(color_val, users_palette=None):
     elif type(users_palette) == str:
         color_pal = users_palette
         color_pal = sns.color_palette(color_pal)
-    elif len(color_val.unique()) > 10 and users_palette is None:
+    elif n > 10 and users_palette is None:
         color_pal = sns.color_palette('deep')
     else:
         minimal = [
@@ -39,7 +48,7 @@ def color_seq_palette(color_val, users_palette=None):
             '#7E6148'
         ]
         color_pal = sns.color_palette(minimal)
-    return color_pal[:len(color_val.unique())]
+    return color_pal[:n]
 
 
 def color_cont_palette(users_palette):
@@ -47,17 +56,58 @@ def color_cont_palette(users_palette):
     Returns a color palette for continuous data.
 
     Args:
-        users_palette (str): The name of the color palette to use.
+        users_palette (str or list): The name of the color palette to use, or a list of colors interpolated linearly.
 
     Returns:
         color_pal (matplotlib.colors.Colormap): The color palette as a matplotlib colormap object.
 
     """
+    if type(users_palette) == list:
+        return LinearSegmentedColormap.from_list('sciviz', users_palette)
     color_pal = sns.color_palette(users_palette, as_cmap=True)
     return color_pal
 
 
-def shape_palette(shape_val, users_palette=None):
+def is_continuous(values, scale='auto'):
+    """
+    Checks whether a color or size encoding is mapped continuously (a colormap, or interpolated sizes) rather than one color or size per value.
+
+    Args:
+        values (pandas.Series): A series of color or size values.
+        scale (str, optional): 'categorical', 'continuous', or 'auto' to map numeric values with more than CONTINUOUS_LEVELS unique values continuously. Defaults to 'auto'.
+
+    Returns:
+        bool: True if the encoding is continuous.
+
+    """
+    if scale not in ['auto', 'categorical', 'continuous']:
+        raise ValueError("Invalid scale option. Please choose from 'auto', 'categorical' or 'continuous'.")
+    if scale != 'auto':
+        return scale == 'continuous'
+    if is_bool_dtype(values) or not is_numeric_dtype(values):
+        return False
+    return values.nunique() > CONTINUOUS_LEVELS
+
+
+def color_norm(color_val):
+    """
+    Returns the normalization of continuous color values to the [0, 1] range of a colormap.
+
+    Args:
+        color_val (pandas.Series): A series of color values.
+
+    Returns:
+        matplotlib.colors.Normalize: The normalization from the smallest to the largest finite value.
+
+    """
+    values = color_val.to_numpy(dtype=float)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return Normalize(0, 1)
+    return Normalize(values.min(), values.max())
+
+
+def shape_palette(shape_val, users_palette=None, order=None):
     """
     Generates a shape palette based on the unique values in the shape_val parameter.
 
@@ -65,6 +115,7 @@ def shape_palette(shape_val, users_palette=None):
         shape_val (pandas.Series): A pandas Series containing shape values.
         users_palette (list, optional): A list of shape markers to use as the palette. 
             If not provided, a default palette will be used.
+        order (list, optional): The order of the shape values. If given, one shape is generated per value in the order. Defaults to None.
 
     Returns:
         list: A list of shape markers from the palette, corresponding to the unique values in shape_val.
@@ -73,10 +124,10 @@ def shape_palette(shape_val, users_palette=None):
         shape_pal = users_palette
     else:
         shape_pal = ['o', 's', '^', 'X', 'd']
-    return shape_pal[:len(shape_val.unique())]
+    return shape_pal[:len(order) if order is not None else len(shape_val.unique())]
 
 
-def size_palette(size_val, min_size, max_size):
+def size_palette(size_val, min_size, max_size, order=None):
     """
     Generates a size palette dictionary based on the unique values in `size_val`.
 
@@ -84,54 +135,99 @@ def size_palette(size_val, min_size, max_size):
         size_val (pandas.Series): A pandas Series containing the size values.
         min_size (float): The minimum size value for the palette.
         max_size (float): The maximum size value for the palette.
-        order (list, optional): A list specifying the order of size labels. Defaults to None.
+        order (list, optional): A list specifying the order of size labels. If given, one size is generated per label in the order. Defaults to None.
 
     Returns:
         dict: A dictionary mapping size labels to corresponding size values.
 
     """
-    n = len(size_val.unique())
-    sizes = []
-    for i in range(n):  # generate n size values between min_size and max_size
-        size = min_size + (max_size - min_size) * i / (n - 1)
-        sizes.append(size)
-    
-    size_labels = size_val.unique()
-    size_pal = {val: size for val, size in zip(size_labels, sizes)}
+    size_labels = order if order is not None else size_val.unique()
+    sizes = np.linspace(min_size, max_size, len(size_labels)).tolist()
+    size_pal = dict(zip(size_labels, sizes))
     return size_pal
 
 
-def set_palettes(data, color, shape, size, color_pal, shape_pal, size_pal):
+def size_interp(size_val, min_size, max_size):
+    """
+    Maps continuous size values to marker sizes with a single linear interpolation over the column.
+
+    Args:
+        size_val (pandas.Series): A series of numeric size values.
+        min_size (float): The marker size of the smallest value.
+        max_size (float): The marker size of the largest value.
+
+    Returns:
+        numpy.ndarray: The marker size of every value, NaN for missing values.
+
+    """
+    values = size_val.to_numpy(dtype=float)
+    norm = color_norm(size_val)
+    sizes = np.interp(values, [norm.vmin, norm.vmax], [min_size, max_size])
+    sizes[~np.isfinite(values)] = np.nan
+    return sizes
+
+
+def size_quantiles(size_val, min_size, max_size, n=SIZE_LEGEND_LEVELS):
+    """
+    Returns a few representative sizes of a continuous size encoding, at evenly spaced quantiles of the values, for its legend.
+
+    Args:
+        size_val (pandas.Series): A series of numeric size values.
+        min_size (float): The marker size of the smallest value.
+        max_size (float): The marker size of the largest value.
+        n (int, optional): The number of representative sizes. Defaults to SIZE_LEGEND_LEVELS.
+
+    Returns:
+        dict: A dictionary mapping the labels of the representative values to their marker sizes, in the format of size_palette. The labels have 3 significant digits, or more if needed to tell the values apart.
+
+    """
+    values = size_val.to_numpy(dtype=float)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return {}
+    levels = np.unique(np.quantile(values, np.linspace(0, 1, n)))
+    sizes = np.interp(levels, [values.min(), values.max()], [min_size, max_size])
+    for digits in range(3, 18):  # 17 significant digits tell any two distinct doubles apart
+        labels = [f'{level:.{digits}g}' for level in levels]
+        if len(set(labels)) == len(labels):
+            break
+    return dict(zip(labels, sizes))
+
+
+def set_palettes(data, color, shape, size, color_pal, shape_pal, size_pal, color_order=None, shape_order=None, size_order=None):
     """
     Set the palettes for color, shape, and size based on the provided data and user preferences.
 
     Args:
-        data (pandas Dataframe): pandas DataFrame containing the data.
-        color (str): Column name for color values.
-        shape (str): Column name for shape values.
-        size (str): Column name for size values.
+        data (pandas Dataframe or None): pandas DataFrame containing the data, or None if the variables are arrays.
+        color (str or array-like): Column name for color values, or the values themselves.
+        shape (str or array-like): Column name for shape values, or the values themselves.
+        size (str, array-like or number): Column name for size values, the values themselves, or a fixed marker size.
         color_pal (list or None): User-defined color palette.
         shape_pal (list or None): User-defined shape palette.
         size_pal (list or None): User-defined size palette.
+        color_order (list or None): The order of the color values. Defaults to None.
+        shape_order (list or None): The order of the shape values. Defaults to None.
+        size_order (list or None): The order of the size values. Defaults to None.
 
     Returns:
         tuple: Color palette for the plot, shape palette for the plot, size palette for the plot, and a boolean indicating whether the size values are numeric or not.
 
     """
-    if color:
-        color_pal = color_seq_palette(color_val=data[color], users_palette=color_pal)
+    if color is not None:
+        color_pal = color_seq_palette(color_val=variable_values(data, color), users_palette=color_pal, order=color_order)
     else:
         color_pal = None
 
-    if shape:
-        shape_pal = shape_palette(shape_val=data[shape], users_palette=shape_pal)
+    if shape is not None:
+        shape_pal = shape_palette(shape_val=variable_values(data, shape), users_palette=shape_pal, order=shape_order)
     else:
         shape_pal = None
 
     size_num = False
-    if type(size) not in [int, float, None] and size != None:
-        size_pal = size_palette(size_val=data[size], min_size=size_pal[0], max_size=size_pal[1])  
-    elif size == None: 
+    if size is not None and type(size) not in [int, float]:
+        size_pal = size_palette(size_val=variable_values(data, size), min_size=size_pal[0], max_size=size_pal[1], order=size_order)  
+    elif size is None: 
         size_pal = None       
     else:
         size_pal = None
@@ -159,7 +255,7 @@ def set_order(color, color_order, shape, shape_order, size, size_order):
         Among the remaining parameters, 'shape' is prioritized over 'size'.
 
     """
-    if color == shape and color == size:
+    if same_variable(color, shape) and same_variable(color, size):
         if color_order is not None:
             shape_order = color_order
             size_order = color_order
@@ -170,19 +266,19 @@ def set_order(color, color_order, shape, shape_order, size, size_order):
             color_order = size_order
             shape_order = size_order
 
-    elif color == shape:
+    elif same_variable(color, shape):
         if color_order is not None:
             shape_order = color_order
         else:
             color_order = shape_order
 
-    elif color == size:
+    elif same_variable(color, size):
         if color_order is not None:
             size_order = color_order
         else:
             color_order = size_order
 
-    elif shape == size:
+    elif same_variable(shape, size):
         if shape_order is not None:
             size_order = shape_order
         else:
@@ -1,31 +1,53 @@
+from dataclasses import dataclass
 import matplotlib.pyplot as plt
-from .misc_utils import count_values_ordered 
+from .misc_utils import count_values_ordered, variable_values
 from .palettes import color_seq_palette
 from .legends import legend_create, legend_parameters
+from .specs import ParameterSpec
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LabelParameters(ParameterSpec):
+    """
+    The parameters of the labels of a plot, as returned by label_parameters(). See label_parameters() for their description.
+
+    """
+    size: float = 12
+    color: str = 'black'
 
 
 def label_parameters(size=12, color='black'):
     """
-    Returns a dictionary of label parameters.
+    Returns the label parameters.
 
     Args:
         size (int, optional): The font size of the label. Defaults to 12.
         color (str, optional): The color of the label. Defaults to 'black'.
 
     Returns:
-        dict: A dictionary containing the label parameters.
+        LabelParameters: The parameters of the labels, which can also be read as a dictionary.
+
+    """
+    return LabelParameters(
+        size=size,
+        color=color
+    )
+
 
+@dataclass(frozen=True, slots=True, eq=False)
+class TextParameters(ParameterSpec):
     """
-    label_params = {
-        'size': size,
-        'color': color
-    }
-    return label_params
+    The parameters of the texts of a pie chart, as returned by text_parameters(). See text_parameters() for their description.
+
+    """
+    format: str = '%1.1f%%'
+    size: float = 11
+    color: str = 'black'
 
 
 def text_parameters(format='%1.1f%%', size=11, color='black'):
     """
-    Returns a dictionary of text parameters.
+    Returns the text parameters.
 
     Args:
         format (str, optional): The format string for text. Defaults to '%1.1f%%'.
@@ -33,24 +55,23 @@ def text_parameters(format='%1.1f%%', size=11, color='black'):
         color (str, optional): The text color. Defaults to 'black'.
 
     Returns:
-        dict: A dictionary containing the text parameters.
+        TextParameters: The parameters of the texts, which can also be read as a dictionary.
 
     """
-    text_params = {
-        'format': format,
-        'size': size,
-        'color': color
-    }
-    return text_params
+    return TextParameters(
+        format=format,
+        size=size,
+        color=color
+    )
 
 
-def pie(data, color, order=None, color_pal=None, labels=None, text=None, alpha=0.7, donut=False, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11)):
+def pie(data, color, order=None, color_pal=None, labels=None, text=None, alpha=0.7, donut=False, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), ax=None):
     """
     Creates a pie chart based on the given data.
 
     Args:
-        data (DataFrame): The input data.
-        color (str): The column name of the data to be used for coloring the pie slices.
+        data (DataFrame): The input data. Can be None if color is given as an array.
+        color (str or array-like): The column name of the data to be used for coloring the pie slices, or the values themselves.
         order (list, optional): The order in which the pie slices should be displayed. Defaults to None.
         color_pal (list, optional): The color palette to be used for coloring the pie slices. Defaults to None.
         labels (dict, optional): The labels configuration for the pie chart. Defaults to None.
@@ -58,13 +79,14 @@ def pie(data, color, order=None, color_pal=None, labels=None, text=None, alpha=0
         alpha (float, optional): The transparency of the pie slices. Defaults to 0.8.
         donut (bool, optional): If True, creates a donut chart instead of a regular pie chart. Defaults to False.
         legend (dict, optional): The legend configuration for the pie chart. Defaults to legend_parameters().
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
 
     Returns:
         ax (Axes): The matplotlib Axes object containing the pie chart.
 
     """
-    if color:
-        color_pal = color_seq_palette(color_val=data[color], users_palette=color_pal)
+    if color is not None:
+        color_pal = color_seq_palette(color_val=variable_values(data, color), users_palette=color_pal)
 
     labels_val, values = count_values_ordered(data, color, order)
 
@@ -73,7 +95,8 @@ def pie(data, color, order=None, color_pal=None, labels=None, text=None, alpha=0
         text_size = text['size']
         text_color = text['color']
 
-    fig, ax = plt.subplots(figsize=(6, 6))
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
     patches, texts, autotexts = ax.pie(
         x=values, 
         labels=labels_val if labels else None, 
@@ -91,8 +114,7 @@ def pie(data, color, order=None, color_pal=None, labels=None, text=None, alpha=0
 
     if donut == True:
         my_circle=plt.Circle( (0,0), 0.7, color='white')
-        p = plt.gcf()
-        p.gca().add_artist(my_circle)
+        ax.add_artist(my_circle)
     if labels != None:
         for text in range(len(texts)):
             texts[text].set_fontsize(label_size)
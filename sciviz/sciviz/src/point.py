@@ -1,71 +1,118 @@
 import matplotlib.pyplot as plt
 import seaborn as sns
-from .palettes import set_order, set_palettes
-from .legends import legend_create, legend_parameters
+from pandas.api.types import is_numeric_dtype
+from .misc_utils import rasterize_artists, variable_name, variable_values
+from .palettes import color_cont_palette, color_norm, is_continuous, set_order, set_palettes, size_interp, size_quantiles
+from .legends import legend_colorbar, legend_create, legend_parameters
+from .native import check_engine, continuous_point, native_point
 
-def point(data, x, y, color=None, shape=None, size=50, alpha=0.7, color_pal=None, shape_pal=None, size_pal=[50, 150], color_order=None, shape_order=None, size_order=None, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11)):
+def point(data, x, y, color=None, shape=None, size=50, alpha=0.7, color_pal=None, shape_pal=None, size_pal=[50, 150], color_order=None, shape_order=None, size_order=None, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), ax=None, engine='seaborn', color_scale='auto', size_scale='auto', rasterize_layers=False):
     """
     Create a scatter plot of x vs y with varying marker color, shape, and size.
 
     Args:
-        data (pandas Dataframe): pandas DataFrame containing the data.
-        x (str): Column name representing the x-axis values.
-        y (str): Column name representing the y-axis values.
-        color (str): Column name representing the color values. Default is None.
-        shape (str): Column name representing the shape values. Default is None.
-        size (str or int): Size of the markers. Either integer or column name or index representing the size values. Default is 50.
+        data (pandas Dataframe): pandas DataFrame containing the data. Can be None if the variables are given as arrays.
+        x (str or array-like): Column name representing the x-axis values, or the values themselves.
+        y (str or array-like): Column name representing the y-axis values, or the values themselves.
+        color (str or array-like): Column name representing the color values, or the values themselves. Default is None.
+        shape (str or array-like): Column name representing the shape values, or the values themselves. Default is None.
+        size (str, array-like or int): Size of the markers. Either integer or column name or index representing the size values, or the size values themselves. Default is 50.
         alpha (float): Transparency of the markers. Default is 0.8.
-        color_pal (str, list or None): Color palette for the color values. Default is None.
+        color_pal (str, list or None): Color palette for the color values. For continuous color values, the name of a colormap or a list of colors to interpolate. Default is None ('viridis' for continuous color values).
         shape_pal (str, list or None): Shape palette for the shape values. Default is None.
-        size_pal (list or None): The limits for the size values in size palette (e.g., (size_min, size_max)). Default is [50, 150].
+        size_pal (list or None): The limits for the size values in size palette (e.g., (size_min, size_max)). Continuous size values are interpolated linearly between them. Default is [50, 150].
         color_order (list or None): Order of the color values. Default is None.
         shape_order (list or None): Order of the shape values. Default is None.
         size_order (list or None): Order of the size values. Default is None.
         legend (dict, optional): The parameters for the legend. Defaults to legend_parameters().
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+        engine (str, optional): The drawing engine, 'seaborn' or 'native'. The native engine draws directly with matplotlib from the resolved sciviz palettes; plots with shape or size encodings are always drawn by seaborn. Defaults to 'seaborn'.
+        color_scale (str, optional): 'categorical' for one color per value, 'continuous' for a colormap and a colorbar, or 'auto' to use a colormap for numeric color values with many unique values. Defaults to 'auto'.
+        size_scale (str, optional): 'categorical' for one size per value, 'continuous' for sizes interpolated over the range of the values with a legend of a few quantiles, or 'auto' to interpolate numeric size values with many unique values. Defaults to 'auto'.
+        rasterize_layers (bool, optional): Whether to rasterize the points in vector outputs (PDF, SVG), at the resolution passed to savefig, keeping axes, text and legends as vectors. Defaults to False.
 
     Returns:
         matplotlib.axes.Axes: The matplotlib Axes object containing the scatter plot.
 
+    Raises:
+        ValueError: If color_scale or size_scale is 'continuous' and the color or size values are not numeric.
+
     """
+    check_engine(engine)
     color_order, shape_order, size_order = set_order(color=color, color_order=color_order, shape=shape, shape_order=shape_order, size=size, size_order=size_order)
-    if color_pal is not None and color == None:
+    if color_pal is not None and color is None:
         single_color = color_pal[0]
     else:
         single_color = None
-    if shape_pal is not None and shape == None:
+    if shape_pal is not None and shape is None:
         single_shape = shape_pal[0]
     else:
         single_shape = None
-    color_pal, shape_pal, size_pal, size_num = set_palettes(data, color=color, shape=shape, size=size, color_pal=color_pal, shape_pal=shape_pal, size_pal=size_pal)
+    continuous = color is not None and is_continuous(variable_values(data, color), color_scale)
+    if continuous and not is_numeric_dtype(variable_values(data, color)):
+        raise ValueError("Invalid color_scale option for non-numeric color values. Please choose from 'auto' or 'categorical'.")
+    if continuous:
+        # one colormap for all values, instead of one palette entry and one legend entry per unique value
+        cmap = color_cont_palette(users_palette=color_pal if color_pal is not None else 'viridis')
+        norm = color_norm(variable_values(data, color))
+    continuous_size = size is not None and type(size) not in [int, float] and is_continuous(variable_values(data, size), size_scale)
+    if continuous_size and not is_numeric_dtype(variable_values(data, size)):
+        raise ValueError("Invalid size_scale option for non-numeric size values. Please choose from 'auto' or 'categorical'.")
+    if continuous_size:
+        # sizes interpolated over the column, and a legend of a few representative sizes
+        sizes = size_interp(variable_values(data, size), size_pal[0], size_pal[1])
+        size_legend = size_quantiles(variable_values(data, size), size_pal[0], size_pal[1])
+    color_pal, shape_pal, size_pal, size_num = set_palettes(data, color=None if continuous else color, shape=shape, size=None if continuous_size else size, color_pal=color_pal, shape_pal=shape_pal, size_pal=size_pal, color_order=color_order, shape_order=shape_order, size_order=size_order)
     
-    fig, ax = plt.subplots(figsize=(6, 6))
-    sns.scatterplot(
-        data=data,
-        x=x,
-        y=y,
-        hue=color,
-        size=None if size_num else size,
-        style=shape,
-        alpha=alpha,
-        color=single_color if single_color else '#2271B5',
-        marker=single_shape if single_shape else 'o',
-        palette=color_pal,
-        markers=shape_pal,
-        sizes=size_pal,
-        hue_order=color_order,
-        style_order=shape_order,
-        size_order=size_order,
-        ax=ax
-    )
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
+    layers = (len(ax.collections), len(ax.lines))
+    if continuous or continuous_size:
+        if continuous_size:
+            size_pal, size_order = size_legend, list(size_legend)
+        elif size is None:
+            sizes = plt.rcParams['lines.markersize'] ** 2
+        else:
+            sizes = size if size_num else variable_values(data, size).map(size_pal).to_numpy(dtype=float)
+        ax = continuous_point(ax, data, x, y, color, single_color if color is None else color_pal, color_order, cmap if continuous else None, norm if continuous else None, shape, shape_pal if shape is not None else [single_shape], shape_order, sizes, alpha)
+    elif engine == 'native' and shape is None and size_num:
+        ax = native_point(ax, data, x, y, color, color_order, color_pal, single_color, single_shape, size, alpha)
+    else:
+        sns.scatterplot(
+            data=data,
+            x=x,
+            y=y,
+            hue=color,
+            size=None if size_num else size,
+            style=shape,
+            alpha=alpha,
+            color=single_color if single_color else '#2271B5',
+            marker=single_shape if single_shape else 'o',
+            palette=color_pal,
+            markers=shape_pal,
+            sizes=size_pal,
+            hue_order=color_order,
+            style_order=shape_order,
+            size_order=size_order,
+            ax=ax
+        )
 
     if size_num:
         ax.collections[0].set_sizes([size])
     
+    if rasterize_layers:
+        ax = rasterize_artists(ax, *layers)
+
+    if legend and continuous:
+        legend_colorbar(ax, cmap, norm, variable_name(color, 'color'), legend)
+        if shape is not None or (size is not None and not size_num):
+            # the shape and size legends go next to the colorbar
+            legend = {**legend, 'posx': legend['posx'] + 0.25} if legend['orient'] == 'v' else {**legend, 'posy': legend['posy'] - 0.15}
     if legend:
         ax = legend_create(
             ax=ax,
             data=data,
-            color_val=color,
+            color_val=None if continuous else color,
             color_pal=color_pal,
             color_order=color_order,
             shape_val=shape,
@@ -0,0 +1,105 @@
+from collections.abc import Mapping
+from io import BytesIO
+import matplotlib.pyplot as plt
+from .bar import bar
+from .boxplot import boxplot
+from .heatmap import heatmap
+from .histogram import histogram
+from .jitter import jitter
+from .line import line
+from .misc_utils import figure_of
+from .pie import pie
+from .point import point
+from .shared import SharedData, plot_columns
+from .specs import SPEC_VERSION, decode_value, loads_spec, resolve_data
+from .venn import venn
+from .violin import violin
+
+PLOTS = {
+    'bar': bar,
+    'boxplot': boxplot,
+    'heatmap': heatmap,
+    'histogram': histogram,
+    'jitter': jitter,
+    'line': line,
+    'pie': pie,
+    'point': point,
+    'venn': venn,
+    'violin': violin
+}
+
+
+def plot_function(plot):
+    """
+    Returns the sciviz plot function with the given name.
+
+    Args:
+        plot (str or function): The name of the plot function (e.g. 'bar'), or the function itself.
+
+    Returns:
+        function: The plot function.
+
+    """
+    if callable(plot):
+        return plot
+    if plot not in PLOTS:
+        raise ValueError(f"Invalid plot option. Please choose from {', '.join(repr(name) for name in PLOTS)}.")
+    return PLOTS[plot]
+
+
+def render_bytes(plot, format='png', dpi=100, **kwargs):
+    """
+    Draws a plot and returns it encoded as an image. The figure is closed afterwards.
+
+    Args:
+        plot (str or function): The name of the plot function (e.g. 'bar'), or the function itself.
+        format (str, optional): The image format (e.g. 'png', 'svg' or 'pdf'). Defaults to 'png'.
+        dpi (int, optional): The resolution of the image. Defaults to 100.
+        **kwargs: The arguments passed to the plot function (e.g. data, x, y). Shared data (see share_data) are mapped from shared memory, reading only the columns used by the plot.
+
+    Returns:
+        bytes: The encoded image.
+
+    """
+    if isinstance(kwargs.get('data'), SharedData):
+        kwargs['data'] = kwargs['data'].frame(plot_columns(kwargs['data'], kwargs))
+    fig = figure_of(plot_function(plot)(**kwargs))
+    buffer = BytesIO()
+    fig.savefig(buffer, format=format, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+
+def render(spec, data_resolver=None, format='png', dpi=100, spec_format=None):
+    """
+    Renders a serialized plot spec, as built by plot_spec, and returns it encoded as an image.
+
+    Args:
+        spec (dict, str or bytes): The plot spec, or its serialization (as returned by dumps_spec).
+        data_resolver (function or dict, optional): Resolves the reference to the data held by the spec, either a function mapping the reference to the data or a dictionary of named data. Defaults to resolve_data, which reads parquet, Arrow and csv files and Arrow IPC buffers.
+        format (str, optional): The image format (e.g. 'png', 'svg' or 'pdf'). Defaults to 'png'.
+        dpi (int, optional): The resolution of the image. Defaults to 100.
+        spec_format (str, optional): The serialization format of the spec, 'json' or 'msgpack'. If None, bytes that do not start with '{' are read as msgpack, and anything else as JSON. Defaults to None.
+
+    Returns:
+        bytes: The encoded image.
+
+    """
+    if isinstance(spec, (str, bytes, bytearray, memoryview)):
+        if spec_format is None:
+            # msgpack specs are maps, whose first byte is never '{'
+            spec_format = 'json' if isinstance(spec, str) or bytes(spec[:64]).lstrip()[:1] in [b'{', b''] else 'msgpack'
+        spec = loads_spec(bytes(spec) if isinstance(spec, (bytearray, memoryview)) else spec, format=spec_format)
+    if spec.get('version', SPEC_VERSION) > SPEC_VERSION:
+        raise ValueError(f"Unsupported plot spec version {spec['version']}. Please upgrade sciviz.")
+    if data_resolver is None:
+        data_resolver = resolve_data
+    ref = spec.get('data')
+    if ref is None:
+        data = None
+    elif isinstance(data_resolver, Mapping):
+        data = data_resolver[ref]
+    else:
+        data = data_resolver(ref)
+    return render_bytes(spec['plot'], format=format, dpi=dpi, data=data, **decode_value(spec.get('args', {})))
\ No newline at end of file
@@ -0,0 +1,77 @@
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+from PIL import Image
+from .export import draw_rgba
+from .misc_utils import figure_of
+
+
+def pdf_report(plots, path, metadata=None):
+    """
+    Writes plots into a single multi-page PDF, one plot per page. Every figure is closed as soon as its page is written.
+
+    Args:
+        plots (iterable): The plots to write, as returned by the sciviz functions (or matplotlib Figures).
+            Pass a generator to create every plot only when its page is written, so that memory stays flat regardless of the number of pages.
+        path (str): The path of the PDF file.
+        metadata (dict, optional): The metadata of the PDF file (e.g. {'Title': 'Nightly report'}). Defaults to None.
+
+    Returns:
+        int: The number of pages written.
+
+    """
+    pages = 0
+    with PdfPages(path, metadata=metadata) as pdf:
+        for plot in plots:
+            fig = figure_of(plot)
+            pdf.savefig(fig, bbox_inches='tight')
+            plt.close(fig)
+            pages += 1
+    return pages
+
+
+def sprite_report(plots, path, ncols=10, nrows=10, tile_size=(300, 300), dpi=100, compress_level=6):
+    """
+    Tiles plots into sprite sheets, i.e. PNG images holding a grid of plots. Every figure is closed as soon as it is tiled.
+
+    Args:
+        plots (iterable): The plots to tile, as returned by the sciviz functions (or matplotlib Figures).
+            Pass a generator to create every plot only when it is tiled, so that memory stays flat regardless of the number of plots.
+        path (str): The path of the sprite sheets, with a placeholder for the sheet number (e.g. 'report_{}.png'). A ValueError is raised if it has none.
+        ncols (int, optional): The number of plots per row of a sheet. Defaults to 10.
+        nrows (int, optional): The number of plots per column of a sheet. Defaults to 10.
+        tile_size (tuple, optional): The size of a tile in pixels (e.g., (width, height)). Plots are scaled down to fit their tile. Defaults to (300, 300).
+        dpi (int, optional): The resolution at which the plots are rendered. Defaults to 100.
+        compress_level (int, optional): The zlib compression level of the sheets, from 0 (fastest) to 9 (smallest). Defaults to 6.
+
+    Returns:
+        list: The paths of the sprite sheets written. The i-th plot is found on sheet i // (ncols * nrows), at row (i % (ncols * nrows)) // ncols and column i % ncols.
+
+    """
+    if path.format(0) == path.format(1):
+        raise ValueError("Invalid path option. Please include a placeholder for the sheet number (e.g. 'report_{}.png').")
+    per_sheet = ncols * nrows
+    paths = []
+    sheet = None
+    count = 0
+    for plot in plots:
+        fig = figure_of(plot)
+        tile = Image.fromarray(draw_rgba(fig, dpi=dpi, bbox_inches='tight'))  # tight bounding box, as for the PDF report
+        plt.close(fig)
+        tile.thumbnail(tile_size)
+
+        if sheet is None:
+            sheet = Image.new('RGBA', (ncols * tile_size[0], nrows * tile_size[1]), 'white')
+        row, col = divmod(count % per_sheet, ncols)
+        sheet.paste(tile, (col * tile_size[0] + (tile_size[0] - tile.width) // 2, row * tile_size[1] + (tile_size[1] - tile.height) // 2))
+        count += 1
+
+        if count % per_sheet == 0:
+            paths.append(path.format(len(paths)))
+            sheet.save(paths[-1], compress_level=compress_level)
+            sheet = None
+
+    if sheet is not None:
+        rows_used = (count % per_sheet - 1) // ncols + 1
+        paths.append(path.format(len(paths)))
+        sheet.crop((0, 0, sheet.width, rows_used * tile_size[1])).save(paths[-1], compress_level=compress_level)
+    return paths
@@ -0,0 +1,212 @@
+from itertools import product
+import matplotlib.pyplot as plt
+from pandas import DataFrame
+from .facet import category_order
+from .palettes import color_seq_palette, is_continuous
+from .render import plot_function
+
+
+def group_subsets(data, groups):
+    """
+    Splits the data by groups, in order of appearance.
+
+    Args:
+        data (DataFrame): The input data.
+        groups (list): The column names defining the groups. If empty, the data form a single group.
+
+    Returns:
+        dict: The subset of every group, keyed by the value of the group (a tuple for several groups, None if there are no groups).
+
+    """
+    if not groups:
+        return {None: data}
+    return {key if len(groups) > 1 else key[0]: subset for key, subset in data.groupby(groups, sort=False, observed=True)}
+
+
+class SciPlot:
+    """
+    Draws a sciviz plot and keeps a handle on it, so that it can be updated with new data without rebuilding the figure.
+
+    Args:
+        plot (str or function): The name of the plot function (e.g. 'line'), or the function itself.
+        data (DataFrame): The input data.
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+        **kwargs: The arguments passed to the plot function (e.g. x, y, color).
+
+    Attributes:
+        ax (matplotlib.axes.Axes): The Axes object containing the plot.
+        artists (dict or None): The artists updated in place, per group of the data. None if the plot is redrawn on every update.
+
+    Notes:
+        Line plots (without errorbars), bar plots (without errorbars) and point plots (without shape, size or continuous color encoding) are updated in place: lines, bars and points keep their artists, and only their data change.
+        The palettes, the legend and the order of the categories are kept as long as the new data hold the same categories. Otherwise, and for all other plots, the Axes is cleared and the plot is redrawn, including its legend.
+
+    """
+
+    def __init__(self, plot, data, ax=None, **kwargs):
+        self.plot = plot_function(plot)
+        self.kwargs = kwargs
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(6, 6))
+        self.ax = ax
+        self.draw(data)
+
+    def draw(self, data):
+        """
+        Draws the plot from scratch, resolving the order of the categories on the given data.
+
+        Args:
+            data (DataFrame): The input data.
+
+        """
+        kwargs = dict(self.kwargs)
+        self.levels = {}
+        continuous = self.plot.__name__ == 'point' and isinstance(data, DataFrame) and type(kwargs.get('color')) == str and is_continuous(data[kwargs['color']], kwargs.get('color_scale', 'auto'))
+        if isinstance(data, DataFrame):
+            for var, order in [('color', 'color_order'), ('shape', 'shape_order')]:
+                if type(kwargs.get(var)) == str and not (var == 'color' and continuous):
+                    self.levels[var] = kwargs.get(order) or category_order(data[kwargs[var]])
+                    kwargs[order] = self.levels[var]
+            if self.plot.__name__ == 'bar':
+                category = kwargs['x'] if kwargs.get('orient', 'v') == 'v' else kwargs['y']
+                self.levels['order'] = kwargs.get('order') or category_order(data[category])
+                kwargs['order'] = self.levels['order']
+        n_lines, n_containers, n_collections = len(self.ax.lines), len(self.ax.containers), len(self.ax.collections)
+        self.plot(data, ax=self.ax, **kwargs)
+        self.artists = None
+        if not isinstance(data, DataFrame):
+            return
+        if self.plot.__name__ == 'line' and kwargs.get('errorbar') is None and kwargs.get('stat', 'mean') in [None, 'mean', 'median', 'sum', 'count', 'min', 'max']:
+            self.artists = self.line_artists(data, self.ax.lines[n_lines:])
+        elif self.plot.__name__ == 'bar' and kwargs.get('errorbar') is None:
+            self.artists = self.bar_artists(self.ax.containers[n_containers:])
+        elif self.plot.__name__ == 'point' and not continuous and kwargs.get('shape') is None and type(kwargs.get('size', 50)) in [int, float]:
+            self.artists = {None: self.ax.collections[n_collections]}
+
+    def groups(self):
+        """
+        Returns the columns defining the groups of the plot, each drawn by its own line or bar.
+
+        Returns:
+            list: The column names of the groups.
+
+        """
+        if self.plot.__name__ == 'bar':
+            category = self.kwargs['x'] if self.kwargs.get('orient', 'v') == 'v' else self.kwargs['y']
+            return list(dict.fromkeys(group for group in [category, self.kwargs.get('color')] if group is not None))
+        return [group for group in [self.kwargs.get('color'), self.kwargs.get('shape')] if group is not None]
+
+    def line_artists(self, data, lines):
+        """
+        Maps every (color, shape) group of a line plot to its line, in the order seaborn draws them.
+
+        Args:
+            data (DataFrame): The input data.
+            lines (list): The lines drawn by the plot.
+
+        Returns:
+            dict or None: The line of every group, or None if the lines cannot be matched to the groups.
+
+        """
+        lines = [line for line in lines if line.get_label().startswith('_')]  # skip the legend entries seaborn adds to the Axes
+        groups = self.groups()
+        present = set(group_subsets(data.dropna(subset=[self.kwargs['x'], self.kwargs['y']]), groups))
+        keys = [key if len(key) > 1 else key[0] for key in product(*[self.levels[var] for var in ['color', 'shape'] if var in self.levels])] if groups else [None]
+        keys = [key for key in keys if key in present]
+        if len(keys) != len(lines):
+            return None
+        return dict(zip(keys, lines))
+
+    def bar_artists(self, containers):
+        """
+        Maps every (category, color) group of a bar plot to its bar, from the position of the bars.
+
+        Args:
+            containers (list): The bar containers drawn by the plot, one per color.
+
+        Returns:
+            dict or None: The bar of every group, or None if the bars cannot be matched to the groups.
+
+        """
+        color = self.kwargs.get('color')
+        vertical = self.kwargs.get('orient', 'v') == 'v'
+        hues = self.levels.get('color', [None])
+        if len(containers) != len(hues):
+            return None
+        artists = {}
+        for hue, container in zip(hues, containers):
+            for patch in container.patches:
+                center = patch.get_x() + patch.get_width() / 2 if vertical else patch.get_y() + patch.get_height() / 2
+                category = self.levels['order'][int(round(center))]
+                key = category if color is None or len(self.groups()) == 1 else (category, hue)
+                artists[key] = patch
+        return artists
+
+    def update(self, data):
+        """
+        Updates the plot with new data. Artists are updated in place when possible, otherwise the plot is redrawn.
+
+        Args:
+            data (DataFrame): The new input data.
+
+        Returns:
+            SciPlot: The updated plot.
+
+        """
+        if self.artists is None or not isinstance(data, DataFrame) or not self.update_in_place(data):
+            self.ax.clear()
+            self.draw(data)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        return self
+
+    def update_in_place(self, data):
+        """
+        Updates the data of the artists, if the new data hold the same groups as the plot.
+
+        Args:
+            data (DataFrame): The new input data.
+
+        Returns:
+            bool: Whether the artists were updated. False if the plot must be redrawn.
+
+        """
+        x, y = self.kwargs['x'], self.kwargs['y']
+        groups = self.groups()
+        name = self.plot.__name__
+
+        if name == 'point':
+            color = self.kwargs.get('color')
+            collection = self.artists[None]
+            if color is not None and not set(data[color].unique()) <= set(self.levels['color']):
+                return False
+            collection.set_offsets(data[[x, y]].to_numpy(dtype=float))
+            if color is not None:
+                color_pal = color_seq_palette(color_val=data[color], users_palette=self.kwargs.get('color_pal'), order=self.levels['color'])
+                palette = dict(zip(self.levels['color'], color_pal))
+                collection.set_facecolor([palette[level] for level in data[color]])
+            return True
+
+        if name == 'line':
+            subsets = group_subsets(data.dropna(subset=[x, y]), groups)
+            if set(subsets) != set(self.artists):
+                return False
+            stat = self.kwargs.get('stat', 'mean')
+            for key, subset in subsets.items():
+                values = subset.sort_values(x) if stat is None else subset.groupby(x)[y].agg(stat).reset_index()
+                self.artists[key].set_data(values[x].to_numpy(), values[y].to_numpy())
+            return True
+
+        # bar
+        vertical = self.kwargs.get('orient', 'v') == 'v'
+        value = y if vertical else x
+        stat = self.kwargs.get('stat', 'mean')
+        values = {key: subset[value].agg(stat) for key, subset in group_subsets(data.dropna(subset=[value]), groups).items()}
+        if set(values) != set(self.artists):
+            return False
+        for key, height in values.items():
+            if vertical:
+                self.artists[key].set_height(height)
+            else:
+                self.artists[key].set_width(height)
+        return True
\ No newline at end of file
@@ -0,0 +1,159 @@
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+SHARED_ALIGNMENT = 64  # byte alignment of every column in the shared block
+ATTACHED = {}  # shared blocks mapped by the current process, keyed by name
+
+
+def attach_block(name):
+    """
+    Maps a shared memory block published by another process, once per process.
+
+    Args:
+        name (str): The name of the block.
+
+    Returns:
+        multiprocessing.shared_memory.SharedMemory: The mapped block.
+
+    """
+    if name not in ATTACHED:
+        try:
+            block = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # before Python 3.13 attaching always registers the block, which is harmless for workers started by multiprocessing:
+            # they share the resource tracker of the publishing process, where the block is already registered
+            block = shared_memory.SharedMemory(name=name)
+        ATTACHED[name] = block
+    return ATTACHED[name]
+
+
+class SharedData:
+    """
+    A DataFrame published once in shared memory (/dev/shm on Linux), so that worker processes can plot it without receiving a pickled copy.
+
+    Args:
+        name (str): The name of the shared memory block.
+        columns (list): The layout of the columns, as (name, dtype, offset, categories) tuples. Categories are None for numeric columns.
+        n_rows (int): The number of rows.
+
+    Notes:
+        Instances are created by share_data and are cheap to pickle: only the layout of the columns is sent to the workers.
+        Every column is stored as a contiguous array. Text and categorical columns are stored as integer codes, with their categories kept in the layout.
+
+    """
+
+    def __init__(self, name, columns, n_rows):
+        self.name = name
+        self.columns = columns
+        self.n_rows = n_rows
+        self.block = None
+
+    def __getstate__(self):
+        return {'name': self.name, 'columns': self.columns, 'n_rows': self.n_rows, 'block': None}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.unlink()
+
+    def frame(self, columns=None):
+        """
+        Maps the data as a DataFrame, without copying numeric columns.
+
+        Args:
+            columns (list, optional): The columns to map. If None, all columns are mapped. Defaults to None.
+
+        Returns:
+            pandas.DataFrame: The data. Numeric columns are read-only views on the shared block.
+
+        """
+        block = self.block if self.block is not None else attach_block(self.name)
+        layout = {column[0]: column for column in self.columns}
+        if columns is None:
+            columns = list(layout)
+        values = {}
+        for column in columns:
+            _, dtype, offset, categories = layout[column]
+            array = np.ndarray(self.n_rows, dtype=dtype, buffer=block.buf, offset=offset)
+            array.flags.writeable = False
+            values[column] = array if categories is None else pd.Categorical.from_codes(array, categories=categories)
+        return pd.DataFrame(values, copy=False)
+
+    def close(self):
+        """
+        Unmaps the block from the current process.
+
+        """
+        block = self.block if self.block is not None else ATTACHED.pop(self.name, None)
+        if block is not None:
+            block.close()
+
+    def unlink(self):
+        """
+        Releases the block. Call it from the process that published the data once all workers are done.
+
+        """
+        block = self.block
+        self.close()
+        if block is not None:
+            block.unlink()
+            self.block = None
+
+
+def share_data(data):
+    """
+    Publishes a DataFrame in shared memory, once, for plots drawn in other processes.
+
+    Args:
+        data (pandas.DataFrame): The input data.
+
+    Returns:
+        SharedData: The handle of the shared data, to pass as data to the plot functions run in the workers (e.g. with render_bytes). Use it as a context manager, or call unlink() when done, to release the memory.
+
+    """
+    layout = []
+    arrays = []
+    offset = 0
+    for column in data.columns:
+        values = data[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            array, categories = values.cat.codes.to_numpy(), values.cat.categories.tolist()
+        elif pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_datetime64_dtype(values.dtype):
+            array, categories = values.to_numpy(), None
+            if array.dtype == object:  # nullable numeric dtypes
+                array = values.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            array, categories = pd.factorize(values, use_na_sentinel=True)
+            categories = categories.tolist()
+        layout.append((column, array.dtype.str, offset, categories))
+        arrays.append(array)
+        offset += -(-array.nbytes // SHARED_ALIGNMENT) * SHARED_ALIGNMENT
+    block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for (_, dtype, start, _), array in zip(layout, arrays):
+        np.ndarray(len(array), dtype=dtype, buffer=block.buf, offset=start)[:] = array
+    shared = SharedData(block.name, layout, len(data))
+    shared.block = block
+    return shared
+
+
+def plot_columns(data, kwargs):
+    """
+    Returns the columns of the data used by a plot, so that workers only map those.
+
+    Args:
+        data (SharedData): The shared data.
+        kwargs (dict): The arguments of the plot function.
+
+    Returns:
+        list or None: The column names used by the plot, or None to map all columns (when no argument names a column, e.g. for heatmaps).
+
+    """
+    available = {column[0] for column in data.columns}
+    columns = []
+    for value in kwargs.values():
+        for item in (value if isinstance(value, list) else [value]):
+            if isinstance(item, str) and item in available and item not in columns:
+                columns.append(item)
+    return columns or None
\ No newline at end of file
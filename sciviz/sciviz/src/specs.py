@@ -0,0 +1,230 @@
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import fields
+import numpy as np
+import pandas as pd
+from .misc_utils import is_vector
+
+SPEC_VERSION = 1
+
+
+def freeze(value):
+    """
+    Converts a parameter value to a hashable equivalent (lists to tuples, dicts to sorted tuples of items).
+
+    Args:
+        value (object): The parameter value.
+
+    Returns:
+        object: The hashable value.
+
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    return value
+
+
+class ParameterSpec(Mapping):
+    """
+    Base class of the parameter specs (e.g. LegendParameters), frozen dataclasses with slots that can also be read as dictionaries.
+
+    Notes:
+        Specs are hashable, so that they can be used as cache keys, and picklable, so that they can be sent to worker processes.
+        spec['posx'], spec.get('posx') and dict(spec) keep working as with the dictionaries previously returned by the *_parameters functions.
+
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return (field.name for field in fields(self))
+
+    def __len__(self):
+        return len(self.__dataclass_fields__)
+
+    def __eq__(self, other):
+        if isinstance(other, ParameterSpec):
+            return type(self) == type(other) and freeze(tuple(self.values())) == freeze(tuple(other.values()))
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        return hash((type(self).__name__, freeze(tuple(self.values()))))
+
+    def replace(self, **changes):
+        """
+        Returns a copy of the spec with some parameters changed.
+
+        Args:
+            **changes: The parameters to change (e.g. posx=1.2).
+
+        Returns:
+            ParameterSpec: The new spec.
+
+        """
+        return type(self)(**{**self, **changes})
+
+
+def parameter_classes():
+    """
+    Returns the parameter spec classes, keyed by name, used to decode serialized plot specs.
+
+    Returns:
+        dict: The ParameterSpec subclasses (e.g. {'LegendParameters': LegendParameters}).
+
+    """
+    return {cls.__name__: cls for cls in ParameterSpec.__subclasses__()}
+
+
+def encode_value(value):
+    """
+    Converts an argument of a plot function to a JSON and msgpack compatible value.
+
+    Args:
+        value (object): The argument.
+
+    Returns:
+        object: The encoded argument. Parameter specs are encoded as dictionaries tagged with the name of their class.
+
+    """
+    if isinstance(value, ParameterSpec):
+        return {'__parameters__': type(value).__name__, **{key: encode_value(item) for key, item in value.items()}}
+    if isinstance(value, dict):
+        return {str(key): encode_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    raise ValueError(f"Invalid plot spec argument of type {type(value).__name__}. Plot specs can only hold strings, numbers, lists, dictionaries and parameter specs.")
+
+
+def decode_value(value):
+    """
+    Converts an encoded argument back to the argument of the plot function.
+
+    Args:
+        value (object): The encoded argument.
+
+    Returns:
+        object: The argument, with parameter specs rebuilt from their tagged dictionaries.
+
+    """
+    if isinstance(value, dict):
+        if '__parameters__' in value:
+            classes = parameter_classes()
+            name = value['__parameters__']
+            if name not in classes:
+                raise ValueError(f"Invalid parameters option. Please choose from {', '.join(repr(cls) for cls in classes)}.")
+            return classes[name](**{key: decode_value(item) for key, item in value.items() if key != '__parameters__'})
+        return {key: decode_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    return value
+
+
+def plot_spec(plot, data=None, **kwargs):
+    """
+    Builds a serializable spec of a plot, to be rendered elsewhere (e.g. in a worker fleet) with render().
+
+    Args:
+        plot (str): The name of the plot function (e.g. 'bar').
+        data (str, dict, bytes or None, optional): A reference to the data, resolved by the worker (e.g. 'iris.parquet', or {'path': 'iris.arrow', 'columns': ['species', 'sepal_width']}), or an Arrow IPC buffer (msgpack only). DataFrames and arrays are not accepted. Defaults to None.
+        **kwargs: The arguments passed to the plot function (e.g. x, y, legend=legend_parameters()).
+
+    Returns:
+        dict: The plot spec, holding only strings, numbers, lists and dictionaries.
+
+    """
+    if not isinstance(plot, str):
+        raise ValueError("Plot specs must name the plot function (e.g. 'bar').")
+    if isinstance(data, (pd.DataFrame, pd.Series, np.ndarray)) or any(is_vector(value) and not isinstance(value, list) for value in kwargs.values()):
+        raise ValueError("Plot specs cannot embed data. Please pass a reference to the data (e.g. a parquet path) instead.")
+    if isinstance(data, os.PathLike):
+        data = os.fspath(data)
+    data = bytes(data) if isinstance(data, (bytes, bytearray, memoryview)) else encode_value(data)
+    return {'version': SPEC_VERSION, 'plot': plot, 'data': data, 'args': encode_value(kwargs)}
+
+
+def dumps_spec(spec, format='json'):
+    """
+    Serializes a plot spec.
+
+    Args:
+        spec (dict): The plot spec, as returned by plot_spec.
+        format (str, optional): The serialization format, 'json' or 'msgpack' (requires the msgpack package). Defaults to 'json'.
+
+    Returns:
+        str or bytes: The serialized spec (str for JSON, bytes for msgpack).
+
+    """
+    if format == 'json':
+        return json.dumps(spec)
+    if format == 'msgpack':
+        import msgpack
+        return msgpack.packb(spec)
+    raise ValueError("Invalid format option. Please choose from 'json' or 'msgpack'.")
+
+
+def loads_spec(payload, format='json'):
+    """
+    Deserializes a plot spec.
+
+    Args:
+        payload (str or bytes): The serialized spec.
+        format (str, optional): The serialization format, 'json' or 'msgpack' (requires the msgpack package). Defaults to 'json'.
+
+    Returns:
+        dict: The plot spec.
+
+    """
+    if format == 'json':
+        return json.loads(payload)
+    if format == 'msgpack':
+        import msgpack
+        return msgpack.unpackb(payload)
+    raise ValueError("Invalid format option. Please choose from 'json' or 'msgpack'.")
+
+
+def resolve_data(ref):
+    """
+    Loads the data referenced by a plot spec. This is the default data resolver of render().
+
+    Args:
+        ref (str, dict, bytes or None): The reference to the data. Either a path (.parquet, .feather, .arrow, .csv or .tsv), a dictionary with a 'path' and optionally a 'format' and the 'columns' to read, or an Arrow IPC buffer (file or stream format).
+
+    Returns:
+        pandas.DataFrame or None: The data.
+
+    Notes:
+        Parquet and Arrow files only read the requested columns. Arrow IPC buffers and files require the pyarrow package.
+
+    """
+    if ref is None:
+        return None
+    if isinstance(ref, (bytes, bytearray, memoryview)):
+        import pyarrow as pa
+        buffer = pa.py_buffer(ref)
+        try:
+            return pa.ipc.open_file(buffer).read_all().to_pandas()
+        except pa.ArrowInvalid:
+            return pa.ipc.open_stream(buffer).read_all().to_pandas()
+    if not isinstance(ref, dict):
+        ref = {'path': ref}
+    path = os.fspath(ref['path'])
+    columns = ref.get('columns')
+    format = ref.get('format') or os.path.splitext(path)[1].lstrip('.').lower()
+    if format in ['parquet', 'pq']:
+        return pd.read_parquet(path, columns=columns)
+    if format in ['feather', 'arrow', 'ipc']:
+        return pd.read_feather(path, columns=columns)
+    if format in ['csv', 'tsv']:
+        return pd.read_csv(path, sep='\t' if format == 'tsv' else ',', usecols=columns)
+    raise ValueError("Invalid data format option. Please choose from 'parquet', 'feather', 'arrow', 'ipc', 'csv' or 'tsv'.")
\ No newline at end of file
@@ -1,5 +1,61 @@
-import matplotlib.pyplot as plt
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
 import seaborn as sns
+from matplotlib.axes import Axes
+
+
+@lru_cache(maxsize=None)
+def theme_style(theme='ticks'):
+    """
+    Computes the style parameters of a theme. The result is cached, so every theme is only computed once.
+
+    Args:
+        theme (str): The theme style. Default is 'ticks'.
+
+    Returns:
+        mappingproxy: A read-only mapping of the seaborn style parameters of the theme.
+
+    Notes:
+        The global matplotlib rcParams are not modified, the style is applied to each Axes by theme().
+
+    """
+    if theme not in ['ticks', 'classic', 'darkgrid', 'whitegrid', 'dark', 'white']:
+        raise ValueError("Invalid theme option. Please choose from 'ticks', 'classic', 'darkgrid', 'whitegrid', 'dark', or 'white'.")
+    style = sns.axes_style(style='ticks' if theme=='classic' else theme)
+    return MappingProxyType(dict(style))
+
+
+def style_axes(ax, style):
+    """
+    Applies the style parameters of a theme directly to the artists of a matplotlib Axes object.
+
+    Args:
+        ax (matplotlib.axes.Axes): The Axes object to modify.
+        style (mapping): The style parameters, as returned by theme_style().
+
+    Returns:
+        matplotlib.axes.Axes: The modified Axes object.
+
+    """
+    ax.set_facecolor(style['axes.facecolor'])
+    for side in ['left', 'bottom', 'right', 'top']:
+        ax.spines[side].set_visible(style['axes.spines.' + side])
+        ax.spines[side].set_edgecolor(style['axes.edgecolor'])
+    ax.set_axisbelow(style['axes.axisbelow'])
+    if style['axes.grid']:
+        ax.grid(True, color=style['grid.color'], linestyle=style['grid.linestyle'])
+    else:
+        ax.grid(False)
+    ax.tick_params(axis='x', direction=style['xtick.direction'], color=style['xtick.color'], labelcolor=style['xtick.color'], 
+                   bottom=style['xtick.bottom'], top=style['xtick.top'])
+    ax.tick_params(axis='y', direction=style['ytick.direction'], color=style['ytick.color'], labelcolor=style['ytick.color'], 
+                   left=style['ytick.left'], right=style['ytick.right'])
+    ax.xaxis.label.set_color(style['axes.labelcolor'])
+    ax.yaxis.label.set_color(style['axes.labelcolor'])
+    ax.title.set_color(style['text.color'])
+    return ax
+
 
 def x_y_axis_main(ax, x_label, y_label, xlim, ylim, label_size):
     """
@@ -69,7 +125,7 @@ def theme(ax, theme='ticks', title=None, xlab=None, ylab=None, xlim=None, ylim=N
     Set the labels, limits, ticks, and font properties for the x and y axes of a matplotlib Axes object.
 
     Args:
-        ax (matplotlib Axes): The Axes object to modify.
+        ax (matplotlib Axes or array-like): The Axes object to modify, or a collection of Axes objects (e.g. the axes returned by plt.subplots) to which the same theme is applied.
         theme (str): The theme style for the plot. Default is 'ticks'.
         title (str): The title of the plot.
         xlab (str): The label for the x-axis.
@@ -85,20 +141,19 @@ def theme(ax, theme='ticks', title=None, xlab=None, ylab=None, xlim=None, ylim=N
         ticklabel_size (int): The font size for the tick labels.
 
     Returns:
-        matplotlib Axes: The modified Axes object.
+        matplotlib Axes: The modified Axes object (or the collection of Axes objects).
 
     """
-    sns.set_style(style='ticks' if theme=='classic' else theme)
-    if theme not in ['ticks', 'classic', 'darkgrid', 'whitegrid', 'dark', 'white']:
-        raise ValueError("Invalid theme option. Please choose from 'ticks', 'classic', 'darkgrid', 'whitegrid', 'dark', or 'white'.")
-
-    if theme == 'classic':
-        ax.spines[['right', 'top']].set_visible(False)
+    style = theme_style(theme)
+    for axis in ([ax] if isinstance(ax, Axes) else np.ravel(ax)):
+        axis = style_axes(axis, style)
+        if theme == 'classic':
+            axis.spines[['right', 'top']].set_visible(False)
 
-    if title:
-        plt.title(title, fontsize=title_size)
+        if title:
+            axis.set_title(title, fontsize=title_size)
 
-    ax = x_y_axis_main(ax=ax, x_label=xlab, y_label=ylab, xlim=xlim, ylim=ylim, label_size=axislabel_size)
-    ax = x_y_axis_ticks(ax=ax, xticks=xticks, yticks=yticks, xticks_angle=xticks_angle, yticks_angle=yticks_angle, tick_size=ticklabel_size)
+        axis = x_y_axis_main(ax=axis, x_label=xlab, y_label=ylab, xlim=xlim, ylim=ylim, label_size=axislabel_size)
+        axis = x_y_axis_ticks(ax=axis, xticks=xticks, yticks=yticks, xticks_angle=xticks_angle, yticks_angle=yticks_angle, tick_size=ticklabel_size)
 
     return ax
\ No newline at end of file
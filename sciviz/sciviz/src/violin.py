@@ -1,12 +1,32 @@
+from dataclasses import dataclass
 import matplotlib.pyplot as plt
 import seaborn as sns
+from .misc_utils import rasterize_artists, same_variable, variable_values
 from .palettes import color_seq_palette
 from .legends import legend_create, legend_parameters
+from .specs import ParameterSpec
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BoxParameters(ParameterSpec):
+    """
+    The parameters of the box plots overlaid on a violin plot, as returned by box_parameters(). See box_parameters() for their description.
+
+    """
+    fill_color: str = 'white'
+    edge_color: str = 'black'
+    edge_width: float = 1
+    median_color: str = 'black'
+    median_width: float = 1.5
+    outliers: bool = True
+    outlier_color: str = 'black'
+    outlier_shape: str = 'o'
+    outlier_size: float = 2
 
 
 def box_parameters(fill_color='white', edge_color='black', edge_width=1, median_color='black', median_width=1.5, outliers=True, outlier_color='black', outlier_shape='o', outlier_size=2):
     """
-    Returns a dictionary of parameters for customizing a box plot.
+    Returns the parameters for customizing a box plot.
 
     Args:
         fill_color (str, optional): The color to fill the box with. Defaults to 'white'.
@@ -20,33 +40,31 @@ def box_parameters(fill_color='white', edge_color='black', edge_width=1, median_
         outlier_size (int, optional): The size of the outliers. Defaults to 2.
 
     Returns:
-        dict: A dictionary of box plot parameters.
+        BoxParameters: The parameters of the box plot, which can also be read as a dictionary.
 
     """
-    
-    box_params = {
-        'fill_color': fill_color,
-        'edge_color': edge_color,  
-        'edge_width': edge_width,
-        'median_color': median_color,
-        'median_width': median_width,
-        'outliers': outliers,
-        'outlier_color': outlier_color,
-        'outlier_shape': outlier_shape,
-        'outlier_size': outlier_size
-    }
-    return box_params
-
-
-def violin(data, x, y, color=None, order=None, color_pal=None, color_order=None, fill=True, split=False, orient='v', width=0.4, edgecolor='black', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), box=None):
+    return BoxParameters(
+        fill_color=fill_color,
+        edge_color=edge_color,
+        edge_width=edge_width,
+        median_color=median_color,
+        median_width=median_width,
+        outliers=outliers,
+        outlier_color=outlier_color,
+        outlier_shape=outlier_shape,
+        outlier_size=outlier_size
+    )
+
+
+def violin(data, x, y, color=None, order=None, color_pal=None, color_order=None, fill=True, split=False, orient='v', width=0.4, edgecolor='black', alpha=0.7, legend=legend_parameters(orient='v', posx=1, posy=0.5, title=True, title_size=12, title_bold=False, label_size=11), box=None, ax=None, rasterize_layers=False):
     """
     Creates a violin plot with optional box plot overlay.
 
     Args:
-        data (DataFrame): The input data.
-        x (str): The column name or index level name to group by on the x-axis.
-        y (str): The column name or index level name to group by on the y-axis.
-        color (str, optional): The column name or index level name to group by for color encoding. Defaults to None.
+        data (DataFrame): The input data. Can be None if the variables are given as arrays.
+        x (str or array-like): The column name or index level name to group by on the x-axis, or the values themselves.
+        y (str or array-like): The column name or index level name to group by on the y-axis, or the values themselves.
+        color (str or array-like, optional): The column name or index level name to group by for color encoding, or the values themselves. Defaults to None.
         order (list, optional): The order of the x-axis groups. Defaults to None.
         color_pal (list, optional): The color palette for color encoding. Defaults to None.
         color_order (list, optional): The order of the color groups. Defaults to None.
@@ -58,22 +76,26 @@ def violin(data, x, y, color=None, order=None, color_pal=None, color_order=None,
         alpha (float, optional): The transparency of the violin plot. Defaults to 0.8.
         legend (dict, optional): The parameters for the legend. Defaults to legend_parameters().
         box (dict, optional): The parameters for the box plot overlay. Defaults to None.
+        ax (matplotlib.axes.Axes, optional): The Axes object to draw the plot onto. If None, a new figure is created. Defaults to None.
+        rasterize_layers (bool, optional): Whether to rasterize the outliers of the box plot overlay in vector outputs (PDF, SVG), at the resolution passed to savefig, keeping axes, text and legends as vectors. Defaults to False.
 
     Returns:
         AxesSubplot: The matplotlib AxesSubplot object.
 
     """
-    if color_pal is not None and color == None:
+    if color_pal is not None and color is None:
         single_color = color_pal[0]
     else:
         single_color = None
-    if color:
-        color_pal = color_seq_palette(color_val=data[color], users_palette=color_pal)
+    if color is not None:
+        color_pal = color_seq_palette(color_val=variable_values(data, color), users_palette=color_pal, order=color_order)
 
     if fill == False and edgecolor != None:
         color_pal = [edgecolor]
     
-    fig, ax = plt.subplots(figsize=(6, 6))
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 6))
+    layers = (len(ax.collections), len(ax.lines))
     sns.violinplot(
         data=data, 
         x=x, 
@@ -104,12 +126,12 @@ def violin(data, x, y, color=None, order=None, color_pal=None, color_order=None,
             x=x, 
             y=y, 
             hue=color if color is not None else (x if orient == 'v' else y),  
-            gap=0 if color is None or color==x or color==y else 0.85,
+            gap=0 if color is None or same_variable(color, x) or same_variable(color, y) else 0.85,
             palette=box_pal, 
             showfliers=box['outliers'], 
             flierprops = dict(marker=box['outlier_shape'], markeredgecolor=box['outlier_color'], 
                               markerfacecolor=box['outlier_color'], markersize=box['outlier_size']),
-            width=0.06 if color is None or color==x or color==y else 0.8, 
+            width=0.06 if color is None or same_variable(color, x) or same_variable(color, y) else 0.8, 
             boxprops = dict(zorder=2, edgecolor=box['edge_color'], linewidth=box['edge_width']),
             whiskerprops=dict(color=box['edge_color'], linewidth=box['edge_width']),
             capprops = dict(linewidth = 0),
@@ -118,6 +140,9 @@ def violin(data, x, y, color=None, order=None, color_pal=None, color_order=None,
             ax=ax
             )
 
+    if rasterize_layers:
+        ax = rasterize_artists(ax, *layers)
+
     if legend:
         ax = legend_create(
             ax=ax,
@@ -0,0 +1,139 @@
+import asyncio
+import time
+import unittest
+import matplotlib.pyplot as plt
+from sciviz.src import aio
+
+def slow_plot(delay=0.2, calls=None, name=None):
+    if calls is not None:
+        calls.append(name)
+    time.sleep(delay)
+    fig, ax = plt.subplots(figsize=(1, 1))
+    return ax
+
+class TestRenderer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.renderer = aio.Renderer(max_workers=1, max_pending=2, executor='thread')
+
+    async def asyncTearDown(self):
+        self.renderer.shutdown()
+
+    def count_in_flight(self):
+        # wraps the executor to record the largest number of plots submitted and not yet done
+        counts = {'current': 0, 'max': 0}
+        submit = self.renderer.executor.submit
+
+        def counted_submit(job):
+            counts['current'] += 1
+            counts['max'] = max(counts['max'], counts['current'])
+            future = submit(job)
+            future.add_done_callback(lambda _: counts.__setitem__('current', counts['current'] - 1))
+            return future
+
+        self.renderer.executor.submit = counted_submit
+        return counts
+
+    async def test_render(self):
+        image = await self.renderer.render(slow_plot, delay=0)
+        self.assertTrue(image.startswith(b'\x89PNG'))
+        self.assertEqual(plt.get_fignums(), [])
+
+    async def test_backpressure(self):
+        counts = self.count_in_flight()
+        tasks = [asyncio.create_task(self.renderer.render(slow_plot, delay=0.1)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        self.assertTrue(self.renderer.slots.locked())
+        self.assertEqual(counts['current'], 2)
+        images = await asyncio.gather(*tasks)
+        self.assertEqual(len(images), 5)
+        self.assertEqual(counts['max'], 2)
+
+    async def test_timeout_keeps_slot(self):
+        counts = self.count_in_flight()
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.renderer.render(slow_plot, delay=0.3, timeout=0.05)
+        # the plot is still being rendered: it keeps its slot, so only one of the next plots can be submitted
+        tasks = [asyncio.create_task(self.renderer.render(slow_plot, delay=0, timeout=5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        self.assertEqual(counts['current'], 2)
+        images = await asyncio.gather(*tasks)
+        self.assertTrue(all(image.startswith(b'\x89PNG') for image in images))
+        self.assertEqual(counts['max'], 2)
+
+    async def test_cancel_queued(self):
+        calls = []
+        running = asyncio.create_task(self.renderer.render(slow_plot, delay=0.2, calls=calls, name='running'))
+        queued = asyncio.create_task(self.renderer.render(slow_plot, delay=0.2, calls=calls, name='queued'))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await queued
+        await running
+        await asyncio.sleep(0)  # let the slot of the dropped plot be released
+        self.assertEqual(calls, ['running'])
+        self.assertFalse(self.renderer.slots.locked())
+
+    async def test_threads_draw_one_at_a_time(self):
+        renderer = aio.Renderer(max_workers=3, executor='thread')
+        active = []
+        overlaps = []
+
+        def tracked_plot():
+            active.append(None)
+            overlaps.append(len(active))
+            ax = slow_plot(delay=0.05)
+            active.pop()
+            return ax
+
+        await asyncio.gather(*[renderer.render(tracked_plot) for _ in range(6)])
+        renderer.shutdown()
+        self.assertEqual(max(overlaps), 1)
+
+    async def test_shutdown(self):
+        self.renderer.shutdown()
+        with self.assertRaises(RuntimeError):
+            await self.renderer.render(slow_plot, delay=0)
+        self.assertFalse(self.renderer.slots.locked())
+
+    async def test_default_renderer(self):
+        aio.default_renderer = aio.Renderer(max_workers=1, executor='thread')  # threads, rather than spawning processes in tests
+        image = await aio.render(slow_plot, delay=0, timeout=5)
+        self.assertTrue(image.startswith(b'\x89PNG'))
+        aio.shutdown()
+        self.assertIsNone(aio.default_renderer)
+
+class TestRendererAcrossLoops(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = aio.Renderer(max_workers=1, max_pending=1, executor='thread')
+
+    def tearDown(self):
+        self.renderer.shutdown()
+
+    async def render_many(self, render, n):
+        return await asyncio.gather(*[render(slow_plot, delay=0.01, timeout=5) for _ in range(n)])
+
+    def test_two_event_loops(self):
+        for _ in range(2):
+            images = asyncio.run(self.render_many(self.renderer.render, 3))
+            self.assertEqual(len(images), 3)
+        self.assertFalse(self.renderer.slots.locked())
+
+    def test_render_after_timeout(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(self.renderer.render(slow_plot, delay=0.2, timeout=0.05))
+        # the slot of the timed-out plot is freed by its worker, after the first event loop is closed
+        image = asyncio.run(self.renderer.render(slow_plot, delay=0, timeout=5))
+        self.assertTrue(image.startswith(b'\x89PNG'))
+        self.assertFalse(self.renderer.slots.locked())
+
+    def test_default_renderer(self):
+        aio.default_renderer = aio.Renderer(max_workers=1, max_pending=1, executor='thread')
+        for _ in range(2):
+            images = asyncio.run(self.render_many(aio.render, 3))
+            self.assertEqual(len(images), 3)
+        aio.shutdown()
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
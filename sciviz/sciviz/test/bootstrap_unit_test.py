@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+import pandas as pd
+from sciviz.src import bootstrap
+from sciviz.src.bootstrap import bootstrap_intervals, bootstrap_errorbar, resolve_errorbar
+
+class TestBootstrap(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.test_df = pd.DataFrame({'x': rng.choice(['A', 'B', 'C'], size=600),
+                                     'y': rng.normal(size=600)})
+        bootstrap.BOOTSTRAP_CACHE.clear()
+
+    def test_reproducible(self):
+        values = self.test_df['y'].to_numpy()
+        first = bootstrap_intervals([values], seed=1)
+        bootstrap.BOOTSTRAP_CACHE.clear()
+        self.assertEqual(bootstrap_intervals([values], seed=1), first)
+        self.assertNotEqual(bootstrap_intervals([values], seed=2), first)
+
+    def test_groups_independent(self):
+        groups = [subset.to_numpy() for _, subset in self.test_df.groupby('x')['y']]
+        joint = bootstrap_intervals(groups, estimator='median')
+        bootstrap.BOOTSTRAP_CACHE.clear()
+        self.assertEqual(bootstrap_intervals(groups[1:2], estimator='median')[0], joint[1])
+
+    def test_errorbar_cached(self):
+        errorbar = bootstrap_errorbar(self.test_df, 'y', ['x'], level=90)
+        self.assertEqual(len(bootstrap.BOOTSTRAP_CACHE), 3)
+        low, high = errorbar(self.test_df.loc[self.test_df['x'] == 'A', 'y'])
+        self.assertEqual(len(bootstrap.BOOTSTRAP_CACHE), 3)
+        self.assertLess(low, high)
+
+    def test_resolve_errorbar(self):
+        self.assertEqual(resolve_errorbar(('sd', 2), self.test_df, 'y', ['x'], 'mean'), ('sd', 2))
+        self.assertEqual(resolve_errorbar('ci', self.test_df, 'y', ['x'], 'count'), 'ci')
+        self.assertTrue(callable(resolve_errorbar(('ci', 90), self.test_df, 'y', ['x'], 'mean')))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
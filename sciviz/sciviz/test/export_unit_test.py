@@ -0,0 +1,125 @@
+import unittest
+from io import BytesIO, StringIO
+import xml.etree.ElementTree as ET
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from PIL import Image
+from sciviz.src.boxplot import boxplot, jitter_parameters
+from sciviz.src.export import draw_rgba, png_image, render_array, render_arrays, save_png, save_svg, svg_number
+from sciviz.src.heatmap import heatmap
+from sciviz.src.jitter import crossbar_parameters, jitter
+from sciviz.src.point import point
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({'x': rng.normal(size=200), 'y': rng.normal(size=200), 'g': ['a', 'b'] * 100})
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_svg_number(self):
+        self.assertEqual(svg_number(1.2049, 2), '1.2')
+        self.assertEqual(svg_number(-0.001, 2), '0')
+        self.assertEqual(svg_number(3.0, 2), '3')
+
+    def test_save_svg(self):
+        ax = point(self.df, 'x', 'y', color='g', shape='g')
+        buffer = StringIO()
+        save_svg(ax, buffer, precision=1)
+        root = ET.fromstring(buffer.getvalue())
+        self.assertEqual(len(root.findall(f'.//{SVG}symbol')), 2)
+        uses = [use for use in root.iter(f'{SVG}use') if use.get('{http://www.w3.org/1999/xlink}href').startswith('#sv')]
+        self.assertEqual(len(uses), 200)
+        self.assertNotIn('fill-opacity', uses[0].attrib)  # shared by all points, written once on their group
+        self.assertNotIn('draw', vars(ax.collections[0]))
+
+    def test_png_image(self):
+        pixels = np.zeros((4, 6, 4), dtype=np.uint8)
+        pixels[..., 3] = 255
+        pixels[:2, :, 0] = 200
+        indexed = png_image(pixels, (6, 4))
+        self.assertEqual(indexed.mode, 'P')
+        np.testing.assert_array_equal(np.asarray(indexed.convert('RGBA')), pixels)
+        self.assertEqual(png_image(pixels, (6, 4), max_colors=1).mode, 'RGBA')
+        self.assertEqual(png_image(pixels, (6, 4), max_colors=1, quantize='always').mode, 'P')
+        with self.assertRaises(ValueError):
+            png_image(pixels, (6, 4), quantize='yes')
+
+    def test_save_png(self):
+        ax = point(self.df, 'x', 'y', color='g')
+        canvas = ax.get_figure().canvas
+        buffer = BytesIO()
+        save_png(ax, buffer, dpi=50, quantize='always', compress_level=1)
+        image = Image.open(buffer)
+        self.assertEqual((image.format, image.mode), ('PNG', 'P'))
+        self.assertEqual(image.size, (300, 300))
+        self.assertIs(ax.get_figure().canvas, canvas)
+
+    def test_render_array(self):
+        ax = point(self.df, 'x', 'y')
+        image = render_array(ax, dpi=50)
+        self.assertEqual((image.shape, image.dtype), ((300, 300, 4), np.uint8))
+        self.assertFalse(image.flags.owndata)  # a view on the canvas
+        self.assertEqual(ax.get_figure().dpi, 100)
+        buffer = BytesIO()
+        ax.get_figure().savefig(buffer, format='png', dpi=50)
+        np.testing.assert_array_equal(np.asarray(Image.open(buffer)), image)
+
+    def test_draw_rgba_tight(self):
+        fig = point(self.df, 'x', 'y').get_figure()
+        image = draw_rgba(fig, dpi=50, bbox_inches='tight')
+        self.assertEqual(fig.dpi, 100)
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png', dpi=50, bbox_inches='tight')
+        np.testing.assert_array_equal(np.asarray(Image.open(buffer)), image)
+
+    def test_render_arrays(self):
+        images = render_arrays((point(self.df, 'x', 'y') for _ in range(2)), dpi=20)
+        self.assertEqual([image.shape for image in images], [(120, 120, 4)] * 2)
+        self.assertEqual(plt.get_fignums(), [])
+
+
+class TestRasterizeLayers(unittest.TestCase):
+
+    def setUp(self):
+        self.test_df = pd.DataFrame({'g': ['a', 'b'] * 50, 'v': np.r_[np.arange(98), 500, 600], 'w': np.arange(100.0)})
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_point(self):
+        ax = point(self.test_df, 'w', 'v', color='g', rasterize_layers=True)
+        self.assertTrue(all(collection.get_rasterized() for collection in ax.collections))
+        self.assertFalse(ax.get_legend().get_rasterized())
+        svg = StringIO()
+        ax.get_figure().savefig(svg, format='svg')
+        self.assertIn('<image', svg.getvalue())  # the points are embedded as an image
+
+    def test_jitter(self):
+        ax = jitter(self.test_df, 'g', 'v', color='g', crossbar=crossbar_parameters(), rasterize_layers=True)
+        self.assertTrue(all(collection.get_rasterized() for collection in ax.collections))
+        self.assertTrue(ax.lines)
+        self.assertFalse(any(line.get_rasterized() for line in ax.lines))  # crossbars stay vectors
+
+    def test_boxplot(self):
+        ax = boxplot(self.test_df, 'g', 'v', color='g', jitter=jitter_parameters(), rasterize_layers=True)
+        self.assertTrue(all(collection.get_rasterized() for collection in ax.collections))
+        self.assertTrue(any(line.get_rasterized() for line in ax.lines))  # outliers
+        self.assertFalse(any(patch.get_rasterized() for patch in ax.patches))
+        self.assertFalse(ax.get_legend().get_rasterized())
+
+    def test_heatmap(self):
+        grid = heatmap(self.test_df.iloc[:20], row1_annot='g', rasterize_layers=True)
+        self.assertTrue(grid.ax_heatmap.collections[0].get_rasterized())
+        self.assertFalse(any(collection.get_rasterized() for collection in grid.ax_row_dendrogram.collections))
+        grid = heatmap(self.test_df.iloc[:20], row1_annot='g')
+        self.assertFalse(grid.ax_heatmap.collections[0].get_rasterized())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
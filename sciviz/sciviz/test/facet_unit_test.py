@@ -0,0 +1,51 @@
+import unittest
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from sciviz.src.facet import facet
+from sciviz.src.point import point
+
+class TestFacet(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.test_df = pd.DataFrame({'site': np.repeat(['s1', 's2', 's3'], 40),
+                                     'year': np.tile(['y1', 'y2'], 60),
+                                     'group': np.concatenate([rng.choice(['A', 'B'], 40), rng.choice(['B', 'C'], 80)]),
+                                     'x': rng.normal(size=120),
+                                     'y': rng.normal(size=120)})
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_grid_shape(self):
+        axes = facet(self.test_df, point, row='year', col='site', x='x', y='y')
+        self.assertEqual(axes.shape, (2, 3))
+        self.assertEqual(axes[1, 2].get_title(), 'year = y2 | site = s3')
+        self.assertEqual(facet(self.test_df, point, col='site', x='x', y='y').shape, (1, 3))
+
+    def test_shared_palette_and_legend(self):
+        axes = facet(self.test_df, point, col='site', x='x', y='y', color='group')
+        colors = {}
+        for ax, (_, subset) in zip(axes[0], self.test_df.groupby('site', sort=False)):
+            for group, facecolor in zip(subset['group'], ax.collections[0].get_facecolors()):
+                colors.setdefault(group, set()).add(tuple(facecolor[:3]))
+        self.assertTrue(all(len(group_colors) == 1 for group_colors in colors.values()))  # 'B' keeps its color in every panel
+        self.assertEqual(len(set.union(*colors.values())), 3)
+        legends = [ax.get_legend() for ax in axes.ravel()]
+        self.assertEqual(sum(legend is not None for legend in legends), 1)
+        self.assertEqual([text.get_text() for text in axes[0, -1].get_legend().get_texts()][-3:], list(dict.fromkeys(self.test_df['group'])))
+
+    def test_orders(self):
+        axes = facet(self.test_df, point, row='year', col='site', row_order=['y2', 'y1'], col_order=['s3', 's1', 'absent'], x='x', y='y')
+        self.assertEqual(axes.shape, (2, 3))
+        self.assertEqual(axes[0, 0].get_title(), 'year = y2 | site = s3')
+        self.assertEqual(axes[1, 1].get_title(), 'year = y1 | site = s1')
+        self.assertFalse(axes[0, 2].axison)  # levels without data leave an empty panel
+
+    def test_invalid_facets(self):
+        with self.assertRaises(ValueError):
+            facet(self.test_df, point, x='x', y='y')
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,145 @@
+import unittest
+import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgb
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.cluster.hierarchy import linkage
+from sciviz.src import matrix
+from sciviz.src.heatmap import heatmap, track_colors
+from sciviz.src.matrix import approx_row_order, block_edges, block_labels, reduce_matrix, reduce_sparse, sparse_linkage
+
+class SliceArray:
+    """A chunked array reading rows by slices only, with Zarr-like orthogonal indexing (oindex) if oindex is True."""
+
+    def __init__(self, values, oindex=True):
+        self.values = values
+        self.shape = values.shape
+        if oindex:
+            self.oindex = values
+
+    def __getitem__(self, rows):
+        if not isinstance(rows, slice):
+            raise IndexError("Only slices are supported.")
+        return self.values[rows]
+
+class TestMatrixReduction(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.test_matrix = rng.normal(size=(301, 57))
+        self.test_matrix[5, 7] = np.nan
+
+    def test_block_means(self):
+        row_edges, col_edges = block_edges(301, 20), block_edges(57, 10)
+        expected = np.array([[np.nanmean(self.test_matrix[a:b, c:d]) for c, d in zip(col_edges[:-1], col_edges[1:])]
+                             for a, b in zip(row_edges[:-1], row_edges[1:])])
+        chunk_size = matrix.MATRIX_CHUNK_SIZE
+        matrix.MATRIX_CHUNK_SIZE = 500  # read a few rows at a time
+        try:
+            reduced = reduce_matrix(self.test_matrix, row_edges, col_edges)
+        finally:
+            matrix.MATRIX_CHUNK_SIZE = chunk_size
+        np.testing.assert_allclose(reduced, expected)
+
+    def test_block_labels(self):
+        self.assertEqual(block_labels(['a', 'b', 'c'], block_edges(3, 5)), ['a', 'b', 'c'])
+        self.assertEqual(block_labels(['a', 'b', 'c', 'd'], block_edges(4, 2)), ['a..b', 'c..d'])
+
+    def test_sparse_block_means(self):
+        test_sparse = sparse.random(300, 60, density=0.05, format='csr', random_state=0)
+        row_edges, col_edges = block_edges(300, 20), block_edges(60, 10)
+        expected = reduce_matrix(test_sparse.toarray(), row_edges, col_edges)
+        np.testing.assert_allclose(reduce_sparse(test_sparse, row_edges, col_edges), expected)
+
+    def test_sparse_linkage(self):
+        test_sparse = sparse.random(40, 100, density=0.1, format='csr', random_state=1)
+        expected = linkage(test_sparse.toarray(), method='average')
+        np.testing.assert_allclose(sparse_linkage(test_sparse)[:, 2], expected[:, 2])
+
+
+
+class TestAnnotationTracks(unittest.TestCase):
+
+    def test_track_colors(self):
+        colors, color_pal, categories = track_colors(pd.Series(['a', 'b', None, 'a']), ['red', 'blue'])
+        self.assertEqual(color_pal, [(1.0, 0.0, 0.0), (0.0, 0.0, 1.0)])
+        self.assertEqual(categories, ['a', 'b'])
+        np.testing.assert_array_equal(colors, [[1, 0, 0, 1], [0, 0, 1, 1], [0, 0, 0, 0], [1, 0, 0, 1]])
+
+    def test_tracks(self):
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(rng.normal(size=(30, 6)), columns=list('uvwxyz'))
+        for track in ['a', 'b', 'c']:
+            data[track] = rng.choice(['p', 'q', 'r'], 30)
+        grid = heatmap(data, row1_annot='a', row_annots=['b', 'c'], col_annots=[(list('ststst'), 'side')])
+        self.assertEqual(len(grid.ax_row_colors.images), 1)
+        self.assertEqual(grid.ax_row_colors.images[0].get_array().shape, (30, 3, 4))
+        self.assertEqual([label.get_text() for label in grid.ax_row_colors.get_xticklabels()], ['a', 'b', 'c'])
+        self.assertEqual(grid.ax_col_colors.images[0].get_array().shape, (1, 6, 4))
+        plt.close(grid.fig)
+
+    def test_tracks_missing_values(self):
+        data = pd.DataFrame(np.arange(24.0).reshape(6, 4), columns=list('abcd'))
+        data['g'] = ['x', None, 'y', 'z', 'x', 'y']
+        data['h'] = list('pqpqpq')
+        grid = heatmap(data, row_annots=['g', 'h'], row_pals=[['red', 'green', 'blue'], ['black', 'white']])
+        legend, = [ax.get_legend() for ax in grid.fig.axes if ax.get_legend()]
+        labels = [text.get_text() for text in legend.get_texts()]
+        self.assertEqual(labels, ['g', 'x', 'y', 'z', '', 'h', 'p', 'q', ''])
+        self.assertEqual(len(legend.legend_handles), len(labels))
+        handle_colors = {label: to_rgb(handle.get_markerfacecolor()) for label, handle in zip(labels, legend.legend_handles) if label in ['x', 'y', 'z', 'p', 'q']}
+        self.assertEqual(handle_colors, {'x': (1.0, 0.0, 0.0), 'y': (0.0, 0.5019607843137255, 0.0), 'z': (0.0, 0.0, 1.0), 'p': (0.0, 0.0, 0.0), 'q': (1.0, 1.0, 1.0)})
+        plt.close(grid.fig)
+
+
+class TestApproxClustering(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.groups = rng.integers(0, 4, 2500)
+        self.values = rng.normal(size=(4, 6))[self.groups] * 5 + rng.normal(size=(2500, 6))
+
+    def test_row_order(self):
+        order, block_linkage, sizes = approx_row_order(self.values, n_blocks=50)
+        np.testing.assert_array_equal(np.sort(order), np.arange(2500))
+        self.assertEqual(sizes.sum(), 2500)
+        self.assertEqual(len(block_linkage), len(sizes) - 1)
+        groups = self.groups[order]
+        self.assertEqual(np.count_nonzero(groups[1:] != groups[:-1]), 3)  # every group is contiguous
+
+    def test_single_block(self):
+        order, block_linkage, sizes = approx_row_order(np.ones((3000, 5)))
+        np.testing.assert_array_equal(order, np.arange(3000))
+        self.assertEqual(block_linkage.shape, (0, 4))
+        np.testing.assert_array_equal(sizes, [3000])
+        grid = heatmap(pd.DataFrame(np.ones((3000, 5))), row_cluster='approx', col_cluster=False, max_rows=100)
+        self.assertEqual(grid.data2d.shape, (100, 5))
+        self.assertEqual(len(grid.ax_row_dendrogram.collections), 0)
+        plt.close(grid.fig)
+
+    def test_chunked_arrays(self):
+        order, _, _ = approx_row_order(SliceArray(self.values), n_blocks=50)
+        np.testing.assert_array_equal(order, approx_row_order(self.values, n_blocks=50)[0])
+        edges = block_edges(2500, 100)
+        np.testing.assert_allclose(reduce_matrix(SliceArray(self.values), edges, block_edges(6, 6), row_order=order),
+                                   reduce_matrix(self.values[order], edges, block_edges(6, 6)))
+        grid = heatmap(SliceArray(self.values), row_cluster='approx', col_cluster=False, max_rows=100)
+        self.assertEqual(grid.data2d.shape, (100, 6))
+        plt.close(grid.fig)
+        with self.assertRaises(ValueError):
+            heatmap(SliceArray(self.values, oindex=False), row_cluster='approx')
+
+    def test_heatmap(self):
+        data = pd.DataFrame(self.values, columns=list('uvwxyz'))
+        data['group'] = self.groups.astype(str)
+        grid = heatmap(data, row_cluster='approx', row1_annot='group', max_rows=100)
+        self.assertEqual(grid.data2d.shape, (100, 6))
+        self.assertEqual(grid.ax_row_colors.images[0].get_array().shape, (100, 1, 4))
+        self.assertEqual(len(grid.ax_row_dendrogram.collections), 1)
+        plt.close(grid.fig)
+        with self.assertRaises(ValueError):
+            heatmap(data, row_cluster='fast')
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
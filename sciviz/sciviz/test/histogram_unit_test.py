@@ -0,0 +1,36 @@
+import unittest
+import numpy as np
+import pandas as pd
+from sciviz.src.histogram import bin_edges, histogram2d_accumulate, histogram2d_stat
+
+class TestHistogram2d(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.test_df = pd.DataFrame({'x': rng.normal(size=1000),
+                                     'y': rng.normal(size=1000),
+                                     'color': rng.choice(['A', 'B'], size=1000)})
+
+    def test_streamed_counts(self):
+        edges = np.linspace(-4, 4, 21)
+        chunks = [self.test_df.iloc[i:i + 100] for i in range(0, 1000, 100)]
+        counts_chunked = histogram2d_accumulate(chunks, 'x', 'y', 'color', edges, edges)
+        counts_full = histogram2d_accumulate(self.test_df, 'x', 'y', 'color', edges, edges)
+        self.assertEqual(list(counts_chunked), list(counts_full))
+        for group in counts_full:
+            np.testing.assert_array_equal(counts_chunked[group], counts_full[group])
+
+    def test_streamed_edges_need_range(self):
+        with self.assertRaises(ValueError):
+            bin_edges(None, 'auto', None, None)
+        self.assertEqual(len(bin_edges(None, 'auto', None, (0, 1))), 101)
+
+    def test_stat_probability(self):
+        edges = np.linspace(-4, 4, 21)
+        counts = histogram2d_accumulate(self.test_df, 'x', 'y', 'color', edges, edges)
+        layers = histogram2d_stat(list(counts.values()), edges, edges, 'probability')
+        self.assertAlmostEqual(sum(layer.sum() for layer in layers), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgb
+from sciviz.src.line import line, line_accumulate, line_aggregate
+
+class TestLineAggregation(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.test_df = pd.DataFrame({'x': rng.integers(0, 5, size=1000),
+                                     'y': rng.normal(size=1000),
+                                     'color': rng.choice(['A', 'B'], size=1000)})
+
+    def test_streamed_mean_sd(self):
+        chunks = [self.test_df.iloc[i:i + 300] for i in range(0, 1000, 300)]
+        table = line_aggregate(line_accumulate(chunks, 'y', ['x', 'color']), 'y', 'mean', 'sd')
+        table = table.sort_values(['x', 'color']).reset_index(drop=True)
+        expected = self.test_df.groupby(['x', 'color'])['y'].agg(['mean', 'std']).reset_index()
+        np.testing.assert_allclose(table['y'], expected['mean'])
+        np.testing.assert_allclose(table['ymax'] - table['y'], expected['std'])
+
+    def test_streamed_large_mean(self):
+        data = self.test_df.assign(y=self.test_df['y'] * 1e-3 + 1e9)  # spread far below the precision of the sums of squares
+        chunks = [data.iloc[i:i + 70] for i in range(0, 1000, 70)]
+        table = line_accumulate(chunks, 'y', ['x']).sort_index()
+        expected = data.groupby('x')['y'].std()
+        np.testing.assert_allclose(np.sqrt(table['m2'] / (table['count'] - 1)), expected, rtol=1e-3)
+
+    def test_streamed_stats(self):
+        chunks = [self.test_df[self.test_df['x'] < 2], self.test_df[self.test_df['x'] >= 2], self.test_df.iloc[:100]]  # groups missing from some chunks
+        data = pd.concat(chunks)
+        table = line_accumulate(chunks, 'y', ['x'])
+        self.assertEqual(list(table.index), list(data['x'].unique()))
+        expected = data.groupby('x', sort=False)['y']
+        for stat in ['count', 'sum', 'min', 'max']:
+            np.testing.assert_allclose(line_aggregate(table, 'y', stat, None)['y'], expected.agg(stat))
+
+    def test_streamed_empty(self):
+        with self.assertRaises(ValueError):
+            line_accumulate(iter([]), 'y', ['x'])
+        with self.assertRaises(ValueError):
+            line_accumulate([self.test_df.assign(y=np.nan)], 'y', ['x'])
+
+    def test_streamed_invalid_errorbar(self):
+        table = line_accumulate(self.test_df, 'y', ['x'])
+        with self.assertRaises(ValueError):
+            line_aggregate(table, 'y', 'mean', ('ci', 95))
+
+
+class TestStreamedLine(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.test_df = pd.DataFrame({'x': rng.integers(0, 3, size=600),
+                                     'y': rng.normal(size=600),
+                                     'level': rng.choice([f'l{i}' for i in range(12)], size=600)})
+        self.chunks = [self.test_df.iloc[:300], self.test_df.iloc[300:]]
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_many_levels(self):
+        order = [f'l{i}' for i in range(12)]
+        ax = line(self.chunks, 'x', 'y', color='level', color_order=order, errorbar='sd', legend=None)
+        # one set of error bars per level, in the (cycled) colors of the lines
+        self.assertEqual(len(ax.collections), 12)
+        line_colors = sorted(to_rgb(drawn.get_color()) for drawn in ax.lines[:12])
+        self.assertEqual(sorted(to_rgb(errorbars.get_colors()[0]) for errorbars in ax.collections), line_colors)
+
+    def test_partial_order(self):
+        ax = line(self.chunks, 'x', 'y', color='level', color_order=['l3', 'l1'], errorbar='sd', errorbar_style='band', legend=None)
+        self.assertEqual(len(ax.collections), 2)
+        line_colors = sorted(to_rgb(drawn.get_color()) for drawn in ax.lines[:2])
+        self.assertEqual(sorted(to_rgb(band.get_facecolor()[0]) for band in ax.collections), line_colors)
+
+
+if __name__ == '__main__':
+    unittest.main()
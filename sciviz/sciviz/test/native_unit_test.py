@@ -0,0 +1,130 @@
+import unittest
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.colors import to_rgb
+from sciviz.src.bar import bar
+from sciviz.src.histogram import histogram
+from sciviz.src.line import line
+from sciviz.src.point import point
+
+class TestNativeEngine(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.test_df = pd.DataFrame({'group': rng.choice(['a', 'b', 'c'], size=500),
+                                     'color': rng.choice(['A', 'B'], size=500),
+                                     'step': rng.integers(0, 10, size=500),
+                                     'x': rng.normal(size=500),
+                                     'y': rng.normal(size=500)})
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_bar_matches_seaborn(self):
+        heights = {}
+        for engine in ['seaborn', 'native']:
+            ax = bar(self.test_df, 'group', 'y', color='color', engine=engine)
+            heights[engine] = sorted((round(patch.get_x() + patch.get_width() / 2, 6), round(patch.get_height(), 6)) for container in ax.containers for patch in container.patches)
+        self.assertEqual(heights['seaborn'], heights['native'])
+
+    def test_histogram_matches_seaborn(self):
+        ax = histogram(self.test_df, 'x', color='color', stat='density', engine='seaborn')
+        seaborn_heights = sorted(round(patch.get_height(), 6) for patch in ax.patches)
+        ax = histogram(self.test_df, 'x', color='color', stat='density', engine='native')
+        native_heights = sorted(round(path.vertices[1, 1], 6) for bars in ax.collections for path in bars.get_paths())
+        self.assertEqual(len(ax.collections), 2)
+        self.assertEqual(seaborn_heights, native_heights)
+
+    def test_point_and_line(self):
+        ax = point(self.test_df, 'x', 'y', color='color', engine='native')
+        self.assertEqual(len(ax.collections), 1)
+        self.assertEqual(len(ax.collections[0].get_offsets()), len(self.test_df))
+        ax = line(self.test_df, 'step', 'y', color='color', engine='native')
+        means = self.test_df[self.test_df['color'] == 'A'].groupby('step')['y'].mean()
+        np.testing.assert_allclose(ax.lines[0].get_ydata(), means.to_numpy())
+
+    def assert_legend(self, ax, levels):
+        # one entry per level, each with the color of the level in the cycled palette
+        legend = ax.get_legend()
+        labels = [text.get_text() for text in legend.get_texts()]
+        self.assertEqual([label for label in labels if label in levels], levels)
+        self.assertEqual(len(legend.legend_handles), len(labels))
+        colors = {label: to_rgb(handle.get_markerfacecolor()) for label, handle in zip(labels, legend.legend_handles) if label in levels}
+        self.assertEqual(colors['l10'], colors['l0'])
+        self.assertEqual(len(set(colors.values())), 10)
+
+    def test_many_levels(self):
+        data = self.test_df.assign(level=[f'l{i % 12}' for i in range(len(self.test_df))])  # more levels than palette colors
+        levels = [f'l{i}' for i in range(12)]
+        ax = point(data, 'x', 'y', color='level', engine='native')
+        self.assertEqual(len(ax.collections[0].get_offsets()), len(data))
+        self.assert_legend(ax, levels)
+        ax = bar(data, 'level', 'y', color='level', engine='native')
+        self.assertEqual(len(ax.patches), 12)
+        self.assert_legend(ax, levels)
+        ax = histogram(data, 'x', color='level', engine='native')
+        self.assertEqual(len(ax.collections), 12)
+        self.assert_legend(ax, levels)
+        ax = line(data, 'step', 'y', color='level', engine='native')
+        self.assertEqual(len(ax.lines), 12)
+        self.assertEqual(ax.lines[10].get_color(), ax.lines[0].get_color())
+        self.assert_legend(ax, levels)
+        ax = point(data, 'x', 'y', color='level', size='x')  # continuous sizes
+        self.assertEqual(len(ax.collections[0].get_offsets()), len(data))
+
+    def test_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            bar(self.test_df, 'group', 'y', engine='plotly')
+
+
+class TestContinuousPoint(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.test_df = pd.DataFrame({'x': rng.normal(size=200),
+                                     'y': rng.normal(size=200),
+                                     'z': rng.uniform(-1, 3, size=200),
+                                     'label': rng.choice(['a', 'b', 'c'], size=200)})
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_colorbar(self):
+        data = self.test_df.assign(z=self.test_df['z'].where(self.test_df.index != 5))  # one missing color is skipped
+        ax = point(data, 'x', 'y', color='z')
+        self.assertEqual(len(ax.collections), 1)
+        points = ax.collections[0]
+        self.assertEqual(len(points.get_offsets()), len(data) - 1)
+        expected = data['z'].dropna().to_numpy()
+        np.testing.assert_allclose(points.get_array(), expected)
+        np.testing.assert_allclose(points.to_rgba(points.get_array()), plt.get_cmap('viridis')((expected - expected.min()) / (expected.max() - expected.min())))
+        self.assertIsNone(ax.get_legend())
+        cax, = ax.child_axes  # the colorbar is drawn in an inset of the plot
+        self.assertEqual(cax.get_title(loc='left'), 'z')
+        np.testing.assert_allclose(cax.get_ylim(), (expected.min(), expected.max()))
+
+    def test_continuous_size(self):
+        data = self.test_df.assign(s=np.arange(1000000.0, 1000200.0))
+        ax = point(data, 'x', 'y', size='s', size_pal=[10, 210])
+        np.testing.assert_allclose(ax.collections[0].get_sizes(), np.linspace(10, 210, 200))
+        labels = [text.get_text() for text in ax.get_legend().get_texts()]
+        self.assertEqual(labels, ['s', '1e+06', '1.00007e+06', '1.00013e+06', '1.0002e+06'])
+        self.assertEqual(len(ax.get_legend().legend_handles), len(labels))
+        with self.assertRaisesRegex(ValueError, 'size_scale'):
+            point(data, 'x', 'y', size='label', size_scale='continuous')
+
+    def test_color_scale(self):
+        ax = point(self.test_df, 'x', 'y', color='z', color_pal=['black', 'white'], color_scale='continuous')
+        points = ax.collections[0]
+        np.testing.assert_allclose(points.to_rgba(self.test_df['z'].min())[:3], (0, 0, 0))
+        np.testing.assert_allclose(points.to_rgba(self.test_df['z'].max())[:3], (1, 1, 1))
+        ax = point(self.test_df.round({'z': 0}), 'x', 'y', color='z', color_scale='categorical')
+        self.assertEqual(ax.child_axes, [])
+        self.assertIsNotNone(ax.get_legend())
+        with self.assertRaisesRegex(ValueError, 'color_scale'):
+            point(self.test_df, 'x', 'y', color='label', color_scale='continuous')
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+from sciviz.src.report import pdf_report, sprite_report
+
+def colored_plot(color):
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.set_facecolor(color)
+    return ax
+
+def read_image(path):
+    with Image.open(path) as image:
+        return np.asarray(image)
+
+class TestReports(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.colors = [(i * 20, 255 - i * 20, 128) for i in range(7)]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        plt.close('all')
+
+    def test_pdf_pages(self):
+        path = os.path.join(self.tmp.name, 'report.pdf')
+        self.assertEqual(pdf_report((colored_plot('red') for _ in range(5)), path), 5)
+        with open(path, 'rb') as pdf:
+            self.assertIn(b'/Count 5', pdf.read())
+        self.assertEqual(plt.get_fignums(), [])  # every figure is closed once written
+
+    def test_sprite_sheets(self):
+        path = os.path.join(self.tmp.name, 'sheet_{}.png')
+        plots = (colored_plot(np.array(color) / 255) for color in self.colors)
+        paths = sprite_report(plots, path, ncols=2, nrows=2, tile_size=(100, 100))
+        self.assertEqual(paths, [path.format(i) for i in range(2)])
+        sheets = [read_image(sheet) for sheet in paths]
+        self.assertEqual(sheets[0].shape, (200, 200, 4))
+        self.assertEqual(sheets[1].shape, (200, 200, 4))
+        for i, color in enumerate(self.colors):  # the i-th plot sits at row (i % 4) // 2 and column i % 2 of sheet i // 4
+            row, col = divmod(i % 4, 2)
+            np.testing.assert_array_equal(sheets[i // 4][row * 100 + 50, col * 100 + 50, :3], color)
+
+    def test_partial_sheet(self):
+        path = os.path.join(self.tmp.name, 'sheet_{}.png')
+        paths = sprite_report((colored_plot('red') for _ in range(5)), path, ncols=2, nrows=3, tile_size=(100, 100))
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(read_image(paths[0]).shape[:2], (300, 200))
+        paths = sprite_report((colored_plot('red') for _ in range(7)), path, ncols=2, nrows=3, tile_size=(100, 100))
+        self.assertEqual(read_image(paths[1]).shape[:2], (100, 200))  # only the rows used by the last sheet
+
+    def test_path_placeholder(self):
+        with self.assertRaises(ValueError):
+            sprite_report([colored_plot('red')], os.path.join(self.tmp.name, 'sheet.png'))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,40 @@
+import unittest
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+from sciviz.src.sciplot import SciPlot
+
+class TestSciPlot(unittest.TestCase):
+
+    def make_data(self, seed, colors=('A', 'B')):
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame({'x': rng.integers(0, 5, size=200),
+                             'y': rng.normal(size=200),
+                             'color': rng.choice(colors, size=200)})
+
+    def test_line_update_in_place(self):
+        plot = SciPlot('line', self.make_data(0), x='x', y='y', color='color')
+        lines = list(plot.ax.lines)
+        new_data = self.make_data(1)
+        plot.update(new_data)
+        self.assertEqual(list(plot.ax.lines), lines)
+        expected = new_data[new_data['color'] == 'B'].groupby('x')['y'].mean()
+        np.testing.assert_allclose(plot.artists['B'].get_ydata(), expected)
+
+    def test_bar_update_in_place(self):
+        plot = SciPlot('bar', self.make_data(0), x='color', y='y')
+        patches = list(plot.ax.patches)
+        new_data = self.make_data(1)
+        plot.update(new_data)
+        self.assertEqual(list(plot.ax.patches), patches)
+        self.assertAlmostEqual(plot.artists['A'].get_height(), new_data.loc[new_data['color'] == 'A', 'y'].mean())
+
+    def test_redraw_new_categories(self):
+        plot = SciPlot('line', self.make_data(0), x='x', y='y', color='color')
+        plot.update(self.make_data(1, colors=('A', 'B', 'C')))
+        self.assertEqual(set(plot.artists), {'A', 'B', 'C'})
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,45 @@
+import pickle
+import unittest
+import numpy as np
+import pandas as pd
+from sciviz.src.render import render_bytes
+from sciviz.src.shared import SharedData, plot_columns, share_data
+
+class TestSharedData(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = pd.DataFrame({
+            'species': rng.choice(['setosa', 'virginica'], 100),
+            'width': rng.random(100),
+            'length': rng.integers(0, 10, 100),
+            'flag': rng.random(100) > 0.5
+        })
+        self.shared = share_data(self.data)
+
+    def tearDown(self):
+        self.shared.unlink()
+
+    def test_round_trip(self):
+        self.assertIsInstance(self.shared, SharedData)
+        handle = pickle.loads(pickle.dumps(self.shared))
+        self.assertIsInstance(handle, SharedData)
+        self.assertIsNone(handle.block)
+        frame = handle.frame()
+        pd.testing.assert_frame_equal(frame.astype({'species': str}), self.data, check_dtype=False)
+        self.assertEqual(frame['length'].dtype, self.data['length'].dtype)
+        handle.close()
+
+    def test_columns(self):
+        frame = self.shared.frame(['width'])
+        self.assertEqual(list(frame.columns), ['width'])
+        self.assertTrue(np.shares_memory(frame['width'].to_numpy(), np.asarray(self.shared.block.buf)))
+        self.assertEqual(plot_columns(self.shared, {'x': 'species', 'y': 'width', 'title': 'Iris'}), ['species', 'width'])
+
+    def test_render(self):
+        image = render_bytes('boxplot', data=pickle.loads(pickle.dumps(self.shared)), x='species', y='width')
+        self.assertTrue(image.startswith(b'\x89PNG'))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
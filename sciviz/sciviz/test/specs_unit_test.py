@@ -0,0 +1,72 @@
+import importlib.util
+import os
+import pickle
+import tempfile
+import unittest
+from dataclasses import FrozenInstanceError
+import numpy as np
+import pandas as pd
+from sciviz.src.bar import error_parameters
+from sciviz.src.legends import LegendParameters, legend_parameters
+from sciviz.src.render import render
+from sciviz.src.specs import dumps_spec, loads_spec, plot_spec
+
+class TestParameterSpecs(unittest.TestCase):
+
+    def test_dict_access(self):
+        legend = legend_parameters(posx=1.2)
+        self.assertEqual(legend['posx'], 1.2)
+        self.assertEqual(dict(legend)['orient'], 'v')
+        self.assertIsNone(legend.get('missing'))
+        with self.assertRaises(KeyError):
+            legend['missing']
+
+    def test_hashable(self):
+        self.assertEqual(hash(error_parameters()), hash(error_parameters()))
+        self.assertEqual(len({legend_parameters(title=['A']), legend_parameters(title=['A'])}), 1)
+        self.assertNotEqual(legend_parameters(), legend_parameters(posx=2))
+
+    def test_frozen_and_picklable(self):
+        legend = legend_parameters()
+        with self.assertRaises(FrozenInstanceError):
+            legend.posx = 2
+        self.assertEqual(pickle.loads(pickle.dumps(legend)), legend)
+        self.assertEqual(legend.replace(posx=2), LegendParameters(posx=2))
+
+
+class TestPlotSpecs(unittest.TestCase):
+
+    def setUp(self):
+        self.data = pd.DataFrame({'species': np.repeat(['a', 'b', 'c'], 10), 'width': np.arange(30.0)})
+
+    def test_round_trip(self):
+        spec = plot_spec('bar', 'iris.parquet', x='species', y='width', errorbar=error_parameters(errorbar=('ci', 90)), legend=legend_parameters(title=['Species']))
+        args = loads_spec(dumps_spec(spec))['args']
+        self.assertEqual(args['legend']['__parameters__'], 'LegendParameters')
+        self.assertEqual(loads_spec(dumps_spec(spec)), spec)
+
+    def test_render(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'iris.csv')
+            self.data.to_csv(path, index=False)
+            spec = dumps_spec(plot_spec('bar', path, x='species', y='width', legend=legend_parameters()))
+            self.assertTrue(render(spec).startswith(b'\x89PNG'))
+        self.assertTrue(render(plot_spec('point', 'iris', x='species', y='width'), {'iris': self.data}, format='svg').startswith(b'<?xml'))
+
+    @unittest.skipUnless(importlib.util.find_spec('msgpack'), 'msgpack is not installed')
+    def test_render_msgpack(self):
+        spec = plot_spec('point', 'iris', x='species', y='width')
+        payload = dumps_spec(spec, format='msgpack')
+        self.assertTrue(render(payload, {'iris': self.data}).startswith(b'\x89PNG'))
+        self.assertTrue(render(payload, {'iris': self.data}, spec_format='msgpack').startswith(b'\x89PNG'))
+        self.assertTrue(render(dumps_spec(spec).encode(), {'iris': self.data}).startswith(b'\x89PNG'))  # JSON bytes
+
+    def test_data_not_embedded(self):
+        with self.assertRaises(ValueError):
+            plot_spec('bar', self.data, x='species', y='width')
+        with self.assertRaises(ValueError):
+            plot_spec('bar', x=self.data['species'], y=self.data['width'])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
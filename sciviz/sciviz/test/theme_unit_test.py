@@ -0,0 +1,44 @@
+import unittest
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgba
+from sciviz.src.theme import theme, theme_style
+
+class TestTheme(unittest.TestCase):
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_cached_style(self):
+        self.assertIs(theme_style('darkgrid'), theme_style('darkgrid'))
+        with self.assertRaises(TypeError):
+            theme_style('darkgrid')['axes.facecolor'] = 'white'  # read-only
+        with self.assertRaises(ValueError):
+            theme_style('neon')
+
+    def test_style_per_axes(self):
+        fig, (ax_dark, ax_ticks) = plt.subplots(1, 2)
+        theme(ax_dark, theme='darkgrid')
+        theme(ax_ticks, theme='ticks')
+        self.assertEqual(ax_dark.get_facecolor(), to_rgba(theme_style('darkgrid')['axes.facecolor']))
+        self.assertTrue(ax_dark.xaxis.get_gridlines()[0].get_visible())
+        self.assertEqual(ax_ticks.get_facecolor(), to_rgba('white'))
+        self.assertFalse(ax_ticks.xaxis.get_gridlines()[0].get_visible())
+        theme(ax_ticks, theme='classic')
+        self.assertFalse(ax_ticks.spines['top'].get_visible())
+
+    def test_axes_collection(self):
+        fig, axes = plt.subplots(2, 2)
+        self.assertIs(theme(axes, theme='whitegrid', title='panel'), axes)
+        for ax in axes.ravel():
+            self.assertTrue(ax.yaxis.get_gridlines()[0].get_visible())
+            self.assertEqual(ax.get_title(), 'panel')
+
+    def test_global_style_untouched(self):
+        before = dict(mpl.rcParams)
+        fig, ax = plt.subplots()
+        theme(ax, theme='dark')
+        self.assertEqual(dict(mpl.rcParams), before)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
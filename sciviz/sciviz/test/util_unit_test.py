@@ -1,7 +1,9 @@
 import unittest
+import numpy as np
 import pandas as pd
 import seaborn as sns
-from sciviz.src.palettes import color_seq_palette, shape_palette, size_palette, set_palettes, set_order
+from sciviz.src.palettes import color_norm, color_seq_palette, is_continuous, shape_palette, size_interp, size_palette, size_quantiles, set_palettes, set_order
+from sciviz.src.legends import legend_order, legend_pages, legend_top, palette_handles
 
 class TestPaletteUtils(unittest.TestCase):
 
@@ -31,6 +33,11 @@ class TestPaletteUtils(unittest.TestCase):
         pal_user_specified = color_seq_palette(test_df['color'], users_palette = ['#9E0142'])
         self.assertEqual(pal_user_specified, palette)
 
+    def test_ordered_color(self):
+        test_df = pd.DataFrame({'color': ['A', 'A']})
+        pal_ordered = color_seq_palette(test_df['color'], order=['B', 'A'])
+        self.assertEqual(pal_ordered, color_seq_palette(pd.Series(['B', 'A'])))
+
     def test_default_shape(self):
         palette = ['o', 's']
         test_df = pd.DataFrame({'shape': ['A', 'B', 'A', 'A', 'B']})
@@ -99,6 +106,65 @@ class TestPaletteUtils(unittest.TestCase):
         expected_output = [['B', 'A'], ['B', 'A'], ['E', 'F']]
         self.assertEqual(fun_output, expected_output)
 
+    def test_set_palettes_arrays(self):
+        color = np.array(['A', 'B', 'A', 'A', 'B'])
+        shape = np.array(['C', 'D', 'C', 'C', 'C'])
+        color_pal, shape_pal, size_pal, size_num = set_palettes(None, color, shape, size=None, 
+                                                                color_pal=None, shape_pal=None, size_pal=None)
+        fun_output = [color_pal, shape_pal, size_pal, size_num]
+        expected_output = [color_seq_palette(pd.Series(color)), shape_palette(pd.Series(shape)), None, False]
+        self.assertEqual(fun_output, expected_output)
+
+    def test_legend_order_arrays(self):
+        color = np.array(['A', 'B', 'A', 'A', 'B'])
+        legends = legend_order(None, color, ['red', 'blue'], color, ['o', 's'], None, None)
+        self.assertEqual([(legend_type, val.name) for legend_type, val, _ in legends], [('color_shape', 'color')])
+
+    def test_is_continuous(self):
+        values = pd.Series(np.linspace(0, 1, 100))
+        self.assertTrue(is_continuous(values))
+        self.assertFalse(is_continuous(pd.Series([1.0, 2.0, 1.0])))
+        self.assertFalse(is_continuous(pd.Series([str(v) for v in values])))
+        self.assertTrue(is_continuous(pd.Series([1, 2, 1]), scale='continuous'))
+        with self.assertRaises(ValueError):
+            is_continuous(values, scale='log')
+
+    def test_color_norm(self):
+        norm = color_norm(pd.Series([np.nan, 2.0, 4.0, np.inf]))
+        self.assertEqual((norm.vmin, norm.vmax), (2.0, 4.0))
+
+    def test_size_interp(self):
+        sizes = size_interp(pd.Series([0.0, 5.0, 10.0, np.nan]), 50, 150)
+        np.testing.assert_array_equal(sizes, [50, 100, 150, np.nan])
+
+    def test_size_quantiles(self):
+        size_pal = size_quantiles(pd.Series(np.arange(101.0)), 50, 150, n=3)
+        self.assertEqual(size_pal, {'0': 50, '50': 100, '100': 150})
+        size_pal = size_quantiles(pd.Series(np.arange(1000000.0, 1000100.0)), 50, 150)
+        self.assertEqual(list(size_pal), ['1e+06', '1.00003e+06', '1.00007e+06', '1.0001e+06'])
+
+    def test_legend_top(self):
+        val = pd.Series(['A'] * 5 + ['B'] * 3 + ['C'] * 2 + ['D'])
+        pal, order, n_other = legend_top('color', val, ['red', 'green', 'blue', 'black'], None, 3)
+        self.assertEqual((pal, order, n_other), (['red', 'green'], ['A', 'B'], 2))
+        pal, order, n_other = legend_top('color_size', val, [['red', 'green', 'blue', 'black'], {'D': 1, 'C': 2, 'B': 3, 'A': 4}], ['D', 'C', 'B', 'A'], 3)
+        self.assertEqual((pal, order, n_other), ([['blue', 'black'], {'B': 3, 'A': 4}], ['B', 'A'], 2))
+        self.assertEqual(legend_top('color', val, ['red'] * 4, None, None)[2], 0)
+
+    def test_legend_pages(self):
+        val = np.array([f'L{i}' for i in range(25)])
+        pages = legend_pages(None, val, per_page=10)
+        self.assertEqual(len(pages), 3)
+        self.assertTrue(all(page.startswith(b'\x89PNG') for page in pages))
+        self.assertIs(legend_pages(None, val, per_page=10)[0], pages[0])
+
+    def test_palette_handles(self):
+        handles = palette_handles(color_pal=['red', 'blue'], size_pal={'a': 120, 'b': 240})
+        self.assertEqual([handle.get_markersize() for handle in handles], [10, 20])
+        self.assertEqual(handles[1].get_markerfacecolor(), (0.0, 0.0, 1.0, 1.0))
+        self.assertIs(palette_handles(color_pal=['red', 'blue'], size_pal={'a': 120, 'b': 240}), handles)
+        self.assertIsNot(palette_handles(color_pal=['red', 'blue']), handles)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file